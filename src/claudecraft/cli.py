@@ -7,8 +7,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from claudecraft import jsonio
 from claudecraft.core.config import Config
 from claudecraft.core.database import (
+    ActiveRalphLoop,
     CompletionCriteria,
     Spec,
     SpecStatus,
@@ -20,8 +22,27 @@ from claudecraft.core.database import (
 from claudecraft.core.project import Project
 
 
-def main() -> int:
-    """Main entry point for ClaudeCraft CLI."""
+def _dumps(data: Any) -> str:
+    """Serialize data as indented JSON for --json output.
+
+    Non-ASCII characters are escaped so the output prints on any console encoding.
+    """
+    return jsonio.dumps(data, indent=True, ascii_only=True).decode()
+
+
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Get the CLI argument parser, building it on first use."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser with all subcommands."""
     parser = argparse.ArgumentParser(
         prog="claudecraft",
         description="TUI-based spec-driven development orchestrator",
@@ -43,7 +64,6 @@ def main() -> int:
     init_parser.add_argument(
         "--path",
         type=Path,
-        default=Path.cwd(),
         help="Project directory (default: current directory)",
     )
     init_parser.add_argument(
@@ -108,7 +128,6 @@ def main() -> int:
     tui_parser.add_argument(
         "--path",
         type=Path,
-        default=Path.cwd(),
         help="Project directory (default: current directory)",
     )
 
@@ -429,10 +448,19 @@ def main() -> int:
         help="Model to use for generation (default: from config)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for ClaudeCraft CLI.
+
+    Args:
+        argv: Arguments to parse, excluding the program name. Defaults to sys.argv[1:].
+    """
+    args = _get_parser().parse_args(argv)
 
     if args.command == "init":
-        return cmd_init(args.path, args.update, args.json)
+        return cmd_init(args.path or Path.cwd(), args.update, args.json)
     elif args.command == "status":
         return cmd_status(args.json)
     elif args.command == "list-specs":
@@ -444,7 +472,7 @@ def main() -> int:
     elif args.command == "execute":
         return cmd_execute(args.spec, args.task, args.max_parallel, args.json)
     elif args.command == "tui":
-        return cmd_tui(args.path)
+        return cmd_tui(args.path or Path.cwd())
     elif args.command == "agent-start":
         return cmd_agent_start(args.task_id, args.type, args.worktree, args.json)
     elif args.command == "agent-stop":
@@ -566,7 +594,7 @@ def cmd_init(path: Path, update: bool = False, json_output: bool = False) -> int
                 "constitution_path": str(constitution_path),
                 "templates_updated": update,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if update:
                 print(f"Updated ClaudeCraft templates at {project.root}")
@@ -593,7 +621,7 @@ def cmd_init(path: Path, update: bool = False, json_output: bool = False) -> int
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error initializing project: {e}", file=sys.stderr)
         return 1
@@ -627,7 +655,7 @@ def cmd_status(json_output: bool = False) -> int:
                     result["stats"]["tasks_by_status"].get(status, 0) + 1
                 )
 
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Project: {config.project_name}")
             print(f"Config: {config.config_path}")
@@ -647,14 +675,14 @@ def cmd_status(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -676,7 +704,7 @@ def cmd_list_specs(status_filter: str | None = None, json_output: bool = False)
                 "count": len(specs),
                 "specs": [s.to_dict() for s in specs],
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if not specs:
                 print("No specs found")
@@ -693,14 +721,14 @@ def cmd_list_specs(status_filter: str | None = None, json_output: bool = False)
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -721,7 +749,7 @@ def cmd_list_tasks(
             except ValueError:
                 if json_output:
                     result = {"success": False, "error": f"Invalid status: {status_filter}"}
-                    print(json.dumps(result, indent=2))
+                    print(_dumps(result))
                 else:
                     print(f"Error: Invalid status '{status_filter}'", file=sys.stderr)
                 return 1
@@ -734,7 +762,7 @@ def cmd_list_tasks(
                 "count": len(tasks),
                 "tasks": [t.to_dict() for t in tasks],
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if not tasks:
                 print("No tasks found")
@@ -753,14 +781,14 @@ def cmd_list_tasks(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -784,21 +812,21 @@ def cmd_task_update(task_id: str, status: str, json_output: bool = False) -> int
                 "status": status,
                 "task": task.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Task {task_id} updated to {status}")
         return 0
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -916,7 +944,7 @@ def cmd_execute(
             if not task:
                 if json_output:
                     result = {"success": False, "error": f"Task not found: {task_id}"}
-                    print(json.dumps(result, indent=2))
+                    print(_dumps(result))
                 else:
                     print(f"Error: Task not found: {task_id}", file=sys.stderr)
                 return 1
@@ -929,7 +957,7 @@ def cmd_execute(
         if not initial_tasks:
             if json_output:
                 result = {"success": True, "message": "No tasks ready to execute", "executed": []}
-                print(json.dumps(result, indent=2))
+                print(_dumps(result))
             else:
                 print("No tasks ready to execute")
             return 0
@@ -997,7 +1025,7 @@ def cmd_execute(
                 "failed": sum(1 for r in results if not r["success"]),
                 "parallel_slots": max_parallel,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             successful = sum(1 for r in results if r["success"])
             print(f"\nCompleted: {successful}/{len(results)} tasks successful")
@@ -1007,14 +1035,14 @@ def cmd_execute(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1060,21 +1088,21 @@ def cmd_agent_start(
                 "task_id": task_id,
                 "agent_type": agent_type,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Agent registered: slot {slot}, task {task_id}, type {agent_type}")
         return 0
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1092,7 +1120,7 @@ def cmd_agent_stop(
         if not task_id and not slot:
             if json_output:
                 result = {"success": False, "error": "Must specify --task or --slot"}
-                print(json.dumps(result, indent=2))
+                print(_dumps(result))
             else:
                 print("Error: Must specify --task or --slot", file=sys.stderr)
             return 1
@@ -1101,7 +1129,7 @@ def cmd_agent_stop(
 
         if json_output:
             result = {"success": success, "task_id": task_id, "slot": slot}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if success:
                 print(f"Agent deregistered: task={task_id}, slot={slot}")
@@ -1111,14 +1139,14 @@ def cmd_agent_stop(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1141,7 +1169,7 @@ def cmd_list_agents(json_output: bool = False) -> int:
                 "cleaned_stale": cleaned,
                 "agents": [a.to_dict() for a in agents],
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if cleaned:
                 print(f"Cleaned {cleaned} stale agent(s)\n")
@@ -1168,14 +1196,14 @@ def cmd_list_agents(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1189,17 +1217,7 @@ def cmd_ralph_status(
     """Show active Ralph verification loops."""
     try:
         project = Project.load()
-
-        # Get loops, optionally filtered
-        if task_id:
-            loop = project.db.get_ralph_loop(task_id)
-            loops = [loop] if loop else []
-        else:
-            loops = project.db.list_ralph_loops(status=status)
-
-        # Filter by status if task_id was specified and status filter given
-        if task_id and status:
-            loops = [l for l in loops if l.status == status]
+        loops = _find_ralph_loops(project, task_id, status)
 
         if json_output:
             result = {
@@ -1207,7 +1225,7 @@ def cmd_ralph_status(
                 "count": len(loops),
                 "loops": [l.to_dict() for l in loops],
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if not loops:
                 print("No active Ralph loops")
@@ -1242,19 +1260,35 @@ def cmd_ralph_status(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
 
 
+def _find_ralph_loops(
+    project: Project, task_id: str | None = None, status: str | None = None
+) -> list[ActiveRalphLoop]:
+    """Find the Ralph loops shown by ralph-status, optionally filtered.
+
+    With a task ID only the task's latest loop is shown, and the status filter
+    applies to that loop.
+    """
+    if task_id:
+        loop = project.db.get_ralph_loop(task_id)
+        if loop is None or (status and loop.status != status):
+            return []
+        return [loop]
+    return project.db.list_ralph_loops(status=status)
+
+
 def cmd_ralph_cancel(
     task_id: str,
     agent_type: str | None = None,
@@ -1263,73 +1297,67 @@ def cmd_ralph_cancel(
     """Cancel an active Ralph verification loop."""
     try:
         project = Project.load()
-
-        # Check if loop exists
-        loop = project.db.get_ralph_loop(task_id, agent_type)
-        if not loop:
-            if json_output:
-                result = {
-                    "success": False,
-                    "error": f"No Ralph loop found for task {task_id}"
-                    + (f" agent {agent_type}" if agent_type else ""),
-                }
-                print(json.dumps(result, indent=2))
-            else:
-                msg = f"No Ralph loop found for task {task_id}"
-                if agent_type:
-                    msg += f" agent {agent_type}"
-                print(msg, file=sys.stderr)
-            return 1
-
-        if loop.status != "running":
-            if json_output:
-                result = {
-                    "success": False,
-                    "error": f"Loop is not running (status: {loop.status})",
-                }
-                print(json.dumps(result, indent=2))
-            else:
-                print(f"Loop is not running (status: {loop.status})", file=sys.stderr)
-            return 1
-
-        # Cancel the loop
-        cancelled = project.db.cancel_ralph_loop(task_id, agent_type)
+        exit_code, result = _cancel_ralph_loop(project, task_id, agent_type)
 
         if json_output:
-            result = {
-                "success": cancelled,
-                "task_id": task_id,
-                "agent_type": agent_type or "all",
-                "message": "Loop cancelled" if cancelled else "Failed to cancel",
-            }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
+        elif result["success"]:
+            msg = f"Cancelled Ralph loop for task {task_id}"
+            if agent_type:
+                msg += f" agent {agent_type}"
+            print(msg)
+        elif "error" in result:
+            print(result["error"], file=sys.stderr)
         else:
-            if cancelled:
-                msg = f"Cancelled Ralph loop for task {task_id}"
-                if agent_type:
-                    msg += f" agent {agent_type}"
-                print(msg)
-            else:
-                print("Failed to cancel loop", file=sys.stderr)
-                return 1
+            print("Failed to cancel loop", file=sys.stderr)
 
-        return 0
+        return exit_code
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
 
 
+def _cancel_ralph_loop(
+    project: Project, task_id: str, agent_type: str | None = None
+) -> tuple[int, dict[str, Any]]:
+    """Cancel a running Ralph loop.
+
+    Returns:
+        Tuple of (exit code, result payload as printed by ralph-cancel --json)
+    """
+    # Check if loop exists
+    loop = project.db.get_ralph_loop(task_id, agent_type)
+    if not loop:
+        error = f"No Ralph loop found for task {task_id}"
+        if agent_type:
+            error += f" agent {agent_type}"
+        return 1, {"success": False, "error": error}
+
+    if loop.status != "running":
+        return 1, {"success": False, "error": f"Loop is not running (status: {loop.status})"}
+
+    # Cancel the loop
+    cancelled = project.db.cancel_ralph_loop(task_id, agent_type)
+    result = {
+        "success": cancelled,
+        "task_id": task_id,
+        "agent_type": agent_type or "all",
+        "message": "Loop cancelled" if cancelled else "Failed to cancel",
+    }
+    return (0 if cancelled else 1), result
+
+
 def cmd_spec_create(
     spec_id: str,
     title: str | None = None,
@@ -1346,7 +1374,7 @@ def cmd_spec_create(
         if existing:
             if json_output:
                 result = {"success": False, "error": f"Spec already exists: {spec_id}"}
-                print(json.dumps(result, indent=2))
+                print(_dumps(result))
             else:
                 print(f"Error: Spec already exists: {spec_id}", file=sys.stderr)
             return 1
@@ -1373,7 +1401,7 @@ def cmd_spec_create(
                 "spec_dir": str(spec_dir),
                 "spec": spec.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Created spec: {spec_id}")
             print(f"  Directory: {spec_dir}")
@@ -1381,14 +1409,14 @@ def cmd_spec_create(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1408,7 +1436,7 @@ def cmd_spec_update(
         if not spec:
             if json_output:
                 result = {"success": False, "error": f"Spec not found: {spec_id}"}
-                print(json.dumps(result, indent=2))
+                print(_dumps(result))
             else:
                 print(f"Error: Spec not found: {spec_id}", file=sys.stderr)
             return 1
@@ -1428,7 +1456,7 @@ def cmd_spec_update(
                 "spec_id": spec_id,
                 "spec": spec.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Updated spec: {spec_id}")
             if status:
@@ -1439,14 +1467,14 @@ def cmd_spec_update(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1461,7 +1489,7 @@ def cmd_spec_get(spec_id: str, json_output: bool = False) -> int:
         if not spec:
             if json_output:
                 result = {"success": False, "error": f"Spec not found: {spec_id}"}
-                print(json.dumps(result, indent=2))
+                print(_dumps(result))
             else:
                 print(f"Error: Spec not found: {spec_id}", file=sys.stderr)
             return 1
@@ -1475,7 +1503,7 @@ def cmd_spec_get(spec_id: str, json_output: bool = False) -> int:
                 "spec_dir": str(spec_dir),
                 "spec": spec.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Spec: {spec.id}")
             print(f"  Title: {spec.title}")
@@ -1488,14 +1516,14 @@ def cmd_spec_get(spec_id: str, json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1504,7 +1532,7 @@ def cmd_spec_get(spec_id: str, json_output: bool = False) -> int:
 def _build_completion_spec(
     outcome: str | None,
     acceptance_criteria: list[str] | None,
-    completion_file: Path | None,
+    completion_file: Path | bytes | None,
     coder_promise: str | None = None,
     coder_verification: str | None = None,
     coder_command: str | None = None,
@@ -1522,7 +1550,8 @@ def _build_completion_spec(
     Args:
         outcome: Expected outcome text
         acceptance_criteria: List of acceptance criteria
-        completion_file: Path to YAML/JSON file with completion spec
+        completion_file: Path to YAML/JSON file with completion spec, or its
+            contents as bytes
         coder_promise: Promise text for coder
         coder_verification: Verification method for coder
         coder_command: External command for coder
@@ -1540,11 +1569,18 @@ def _build_completion_spec(
     """
     import yaml
 
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    # Already-read file contents; JSON is a subset of YAML, so one loader covers both
+    if isinstance(completion_file, bytes):
+        return _parse_completion_spec_from_dict(yaml.load(completion_file, Loader=loader))
+
     # Check if we should load from file
     if completion_file and completion_file.exists():
         with open(completion_file) as f:
             if completion_file.suffix in (".yaml", ".yml"):
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=loader)
             else:
                 data = json.load(f)
 
@@ -1786,7 +1822,7 @@ def cmd_task_create(
             }
             if validation_warnings:
                 result["validation_warnings"] = validation_warnings
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Created task: {task_id}")
             print(f"  Title: {title}")
@@ -1807,14 +1843,14 @@ def cmd_task_create(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1849,7 +1885,7 @@ def cmd_task_followup(
                     "error": f"Task already exists: {task_id}",
                     "existing_task": existing.to_dict(),
                 }
-                print(json.dumps(result, indent=2))
+                print(_dumps(result))
             else:
                 print(f"Task already exists: {task_id}", file=sys.stderr)
             return 1
@@ -1923,7 +1959,7 @@ def cmd_task_followup(
                 "task": task.to_dict(),
                 "has_completion_spec": completion_spec is not None,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Created follow-up task: {task_id}")
             print(f"  Category: {category}")
@@ -1938,14 +1974,14 @@ def cmd_task_followup(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1959,7 +1995,7 @@ def cmd_memory_stats(json_output: bool = False) -> int:
 
         if json_output:
             result = {"success": True, **stats}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Memory Store Statistics")
             print(f"  Total entities: {stats['total_entities']}")
@@ -1974,14 +2010,14 @@ def cmd_memory_stats(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2012,7 +2048,7 @@ def cmd_memory_list(
                 "count": len(entities),
                 "entities": [e.to_dict() for e in entities],
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if not entities:
                 print("No memory entries found")
@@ -2028,14 +2064,14 @@ def cmd_memory_list(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2063,7 +2099,7 @@ def cmd_memory_search(
                 "count": len(entities),
                 "entities": [e.to_dict() for e in entities],
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if not entities:
                 print(f"No matches for '{keyword}'")
@@ -2079,14 +2115,14 @@ def cmd_memory_search(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2117,7 +2153,7 @@ def cmd_memory_add(
                 "success": True,
                 "entity": entity.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Added memory entry: {entity.id}")
             print(f"  Type: {entity_type}")
@@ -2128,14 +2164,14 @@ def cmd_memory_add(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2153,7 +2189,7 @@ def cmd_memory_cleanup(days: int = 90, json_output: bool = False) -> int:
                 "removed": removed,
                 "days": days,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if removed > 0:
                 print(f"Removed {removed} memory entries older than {days} days")
@@ -2163,14 +2199,14 @@ def cmd_memory_cleanup(days: int = 90, json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2193,7 +2229,7 @@ def cmd_sync_export(json_output: bool = False) -> int:
                 "specs_exported": len(specs),
                 "tasks_exported": len(tasks),
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Exported to: {project.jsonl_path}")
             print(f"  Specs: {len(specs)}")
@@ -2202,14 +2238,14 @@ def cmd_sync_export(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2223,20 +2259,20 @@ def cmd_sync_import(json_output: bool = False) -> int:
         if not project.jsonl_path.exists():
             if json_output:
                 result = {"success": False, "error": "No JSONL file found"}
-                print(json.dumps(result, indent=2))
+                print(_dumps(result))
             else:
                 print(f"No JSONL file found at: {project.jsonl_path}", file=sys.stderr)
             return 1
 
         # Count before import
-        specs_before = len(project.db.list_specs())
-        tasks_before = len(project.db.list_tasks())
+        specs_before = project.db.count_specs()
+        tasks_before = project.db.count_tasks()
 
         project.sync.import_changes()
 
         # Count after import
-        specs_after = len(project.db.list_specs())
-        tasks_after = len(project.db.list_tasks())
+        specs_after = project.db.count_specs()
+        tasks_after = project.db.count_tasks()
 
         if json_output:
             result = {
@@ -2247,7 +2283,7 @@ def cmd_sync_import(json_output: bool = False) -> int:
                 "tasks_before": tasks_before,
                 "tasks_after": tasks_after,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Imported from: {project.jsonl_path}")
             print(f"  Specs: {specs_before} → {specs_after}")
@@ -2256,14 +2292,14 @@ def cmd_sync_import(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2277,7 +2313,7 @@ def cmd_sync_compact(json_output: bool = False) -> int:
         if not project.jsonl_path.exists():
             if json_output:
                 result = {"success": False, "error": "No JSONL file found"}
-                print(json.dumps(result, indent=2))
+                print(_dumps(result))
             else:
                 print(f"No JSONL file found at: {project.jsonl_path}", file=sys.stderr)
             return 1
@@ -2307,7 +2343,7 @@ def cmd_sync_compact(json_output: bool = False) -> int:
                 "bytes_before": size_before,
                 "bytes_after": size_after,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Compacted: {project.jsonl_path}")
             print(f"  Lines: {lines_before} → {lines_after}")
@@ -2316,14 +2352,14 @@ def cmd_sync_compact(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2351,8 +2387,8 @@ def cmd_sync_status(json_output: bool = False) -> int:
             }
 
         # Database stats
-        specs_count = len(project.db.list_specs())
-        tasks_count = len(project.db.list_tasks())
+        specs_count = project.db.count_specs()
+        tasks_count = project.db.count_tasks()
 
         if json_output:
             result = {
@@ -2366,7 +2402,7 @@ def cmd_sync_status(json_output: bool = False) -> int:
                     "tasks": tasks_count,
                 },
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("JSONL Sync Status")
             print(f"  Enabled: {'Yes' if sync_enabled else 'No'}")
@@ -2383,14 +2419,14 @@ def cmd_sync_status(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2414,7 +2450,7 @@ def cmd_worktree_create(
                 "worktree_path": str(worktree_path),
                 "branch": f"task/{task_id}",
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Created worktree: {worktree_path}")
             print(f"  Branch: task/{task_id}")
@@ -2422,14 +2458,14 @@ def cmd_worktree_create(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2448,21 +2484,21 @@ def cmd_worktree_remove(
 
         if json_output:
             result = {"success": True, "task_id": task_id}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Removed worktree: {task_id}")
         return 0
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2483,7 +2519,7 @@ def cmd_worktree_list(json_output: bool = False) -> int:
                 "count": len(worktrees),
                 "worktrees": worktrees,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             if not worktrees:
                 print("No worktrees found")
@@ -2498,14 +2534,14 @@ def cmd_worktree_list(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2528,7 +2564,7 @@ def cmd_worktree_commit(
                 "task_id": task_id,
                 "commit": commit_hash,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Committed changes in {task_id}")
             print(f"  Commit: {commit_hash[:8]}")
@@ -2536,14 +2572,14 @@ def cmd_worktree_commit(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2579,7 +2615,7 @@ def cmd_merge_task(
                 "message": message,
                 "cleaned_up": cleanup and success,
             }
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(message)
             if success and cleanup:
@@ -2588,14 +2624,14 @@ def cmd_merge_task(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2719,7 +2755,7 @@ If there are issues, output: DOCUMENTATION FAILED: [reason]
                     "spec_id": spec_id,
                     "output": output[:2000] if len(output) > 2000 else output,
                 }
-                print(json.dumps(result_dict, indent=2))
+                print(_dumps(result_dict))
             else:
                 if success:
                     print(f"\nDocumentation generated successfully in {docs_path}")
@@ -2733,7 +2769,7 @@ If there are issues, output: DOCUMENTATION FAILED: [reason]
         except subprocess.TimeoutExpired:
             error_msg = f"Timeout: Documentation generation exceeded {project.config.timeout_minutes} minutes"
             if json_output:
-                print(json.dumps({"success": False, "error": error_msg}, indent=2))
+                print(_dumps({"success": False, "error": error_msg}))
             else:
                 print(error_msg, file=sys.stderr)
             return 1
@@ -2741,7 +2777,7 @@ If there are issues, output: DOCUMENTATION FAILED: [reason]
         except FileNotFoundError:
             error_msg = "Claude CLI not found. Please ensure Claude Code is installed."
             if json_output:
-                print(json.dumps({"success": False, "error": error_msg}, indent=2))
+                print(_dumps({"success": False, "error": error_msg}))
             else:
                 print(error_msg, file=sys.stderr)
             return 1
@@ -2749,14 +2785,14 @@ If there are issues, output: DOCUMENTATION FAILED: [reason]
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -6,10 +6,33 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generator
 
 
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp, reusing the result for repeated strings.
+
+    Records created together share timestamps, and datetime objects are
+    immutable, so the same parsed value can be handed out safely.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _dump_metadata(metadata: dict[str, Any]) -> str:
+    """Serialize a metadata column, skipping the encoder when it is empty."""
+    return json.dumps(metadata) if metadata else "{}"
+
+
+def _load_metadata(raw: str | None) -> dict[str, Any]:
+    """Deserialize a metadata column, skipping the parser when it is empty."""
+    if not raw or raw == "{}":
+        return {}
+    return json.loads(raw)
+
+
 class SpecStatus(str, Enum):
     """Status of a specification."""
 
@@ -24,6 +47,10 @@ class SpecStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+# Plain dict lookups for deserializing statuses, skipping EnumType.__call__
+_SPEC_STATUS_BY_VALUE = {status.value: status for status in SpecStatus}
+
+
 class TaskStatus(str, Enum):
     """Status of a task aligned with engineering workflow."""
 
@@ -34,6 +61,9 @@ class TaskStatus(str, Enum):
     DONE = "done"              # QA passed, ready for merge
 
 
+_TASK_STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+
+
 class VerificationMethod(str, Enum):
     """Methods for verifying task/stage completion in Ralph loops."""
 
@@ -57,7 +87,7 @@ _TASK_STATUS_MIGRATION = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class CompletionCriteria:
     """Completion criteria for a specific agent stage in Ralph loops.
 
@@ -93,7 +123,7 @@ class CompletionCriteria:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskCompletionSpec:
     """Complete specification of what 'done' means for a task.
 
@@ -142,7 +172,7 @@ class TaskCompletionSpec:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Spec:
     """A specification record."""
 
@@ -172,15 +202,15 @@ class Spec:
         return cls(
             id=data["id"],
             title=data["title"],
-            status=SpecStatus(data["status"]),
+            status=_SPEC_STATUS_BY_VALUE[data["status"]],
             source_type=data.get("source_type"),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
+            created_at=_parse_iso(data["created_at"]),
+            updated_at=_parse_iso(data["updated_at"]),
             metadata=data.get("metadata", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A task record."""
 
@@ -231,20 +261,20 @@ class Task:
             spec_id=data["spec_id"],
             title=data["title"],
             description=data["description"],
-            status=TaskStatus(data["status"]),
+            status=_TASK_STATUS_BY_VALUE[data["status"]],
             priority=data["priority"],
             dependencies=data.get("dependencies", []),
             assignee=data.get("assignee"),
             worktree=data.get("worktree"),
             iteration=data.get("iteration", 0),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
+            created_at=_parse_iso(data["created_at"]),
+            updated_at=_parse_iso(data["updated_at"]),
             metadata=data.get("metadata", {}),
             completion_spec=completion_spec,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionLog:
     """An execution log record."""
 
@@ -271,7 +301,7 @@ class ExecutionLog:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveAgent:
     """A currently running agent."""
 
@@ -296,7 +326,7 @@ class ActiveAgent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveRalphLoop:
     """An active Ralph verification loop.
 
@@ -504,22 +534,102 @@ INSERT OR REPLACE INTO schema_version (version, applied_at) VALUES (5, datetime(
 """
 
 
+MIGRATION_V6_SQL = """
+-- Ralph loop lookups by (task_id, agent_type) are served by the UNIQUE constraint's
+-- index, which also covers task_id-only lookups, so the single-column index is redundant
+DROP INDEX IF EXISTS idx_active_ralph_loops_task;
+
+-- Status-filtered listings are ordered by updated_at; index both to skip the sort
+DROP INDEX IF EXISTS idx_active_ralph_loops_status;
+CREATE INDEX IF NOT EXISTS idx_active_ralph_loops_status_updated
+    ON active_ralph_loops(status, updated_at);
+
+-- Update schema version
+INSERT OR REPLACE INTO schema_version (version, applied_at) VALUES (6, datetime('now'));
+"""
+
+
+MIGRATION_V7_SQL = """
+-- Ready/listing queries filter tasks by spec and status and order by priority, then
+-- creation time; a composite index serves the filter and the ordering without a sort
+CREATE INDEX IF NOT EXISTS idx_tasks_spec_status_priority
+    ON tasks(spec_id, status, priority DESC, created_at);
+
+-- Update schema version
+INSERT OR REPLACE INTO schema_version (version, applied_at) VALUES (7, datetime('now'));
+"""
+
+
+# Insert statements shared by the single-row and bulk write paths, so both hit
+# the same entry in the connection's prepared statement cache
+INSERT_SPEC_SQL = """
+INSERT INTO specs (id, title, status, source_type, created_at, updated_at, metadata)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_TASK_SQL = """
+INSERT INTO tasks (id, spec_id, title, description, status, priority,
+    dependencies, assignee, worktree, iteration, created_at, updated_at, metadata)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_EXECUTION_LOG_SQL = """
+INSERT INTO execution_logs (task_id, agent_type, action, output, success,
+    duration_ms, created_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_AGENT_CRITERIA_SQL = """
+INSERT INTO task_agent_criteria
+    (task_id, agent_type, promise, description,
+     verification_method, verification_config, max_iterations)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_RALPH_LOOP_SQL = """
+INSERT OR REPLACE INTO active_ralph_loops
+    (task_id, agent_type, iteration, max_iterations,
+     started_at, updated_at, verification_results, status)
+VALUES (?, ?, 0, ?, ?, ?, '[]', 'running')
+"""
+
+
 class Database:
     """SQLite database for ClaudeCraft."""
 
+    # PRAGMA statements applied to every new connection. WAL lets readers run
+    # alongside a writer and, with synchronous=NORMAL, syncs at checkpoints
+    # rather than on every commit; a crash can lose the last commits but never
+    # corrupts the file. The test suite relaxes this further because its
+    # databases are throwaway.
+    connection_pragmas: tuple[str, ...] = ("journal_mode = WAL", "synchronous = NORMAL")
+
     def __init__(self, path: Path | str):
-        """Initialize database connection."""
+        """Initialize database connection.
+
+        Args:
+            path: Database file path, ":memory:", or a SQLite "file:" URI such as
+                "file:name?mode=memory&cache=shared" for an in-memory database
+                shared between connections
+        """
         self.path = Path(path)
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._target = str(path)
+        self._is_uri = self._target.startswith("file:")
+        if not self._is_uri and self._target != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
         self._conn: sqlite3.Connection | None = None
 
     @property
     def conn(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.path))
+            self._conn = sqlite3.connect(
+                self._target, uri=self._is_uri, cached_statements=256
+            )
             self._conn.row_factory = sqlite3.Row
             self._conn.execute("PRAGMA foreign_keys = ON")
+            for pragma in self.connection_pragmas:
+                self._conn.execute(f"PRAGMA {pragma}")
         return self._conn
 
     def init_schema(self) -> None:
@@ -561,6 +671,16 @@ class Database:
             self.conn.executescript(MIGRATION_V5_SQL)
             self.conn.commit()
 
+        # Migration v6: Rework Ralph loop indexes
+        if current_version < 6:
+            self.conn.executescript(MIGRATION_V6_SQL)
+            self.conn.commit()
+
+        # Migration v7: Composite index for ready-task and task listing queries
+        if current_version < 7:
+            self.conn.executescript(MIGRATION_V7_SQL)
+            self.conn.commit()
+
     def close(self) -> None:
         """Close database connection."""
         if self._conn is not None:
@@ -568,10 +688,27 @@ class Database:
             self._conn = None
 
     @contextmanager
-    def transaction(self) -> Generator[sqlite3.Cursor, None, None]:
-        """Context manager for database transactions."""
+    def transaction(self, immediate: bool = False) -> Generator[sqlite3.Cursor, None, None]:
+        """Context manager for database transactions.
+
+        When a transaction is already open on the connection (for example an
+        enclosing SAVEPOINT), the block runs in a nested savepoint instead and
+        committing is left to the outer transaction.
+
+        Args:
+            immediate: Take the write lock up front with BEGIN IMMEDIATE rather
+                than on the first write, so a multi-statement write cannot fail
+                partway through with "database is locked".
+        """
+        if self.conn.in_transaction:
+            with self._nested_transaction() as cursor:
+                yield cursor
+            return
+
         cursor = self.conn.cursor()
         try:
+            if immediate:
+                cursor.execute("BEGIN IMMEDIATE")
             yield cursor
             self.conn.commit()
         except Exception:
@@ -580,26 +717,46 @@ class Database:
         finally:
             cursor.close()
 
+    @contextmanager
+    def _nested_transaction(self) -> Generator[sqlite3.Cursor, None, None]:
+        """Run a block inside a savepoint of the currently open transaction."""
+        cursor = self.conn.cursor()
+        cursor.execute("SAVEPOINT nested_transaction")
+        try:
+            yield cursor
+            cursor.execute("RELEASE nested_transaction")
+        except Exception:
+            cursor.execute("ROLLBACK TO nested_transaction")
+            cursor.execute("RELEASE nested_transaction")
+            raise
+        finally:
+            cursor.close()
+
     # Spec operations
     def create_spec(self, spec: Spec) -> None:
         """Create a new specification."""
         with self.transaction() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO specs (id, title, status, source_type, created_at, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    spec.id,
-                    spec.title,
-                    spec.status.value,
-                    spec.source_type,
-                    spec.created_at.isoformat(),
-                    spec.updated_at.isoformat(),
-                    json.dumps(spec.metadata),
-                ),
+            cursor.execute(INSERT_SPEC_SQL, self._spec_insert_params(spec))
+
+    def create_specs_bulk(self, specs: list[Spec]) -> None:
+        """Create several specifications with one executemany in a single transaction."""
+        with self.transaction(immediate=True) as cursor:
+            cursor.executemany(
+                INSERT_SPEC_SQL, [self._spec_insert_params(spec) for spec in specs]
             )
 
+    def _spec_insert_params(self, spec: Spec) -> tuple[Any, ...]:
+        """Build the INSERT parameters for a spec row."""
+        return (
+            spec.id,
+            spec.title,
+            spec.status.value,
+            spec.source_type,
+            spec.created_at.isoformat(),
+            spec.updated_at.isoformat(),
+            _dump_metadata(spec.metadata),
+        )
+
     def get_spec(self, spec_id: str) -> Spec | None:
         """Get a specification by ID."""
         cursor = self.conn.execute("SELECT * FROM specs WHERE id = ?", (spec_id,))
@@ -619,6 +776,16 @@ class Database:
             )
         return [self._row_to_spec(row) for row in cursor.fetchall()]
 
+    def count_specs(self, status: SpecStatus | None = None) -> int:
+        """Count specifications, optionally filtered by status."""
+        if status is None:
+            cursor = self.conn.execute("SELECT COUNT(*) FROM specs")
+        else:
+            cursor = self.conn.execute(
+                "SELECT COUNT(*) FROM specs WHERE status = ?", (status.value,)
+            )
+        return cursor.fetchone()[0]
+
     def update_spec(self, spec: Spec) -> None:
         """Update an existing specification."""
         with self.transaction() as cursor:
@@ -633,7 +800,7 @@ class Database:
                     spec.status.value,
                     spec.source_type,
                     spec.updated_at.isoformat(),
-                    json.dumps(spec.metadata),
+                    _dump_metadata(spec.metadata),
                     spec.id,
                 ),
             )
@@ -648,11 +815,11 @@ class Database:
         return Spec(
             id=row["id"],
             title=row["title"],
-            status=SpecStatus(row["status"]),
+            status=_SPEC_STATUS_BY_VALUE[row["status"]],
             source_type=row["source_type"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            metadata=json.loads(row["metadata"]),
+            created_at=_parse_iso(row["created_at"]),
+            updated_at=_parse_iso(row["updated_at"]),
+            metadata=_load_metadata(row["metadata"]),
         )
 
     # Task operations
@@ -663,33 +830,60 @@ class Database:
         normalized completion spec tables.
         """
         with self.transaction() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO tasks (id, spec_id, title, description, status, priority,
-                    dependencies, assignee, worktree, iteration, created_at, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    task.id,
-                    task.spec_id,
-                    task.title,
-                    task.description,
-                    task.status.value,
-                    task.priority,
-                    json.dumps(task.dependencies),
-                    task.assignee,
-                    task.worktree,
-                    task.iteration,
-                    task.created_at.isoformat(),
-                    task.updated_at.isoformat(),
-                    json.dumps(task.metadata),
-                ),
-            )
+            cursor.execute(INSERT_TASK_SQL, self._task_insert_params(task))
 
         # Save completion spec if present (outside transaction to use helper method)
         if task.completion_spec:
             self.save_completion_spec(task.id, task.completion_spec)
 
+    def create_tasks_bulk(self, tasks: list[Task]) -> None:
+        """Create several tasks in a single transaction.
+
+        Tasks, their completion specs and per-agent criteria are each
+        inserted with one executemany call.
+        """
+        specs = [(task.id, task.completion_spec) for task in tasks if task.completion_spec]
+        with self.transaction(immediate=True) as cursor:
+            cursor.executemany(
+                INSERT_TASK_SQL, [self._task_insert_params(task) for task in tasks]
+            )
+            cursor.executemany(
+                """
+                INSERT INTO task_completion_specs (task_id, outcome, acceptance_criteria)
+                VALUES (?, ?, ?)
+                """,
+                [
+                    (task_id, spec.outcome, json.dumps(spec.acceptance_criteria))
+                    for task_id, spec in specs
+                ],
+            )
+            cursor.executemany(
+                INSERT_AGENT_CRITERIA_SQL,
+                [
+                    params
+                    for task_id, spec in specs
+                    for params in self._agent_criteria_params(task_id, spec)
+                ],
+            )
+
+    def _task_insert_params(self, task: Task) -> tuple[Any, ...]:
+        """Build the INSERT parameters for a task row."""
+        return (
+            task.id,
+            task.spec_id,
+            task.title,
+            task.description,
+            task.status.value,
+            task.priority,
+            json.dumps(task.dependencies),
+            task.assignee,
+            task.worktree,
+            task.iteration,
+            task.created_at.isoformat(),
+            task.updated_at.isoformat(),
+            _dump_metadata(task.metadata),
+        )
+
     def get_task(self, task_id: str, load_completion_spec: bool = True) -> Task | None:
         """Get a task by ID.
 
@@ -730,22 +924,55 @@ class Database:
         cursor = self.conn.execute(query, params)
         return [self._row_to_task(row) for row in cursor.fetchall()]
 
+    def count_tasks(
+        self, spec_id: str | None = None, status: TaskStatus | None = None
+    ) -> int:
+        """Count tasks, optionally filtered by spec_id and/or status."""
+        query = "SELECT COUNT(*) FROM tasks WHERE 1=1"
+        params: list[Any] = []
+
+        if spec_id is not None:
+            query += " AND spec_id = ?"
+            params.append(spec_id)
+
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status.value)
+
+        return self.conn.execute(query, params).fetchone()[0]
+
     def get_ready_tasks(self, spec_id: str | None = None) -> list[Task]:
         """Get tasks that are ready to be executed (dependencies met).
 
-        Returns TODO tasks whose dependencies are all in DONE status.
+        Returns TODO tasks whose dependencies are all in DONE status. When
+        spec_id is given, dependencies must be DONE tasks of that spec.
         """
-        tasks = self.list_tasks(spec_id=spec_id, status=TaskStatus.TODO)
-        done_ids = {
-            t.id for t in self.list_tasks(spec_id=spec_id, status=TaskStatus.DONE)
-        }
+        # Anti-join against the JSON dependency list: a task is ready unless
+        # one of its dependencies has no matching DONE task
+        dep_filter = ""
+        params: list[Any] = [TaskStatus.TODO.value, TaskStatus.DONE.value]
+        if spec_id is not None:
+            dep_filter = " AND dep.spec_id = ?"
+            params.append(spec_id)
 
-        ready = []
-        for task in tasks:
-            if all(dep in done_ids for dep in task.dependencies):
-                ready.append(task)
+        query = f"""
+            SELECT * FROM tasks AS t
+            WHERE t.status = ?
+              AND NOT EXISTS (
+                SELECT 1 FROM json_each(t.dependencies) AS d
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM tasks AS dep
+                    WHERE dep.id = d.value AND dep.status = ?{dep_filter}
+                )
+              )
+        """
+        if spec_id is not None:
+            query += " AND t.spec_id = ?"
+            params.append(spec_id)
+        query += " ORDER BY priority DESC, created_at ASC"
 
-        return ready
+        cursor = self.conn.execute(query, params)
+        return [self._row_to_task(row) for row in cursor.fetchall()]
 
     def update_task_status(self, task_id: str, status: TaskStatus) -> Task:
         """Update a task's status and return the updated task.
@@ -829,7 +1056,7 @@ class Database:
                     task.worktree,
                     task.iteration,
                     task.updated_at.isoformat(),
-                    json.dumps(task.metadata),
+                    _dump_metadata(task.metadata),
                     task.id,
                 ),
             )
@@ -852,15 +1079,15 @@ class Database:
             spec_id=row["spec_id"],
             title=row["title"],
             description=row["description"],
-            status=TaskStatus(row["status"]),
+            status=_TASK_STATUS_BY_VALUE[row["status"]],
             priority=row["priority"],
             dependencies=json.loads(row["dependencies"]),
             assignee=row["assignee"],
             worktree=row["worktree"],
             iteration=row["iteration"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            metadata=json.loads(row["metadata"]),
+            created_at=_parse_iso(row["created_at"]),
+            updated_at=_parse_iso(row["updated_at"]),
+            metadata=_load_metadata(row["metadata"]),
         )
 
     # Execution log operations
@@ -876,11 +1103,7 @@ class Database:
         """Log a task execution."""
         with self.transaction() as cursor:
             cursor.execute(
-                """
-                INSERT INTO execution_logs (task_id, agent_type, action, output, success,
-                    duration_ms, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+                INSERT_EXECUTION_LOG_SQL,
                 (
                     task_id,
                     agent_type,
@@ -893,6 +1116,26 @@ class Database:
             )
             return cursor.lastrowid or 0
 
+    def log_executions_bulk(self, entries: list[tuple[str, str, str, str, bool, int]]) -> int:
+        """Log several task executions in a single transaction.
+
+        Args:
+            entries: (task_id, agent_type, action, output, success, duration_ms) tuples
+
+        Returns:
+            Number of log entries written
+        """
+        now = datetime.now().isoformat()
+        with self.transaction(immediate=True) as cursor:
+            cursor.executemany(
+                INSERT_EXECUTION_LOG_SQL,
+                [
+                    (task_id, agent_type, action, output, 1 if success else 0, duration_ms, now)
+                    for task_id, agent_type, action, output, success, duration_ms in entries
+                ],
+            )
+            return cursor.rowcount
+
     def get_execution_logs(self, task_id: str) -> list[ExecutionLog]:
         """Get execution logs for a task."""
         cursor = self.conn.execute(
@@ -911,7 +1154,7 @@ class Database:
             output=row["output"],
             success=bool(row["success"]),
             duration_ms=row["duration_ms"],
-            created_at=datetime.fromisoformat(row["created_at"]),
+            created_at=_parse_iso(row["created_at"]),
         )
 
     # Active agent operations
@@ -1033,7 +1276,7 @@ class Database:
             slot=row["slot"],
             pid=row["pid"],
             worktree=row["worktree"],
-            started_at=datetime.fromisoformat(row["started_at"]),
+            started_at=_parse_iso(row["started_at"]),
         )
 
     # Completion spec operations (Ralph loop support)
@@ -1063,26 +1306,30 @@ class Database:
             )
 
             # Insert per-agent criteria
-            for agent_type in ["coder", "reviewer", "tester", "qa"]:
-                criteria = getattr(spec, agent_type)
-                if criteria:
-                    cursor.execute(
-                        """
-                        INSERT INTO task_agent_criteria
-                            (task_id, agent_type, promise, description,
-                             verification_method, verification_config, max_iterations)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            task_id,
-                            agent_type,
-                            criteria.promise,
-                            criteria.description,
-                            criteria.verification_method.value,
-                            json.dumps(criteria.verification_config),
-                            criteria.max_iterations,
-                        ),
+            cursor.executemany(
+                INSERT_AGENT_CRITERIA_SQL, self._agent_criteria_params(task_id, spec)
+            )
+
+    def _agent_criteria_params(
+        self, task_id: str, spec: TaskCompletionSpec
+    ) -> list[tuple[Any, ...]]:
+        """Build INSERT parameters for each agent that has completion criteria."""
+        params = []
+        for agent_type in ["coder", "reviewer", "tester", "qa"]:
+            criteria = getattr(spec, agent_type)
+            if criteria:
+                params.append(
+                    (
+                        task_id,
+                        agent_type,
+                        criteria.promise,
+                        criteria.description,
+                        criteria.verification_method.value,
+                        json.dumps(criteria.verification_config),
+                        criteria.max_iterations,
                     )
+                )
+        return params
 
     def get_completion_spec(self, task_id: str) -> TaskCompletionSpec | None:
         """Get completion spec for a task.
@@ -1220,16 +1467,30 @@ class Database:
         now = datetime.now().isoformat()
         with self.transaction() as cursor:
             cursor.execute(
-                """
-                INSERT OR REPLACE INTO active_ralph_loops
-                    (task_id, agent_type, iteration, max_iterations,
-                     started_at, updated_at, verification_results, status)
-                VALUES (?, ?, 0, ?, ?, ?, '[]', 'running')
-                """,
-                (task_id, agent_type, max_iterations, now, now),
+                INSERT_RALPH_LOOP_SQL, (task_id, agent_type, max_iterations, now, now)
             )
             return cursor.lastrowid or 0
 
+    def register_ralph_loops_bulk(self, loops: list[tuple[str, str, int]]) -> int:
+        """Register several Ralph loops in a single transaction.
+
+        Args:
+            loops: (task_id, agent_type, max_iterations) tuples
+
+        Returns:
+            Number of loops registered
+        """
+        now = datetime.now().isoformat()
+        with self.transaction(immediate=True) as cursor:
+            cursor.executemany(
+                INSERT_RALPH_LOOP_SQL,
+                [
+                    (task_id, agent_type, max_iterations, now, now)
+                    for task_id, agent_type, max_iterations in loops
+                ],
+            )
+            return cursor.rowcount
+
     def update_ralph_loop(
         self,
         task_id: str,
@@ -1402,8 +1663,8 @@ class Database:
             agent_type=row["agent_type"],
             iteration=row["iteration"],
             max_iterations=row["max_iterations"],
-            started_at=datetime.fromisoformat(row["started_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
+            started_at=_parse_iso(row["started_at"]),
+            updated_at=_parse_iso(row["updated_at"]),
             verification_results=json.loads(row["verification_results"] or "[]"),
             status=row["status"],
         )
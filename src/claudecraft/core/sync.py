@@ -1,12 +1,14 @@
 """JSONL synchronization for Git-friendly persistence (Beads pattern)."""
 
-import json
+import os
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from claudecraft import jsonio
 from claudecraft.core.database import Database, Spec, SpecStatus, Task, TaskStatus
 
 
@@ -30,20 +32,19 @@ class ChangeRecord:
 
     def to_jsonl(self) -> str:
         """Convert to JSONL line."""
-        return json.dumps(
-            {
-                "timestamp": self.timestamp.isoformat(),
-                "entity_type": self.entity_type,
-                "entity_id": self.entity_id,
-                "change_type": self.change_type.value,
-                "data": self.data,
-            }
-        )
+        record = {
+            "timestamp": self.timestamp.isoformat(),
+            "entity_type": self.entity_type,
+            "entity_id": self.entity_id,
+            "change_type": self.change_type.value,
+            "data": self.data,
+        }
+        return jsonio.dumps(record).decode()
 
     @classmethod
-    def from_jsonl(cls, line: str) -> "ChangeRecord":
+    def from_jsonl(cls, line: str | bytes) -> "ChangeRecord":
         """Parse from JSONL line."""
-        data = json.loads(line)
+        data = jsonio.loads(line)
         return cls(
             timestamp=datetime.fromisoformat(data["timestamp"]),
             entity_type=data["entity_type"],
@@ -53,6 +54,19 @@ class ChangeRecord:
         )
 
 
+def _encode_changes(
+    entity_type: str,
+    change_type: ChangeType,
+    changes: Iterable[tuple[str, dict[str, Any] | None]],
+) -> str:
+    """Encode (entity_id, data) pairs as JSONL lines sharing one timestamp."""
+    now = datetime.now()
+    return "".join(
+        ChangeRecord(now, entity_type, entity_id, change_type, data).to_jsonl() + "\n"
+        for entity_id, data in changes
+    )
+
+
 class JsonlSync:
     """Synchronization between SQLite and JSONL for Git-friendly persistence."""
 
@@ -83,21 +97,50 @@ class JsonlSync:
             change_type=change_type,
             data=data,
         )
-        with open(self.jsonl_path, "a") as f:
-            f.write(record.to_jsonl() + "\n")
+        self._append(record.to_jsonl() + "\n")
 
-    def export_all(self) -> None:
-        """Export all current database state to JSONL."""
-        # Clear existing file
-        self.jsonl_path.write_text("")
+    def record_changes(
+        self,
+        entity_type: str,
+        change_type: ChangeType,
+        changes: Iterable[tuple[str, dict[str, Any] | None]],
+    ) -> None:
+        """Record several changes of one kind with a single append.
+
+        Args:
+            entity_type: "spec" or "task"
+            change_type: Type of change shared by every record
+            changes: (entity_id, data) pairs in the order they happened
+        """
+        lines = _encode_changes(entity_type, change_type, changes)
+        if lines:
+            self._append(lines)
+
+    def _append(self, text: str) -> None:
+        """Append text to the JSONL file with a single O_APPEND write.
+
+        The raw descriptor skips the buffered text layer of open(), and one
+        write() call keeps each batch of lines contiguous even when several
+        processes append to the same file.
+        """
+        data = memoryview(text.encode())
+        fd = os.open(self.jsonl_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            # Regular files take the whole buffer at once; loop for short writes
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
 
-        # Export all specs
-        for spec in self.db.list_specs():
-            self.record_change("spec", spec.id, ChangeType.CREATE, spec.to_dict())
+    def export_all(self) -> None:
+        """Export all current database state to JSONL, replacing the file."""
+        specs = ((spec.id, spec.to_dict()) for spec in self.db.list_specs())
+        tasks = ((task.id, task.to_dict()) for task in self.db.list_tasks())
+        content = _encode_changes("spec", ChangeType.CREATE, specs) + _encode_changes(
+            "task", ChangeType.CREATE, tasks
+        )
 
-        # Export all tasks
-        for task in self.db.list_tasks():
-            self.record_change("task", task.id, ChangeType.CREATE, task.to_dict())
+        jsonio.write_atomic(self.jsonl_path, content.encode())
 
     def import_changes(self) -> None:
         """Import changes from JSONL file into database."""
@@ -108,7 +151,8 @@ class JsonlSync:
         specs: dict[str, dict[str, Any]] = {}
         tasks: dict[str, dict[str, Any]] = {}
 
-        with open(self.jsonl_path) as f:
+        # Read bytes: the log is UTF-8 whatever the locale's default encoding is
+        with open(self.jsonl_path, "rb") as f:
             for line in f:
                 line = line.strip()
                 if not line:
@@ -128,33 +172,39 @@ class JsonlSync:
                     elif record.data is not None:
                         tasks[record.entity_id] = record.data
 
-        # Sync specs to database
-        for spec_id, spec_data in specs.items():
-            existing = self.db.get_spec(spec_id)
-            spec = Spec.from_dict(spec_data)
-            if existing is None:
-                self.db.create_spec(spec)
-            else:
-                self.db.update_spec(spec)
-
-        # Sync tasks to database
-        for task_id, task_data in tasks.items():
-            existing = self.db.get_task(task_id)
-            task = Task.from_dict(task_data)
-            if existing is None:
-                self.db.create_task(task)
-            else:
-                self.db.update_task(task)
+        # Apply everything in one transaction; new entities go in with the
+        # bulk inserts, existing ones are updated in place
+        with self.db.transaction(immediate=True):
+            new_specs = []
+            for spec_id, spec_data in specs.items():
+                spec = Spec.from_dict(spec_data)
+                if self.db.get_spec(spec_id) is None:
+                    new_specs.append(spec)
+                else:
+                    self.db.update_spec(spec)
+            if new_specs:
+                self.db.create_specs_bulk(new_specs)
+
+            new_tasks = []
+            for task_id, task_data in tasks.items():
+                task = Task.from_dict(task_data)
+                if self.db.get_task(task_id) is None:
+                    new_tasks.append(task)
+                else:
+                    self.db.update_task(task)
+            if new_tasks:
+                self.db.create_tasks_bulk(new_tasks)
 
     def compact(self) -> None:
         """Compact JSONL file by removing superseded changes."""
-        # Simply re-export current state
+        # The database already holds the latest state of every entity, so
+        # re-exporting it keeps exactly one record per spec and task
         self.export_all()
 
     def get_changes_since(self, since: datetime) -> list[ChangeRecord]:
         """Get all changes since a given timestamp."""
         changes = []
-        with open(self.jsonl_path) as f:
+        with open(self.jsonl_path, "rb") as f:
             for line in f:
                 line = line.strip()
                 if not line:
@@ -178,6 +228,13 @@ class SyncedDatabase(Database):
         super().create_spec(spec)
         self.sync.record_change("spec", spec.id, ChangeType.CREATE, spec.to_dict())
 
+    def create_specs_bulk(self, specs: list[Spec]) -> None:
+        """Create several specs and record a change for each."""
+        super().create_specs_bulk(specs)
+        self.sync.record_changes(
+            "spec", ChangeType.CREATE, ((spec.id, spec.to_dict()) for spec in specs)
+        )
+
     def update_spec(self, spec: Spec) -> None:
         """Update a spec and record the change."""
         super().update_spec(spec)
@@ -193,6 +250,13 @@ class SyncedDatabase(Database):
         super().create_task(task)
         self.sync.record_change("task", task.id, ChangeType.CREATE, task.to_dict())
 
+    def create_tasks_bulk(self, tasks: list[Task]) -> None:
+        """Create several tasks and record a change for each."""
+        super().create_tasks_bulk(tasks)
+        self.sync.record_changes(
+            "task", ChangeType.CREATE, ((task.id, task.to_dict()) for task in tasks)
+        )
+
     def update_task(self, task: Task) -> None:
         """Update a task and record the change."""
         super().update_task(task)
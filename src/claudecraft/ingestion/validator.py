@@ -1,11 +1,75 @@
 """Specification validation against source documents."""
 
 import re
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from claudecraft.core.project import Project
 
+# Common words ignored by SpecValidator._extract_keywords
+STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "the",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "as",
+        "is",
+        "was",
+        "are",
+        "be",
+        "been",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "should",
+        "could",
+        "may",
+        "might",
+        "must",
+        "can",
+        "that",
+        "this",
+        "it",
+    }
+)
+WORD_PATTERN = re.compile(r"\b\w+\b")
+MAX_KEYWORDS = 10
+
+# Sections SpecValidator._validate_structure expects as "## " headings
+REQUIRED_SECTIONS = ("Overview", "Requirements", "Acceptance Criteria")
+SECTION_PATTERN = re.compile(
+    rf"^##\s+({'|'.join(REQUIRED_SECTIONS)})", re.MULTILINE | re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _extract_keywords(text: str) -> tuple[str, ...]:
+    """Extract meaningful keywords from text, cached since sources are re-validated."""
+    words = (match.group() for match in WORD_PATTERN.finditer(text.lower()))
+    keywords = (w for w in words if len(w) > 3 and w not in STOP_WORDS)
+
+    # Top 10 keywords; the scan stops as soon as they are found
+    return tuple(islice(keywords, MAX_KEYWORDS))
+
 
 class ValidationResult:
     """Result of specification validation."""
@@ -150,14 +214,10 @@ class SpecValidator:
 
     def _validate_structure(self, spec_content: str, result: ValidationResult) -> None:
         """Validate spec.md has required sections."""
-        required_sections = [
-            "Overview",
-            "Requirements",
-            "Acceptance Criteria",
-        ]
+        found = {match.lower() for match in SECTION_PATTERN.findall(spec_content)}
 
-        for section in required_sections:
-            if not re.search(rf"^##\s+{section}", spec_content, re.MULTILINE | re.IGNORECASE):
+        for section in REQUIRED_SECTIONS:
+            if section.lower() not in found:
                 result.add_warning(f"Missing recommended section: {section}")
 
     def _validate_requirements_coverage(
@@ -167,12 +227,25 @@ class SpecValidator:
         # Extract requirements from source
         source_reqs = self._extract_requirements(source_content)
 
-        # Check each requirement
+        # Keywords are lowercase words, so most are answered by the spec's word
+        # set; the rest need a substring scan, done once per distinct keyword
         spec_lower = spec_content.lower()
+        spec_words = set(WORD_PATTERN.findall(spec_lower))
+        substring_hits: dict[str, bool] = {}
+
+        def mentioned(keyword: str) -> bool:
+            if keyword in spec_words:
+                return True
+            hit = substring_hits.get(keyword)
+            if hit is None:
+                hit = substring_hits[keyword] = keyword in spec_lower
+            return hit
+
+        # Check each requirement
         for req in source_reqs:
             # Simple keyword matching (can be improved)
             keywords = self._extract_keywords(req)
-            if any(kw.lower() in spec_lower for kw in keywords):
+            if any(mentioned(kw) for kw in keywords):
                 result.covered_requirements.append(req)
             else:
                 result.missing_requirements.append(req)
@@ -228,51 +301,6 @@ class SpecValidator:
 
         return requirements
 
-    def _extract_keywords(self, text: str) -> list[str]:
+    def _extract_keywords(self, text: str) -> tuple[str, ...]:
         """Extract meaningful keywords from text."""
-        # Remove common words
-        stop_words = {
-            "a",
-            "an",
-            "the",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "as",
-            "is",
-            "was",
-            "are",
-            "be",
-            "been",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "should",
-            "could",
-            "may",
-            "might",
-            "must",
-            "can",
-            "that",
-            "this",
-            "it",
-        }
-
-        words = re.findall(r"\b\w+\b", text.lower())
-        keywords = [w for w in words if w not in stop_words and len(w) > 3]
-
-        return keywords[:10]  # Top 10 keywords
+        return _extract_keywords(text)
@@ -0,0 +1,92 @@
+"""JSON encoding and file writing shared by the CLI, JSONL sync and memory store.
+
+orjson (the "fast" extra) is used when it is installed and the standard library
+otherwise. Both produce the same UTF-8 bytes for the values the project writes:
+strings, booleans, None, lists, dicts, and ints and floats in the usual ranges.
+They still differ on edge cases such as NaN, floats printed in exponent form and
+integers beyond 64 bits. orjson is told to reject datetimes and dataclasses, as
+json.dumps does, so a value fails the same way with either encoder.
+"""
+
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+# orjson options matching json.dumps: stringify non-str keys, reject what it rejects
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+
+# Characters json.dumps escapes when ensure_ascii is set
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def dumps(data: Any, indent: bool = False, ascii_only: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, compact or indented by two spaces.
+
+    With ascii_only, non-ASCII characters are written as \\uXXXX escapes, as
+    json.dumps does by default.
+    """
+    if orjson is not None:
+        options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        encoded: bytes = orjson.dumps(data, option=options)
+        if ascii_only and not encoded.isascii():
+            # orjson always writes raw UTF-8; non-ASCII only occurs inside strings
+            text = _NON_ASCII.sub(lambda match: json.dumps(match.group())[1:-1], encoded.decode())
+            return text.encode()
+        return encoded
+    separators = None if indent else (",", ":")
+    text = json.dumps(
+        data,
+        indent=2 if indent else None,
+        separators=separators,
+        ensure_ascii=ascii_only,
+    )
+    return text.encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def load_file(path: Path) -> Any:
+    """Decode the JSON document stored in a file."""
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    # Parse straight from the mapped file instead of a bytes copy of it
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        memoryview(mapped) as view,
+    ):
+        return orjson.loads(view)
+
+
+def write_synced(path: Path, data: bytes) -> None:
+    """Write a file and fsync it, so it is on disk before any later rename is."""
+    with open(path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents so a crash never leaves it half-written.
+
+    The data is staged in a synced sibling temporary file and swapped in with
+    os.replace, so readers see either the old contents or the new ones.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    write_synced(tmp_path, data)
+    os.replace(tmp_path, path)
@@ -1,13 +1,48 @@
 """Memory store for cross-session context."""
 
-import json
+import heapq
+import os
+import re
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-
-@dataclass
+from claudecraft import jsonio
+
+# Patterns used by MemoryStore.extract_from_text
+FILE_REFERENCE_PATTERN = re.compile(
+    r"(?:^|\s)([\w\/\-\.]+\.(py|js|ts|tsx|md|json|yaml|yml|toml|sh))(?:\s|$|:|\))", re.IGNORECASE
+)
+DECISION_PATTERN = re.compile(
+    r"(?:Decision|We decided|Chosen approach|Using|Implementing with):\s*(.+?)(?:\n|$)", re.IGNORECASE
+)
+DESIGN_PATTERN_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:pattern|approach|architecture):\s*(.+?)(?:\n|$)",
+        r"(?:using|implemented)\s+(singleton|factory|observer|decorator|adapter|facade|repository)\s+pattern",
+        r"(?:following|using)\s+(mvc|mvvm|clean architecture|hexagonal|layered)\s+(?:pattern|architecture)",
+    )
+)
+DEPENDENCY_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:install|pip install|npm install|using)\s+([\w\-]+)",
+        r"(?:import|from)\s+([\w\.]+)",
+        r"(?:depends on|requires)\s+([\w\-\.]+)",
+    )
+)
+NOTE_PATTERN = re.compile(r"(?:TODO|FIXME|NOTE|IMPORTANT|WARNING):\s*(.+?)(?:\n|$)", re.IGNORECASE)
+
+# Journal entries tolerated before compacting, when the store itself is smaller
+JOURNAL_COMPACT_MIN = 100
+
+
+@dataclass(slots=True)
 class Entity:
     """An extracted entity from a session."""
 
@@ -43,35 +78,114 @@ class MemoryStore:
         self.memory_dir = memory_dir
         self.memory_dir.mkdir(parents=True, exist_ok=True)
         self.entities_file = memory_dir / "entities.json"
+        # Entities added since the last snapshot, one JSON object per line
+        self.journal_file = memory_dir / "entities.jsonl"
+        self._journal_entries = 0
+        # Where the journal's torn last line starts; cut off before the next append
+        self._journal_torn_at: int | None = None
+        # Staging file for a new snapshot; _save clears the journal before swapping it in
+        self._tmp_file = memory_dir / "entities.json.tmp"
+        # Set when the entities came from a finished snapshot that was never swapped in
+        self._snapshot_pending = False
         self.entities: dict[str, Entity] = {}
         self._load()
 
+    def _read_snapshot(self, path: Path) -> dict[str, Entity]:
+        """Read a snapshot file; raises if it is missing or incomplete."""
+        entities = {}
+        for entity_data in jsonio.load_file(path):
+            entity = Entity.from_dict(entity_data)
+            entities[entity.id] = entity
+        return entities
+
     def _load(self) -> None:
-        """Load entities from disk."""
-        if not self.entities_file.exists():
+        """Load the entity snapshot from disk, then replay the journal over it.
+
+        Only reads files; damage left by a crash is repaired on the next write.
+        """
+        if not self.journal_file.exists() and self._tmp_file.exists():
+            # A crash between clearing the journal and swapping in the new
+            # snapshot leaves the finished snapshot staged; a torn one won't parse
+            try:
+                self.entities = self._read_snapshot(self._tmp_file)
+                self._snapshot_pending = True
+                return
+            except Exception:
+                pass
+
+        if self.entities_file.exists():
+            try:
+                self.entities = self._read_snapshot(self.entities_file)
+            except Exception:
+                # If loading fails, start fresh
+                self.entities = {}
+
+        if not self.journal_file.exists():
             return
 
-        try:
-            with open(self.entities_file) as f:
-                data = json.load(f)
-                for entity_data in data:
-                    entity = Entity.from_dict(entity_data)
-                    self.entities[entity.id] = entity
-        except Exception:
-            # If loading fails, start fresh
-            self.entities = {}
+        offset = 0
+        with open(self.journal_file, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # An interrupted append leaves a partial last line
+                    self._journal_torn_at = offset
+                    break
+                offset += len(line)
+                try:
+                    entity = Entity.from_dict(jsonio.loads(line))
+                except Exception:
+                    continue
+                self.entities[entity.id] = entity
+                self._journal_entries += 1
 
     def _save(self) -> None:
-        """Save entities to disk."""
+        """Write a full snapshot of the entities to disk and clear the journal.
+
+        The journal is removed after the new snapshot is synced but before it is
+        swapped in. A crash can then never replay an old journal over the new
+        snapshot and bring back entities it dropped.
+        """
         data = [entity.to_dict() for entity in self.entities.values()]
-        with open(self.entities_file, "w") as f:
-            json.dump(data, f, indent=2)
+        jsonio.write_synced(self._tmp_file, jsonio.dumps(data, indent=True))
+        self.journal_file.unlink(missing_ok=True)
+        os.replace(self._tmp_file, self.entities_file)
+        self._journal_entries = 0
+        self._journal_torn_at = None
+        self._snapshot_pending = False
+
+    def _append_journal(self, entities: list[Entity]) -> None:
+        """
+        Persist added or updated entities by appending them to the journal.
+
+        Compacts into a new snapshot once the journal holds more entries than
+        the store, so replaying it on load never costs more than the snapshot.
+        """
+        if self._snapshot_pending:
+            # Entities were loaded from a staged snapshot; write a real one instead
+            self._save()
+            return
+        if self._journal_torn_at is not None:
+            # Appending after a partial line would glue the next entry onto it
+            os.truncate(self.journal_file, self._journal_torn_at)
+            self._journal_torn_at = None
+
+        lines = b"".join(jsonio.dumps(entity.to_dict()) + b"\n" for entity in entities)
+        with open(self.journal_file, "ab") as f:
+            f.write(lines)
+
+        self._journal_entries += len(entities)
+        if self._journal_entries > max(len(self.entities), JOURNAL_COMPACT_MIN):
+            self._save()
 
     def add_entity(self, entity: Entity) -> None:
         """Add or update an entity."""
-        entity.updated_at = datetime.now()
+        self._put_entity(entity)
+        self._append_journal([entity])
+
+    def _put_entity(self, entity: Entity, now: datetime | None = None) -> None:
+        """Add or update an entity in memory, without saving."""
+        entity.updated_at = now if now is not None else datetime.now()
         self.entities[entity.id] = entity
-        self._save()
 
     def get_entity(self, entity_id: str) -> Entity | None:
         """Get an entity by ID."""
@@ -81,25 +195,22 @@ class MemoryStore:
         self, entity_type: str | None = None, keyword: str | None = None, limit: int = 10
     ) -> list[Entity]:
         """Search entities by type and/or keyword."""
-        results = list(self.entities.values())
-
-        # Filter by type
+        # Candidates are streamed into the top-N selection without list copies
+        results: Iterable[Entity]
+        results = self.entities.values()
         if entity_type:
-            results = [e for e in results if e.type == entity_type]
+            results = (e for e in results if e.type == entity_type)
 
-        # Filter by keyword
+        # Filter by keyword against the live text; entities may be edited in place
         if keyword:
             keyword_lower = keyword.lower()
-            results = [
+            results = (
                 e
                 for e in results
                 if keyword_lower in e.name.lower() or keyword_lower in e.description.lower()
-            ]
+            )
 
-        # Sort by relevance score
-        results.sort(key=lambda e: e.relevance_score, reverse=True)
-
-        return results[:limit]
+        return heapq.nlargest(limit, results, key=attrgetter("relevance_score"))
 
     def extract_from_text(self, text: str, source: str, spec_id: str | None = None) -> list[Entity]:
         """
@@ -113,15 +224,15 @@ class MemoryStore:
         - Dependencies
         """
         entities = []
-        import re
 
+        # Entities share one timestamp and are journaled together once extraction finishes
+        now = datetime.now()
         base_context = {"source": source}
         if spec_id:
             base_context["spec_id"] = spec_id
 
         # Extract file references
-        file_pattern = r"(?:^|\s)([\w\/\-\.]+\.(py|js|ts|tsx|md|json|yaml|yml|toml|sh))(?:\s|$|:|\))"
-        for match in re.finditer(file_pattern, text, re.IGNORECASE):
+        for match in FILE_REFERENCE_PATTERN.finditer(text):
             file_path = match.group(1)
             entity_id = f"file:{file_path}"
 
@@ -132,15 +243,14 @@ class MemoryStore:
                     name=file_path,
                     description=f"File referenced in {source}",
                     context=base_context.copy(),
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
+                    created_at=now,
+                    updated_at=now,
                 )
                 entities.append(entity)
-                self.add_entity(entity)
+                self._put_entity(entity, now)
 
         # Extract decisions (lines starting with "Decision:", "We decided", etc.)
-        decision_pattern = r"(?:Decision|We decided|Chosen approach|Using|Implementing with):\s*(.+?)(?:\n|$)"
-        for match in re.finditer(decision_pattern, text, re.IGNORECASE):
+        for match in DECISION_PATTERN.finditer(text):
             decision = match.group(1).strip()
             if len(decision) > 10:  # Skip very short matches
                 entity_id = f"decision:{abs(hash(decision)) % 100000}"
@@ -152,21 +262,16 @@ class MemoryStore:
                         name=decision[:50],
                         description=decision,
                         context=base_context.copy(),
-                        created_at=datetime.now(),
-                        updated_at=datetime.now(),
+                        created_at=now,
+                        updated_at=now,
                         relevance_score=0.9,
                     )
                     entities.append(entity)
-                    self.add_entity(entity)
+                    self._put_entity(entity, now)
 
         # Extract patterns (architectural patterns, design patterns)
-        pattern_indicators = [
-            r"(?:pattern|approach|architecture):\s*(.+?)(?:\n|$)",
-            r"(?:using|implemented)\s+(singleton|factory|observer|decorator|adapter|facade|repository)\s+pattern",
-            r"(?:following|using)\s+(mvc|mvvm|clean architecture|hexagonal|layered)\s+(?:pattern|architecture)",
-        ]
-        for pattern in pattern_indicators:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern in DESIGN_PATTERN_PATTERNS:
+            for match in pattern.finditer(text):
                 pattern_desc = match.group(1).strip() if match.lastindex else match.group(0).strip()
                 entity_id = f"pattern:{abs(hash(pattern_desc)) % 100000}"
 
@@ -177,21 +282,16 @@ class MemoryStore:
                         name=pattern_desc[:50],
                         description=pattern_desc,
                         context=base_context.copy(),
-                        created_at=datetime.now(),
-                        updated_at=datetime.now(),
+                        created_at=now,
+                        updated_at=now,
                         relevance_score=0.8,
                     )
                     entities.append(entity)
-                    self.add_entity(entity)
+                    self._put_entity(entity, now)
 
         # Extract dependencies (package names, libraries)
-        dependency_patterns = [
-            r"(?:install|pip install|npm install|using)\s+([\w\-]+)",
-            r"(?:import|from)\s+([\w\.]+)",
-            r"(?:depends on|requires)\s+([\w\-\.]+)",
-        ]
-        for pattern in dependency_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern in DEPENDENCY_PATTERNS:
+            for match in pattern.finditer(text):
                 dep = match.group(1).strip()
                 # Skip common Python builtins and short names
                 if len(dep) > 2 and dep not in ["os", "re", "sys", "json", "from", "import"]:
@@ -204,16 +304,15 @@ class MemoryStore:
                             name=dep,
                             description=f"Dependency: {dep}",
                             context=base_context.copy(),
-                            created_at=datetime.now(),
-                            updated_at=datetime.now(),
+                            created_at=now,
+                            updated_at=now,
                             relevance_score=0.6,
                         )
                         entities.append(entity)
-                        self.add_entity(entity)
+                        self._put_entity(entity, now)
 
         # Extract technical notes (TODO, FIXME, NOTE, IMPORTANT)
-        note_pattern = r"(?:TODO|FIXME|NOTE|IMPORTANT|WARNING):\s*(.+?)(?:\n|$)"
-        for match in re.finditer(note_pattern, text, re.IGNORECASE):
+        for match in NOTE_PATTERN.finditer(text):
             note = match.group(1).strip()
             if len(note) > 10:
                 entity_id = f"note:{abs(hash(note)) % 100000}"
@@ -225,26 +324,29 @@ class MemoryStore:
                         name=note[:50],
                         description=note,
                         context=base_context.copy(),
-                        created_at=datetime.now(),
-                        updated_at=datetime.now(),
+                        created_at=now,
+                        updated_at=now,
                         relevance_score=0.7,
                     )
                     entities.append(entity)
-                    self.add_entity(entity)
+                    self._put_entity(entity, now)
+
+        if entities:
+            self._append_journal(entities)
 
         return entities
 
     def get_context_for_spec(self, spec_id: str) -> str:
         """Get relevant context for a specification."""
         # Find entities related to this spec (prioritize spec-specific, then general)
-        spec_entities = [
-            e for e in self.entities.values()
-            if e.context.get("spec_id") == spec_id
-        ]
-        general_entities = [
-            e for e in self.entities.values()
-            if e.context.get("spec_id") is None
-        ]
+        spec_entities: list[Entity] = []
+        general_entities: list[Entity] = []
+        for e in self.entities.values():
+            entity_spec_id = e.context.get("spec_id")
+            if entity_spec_id == spec_id:
+                spec_entities.append(e)
+            if entity_spec_id is None:
+                general_entities.append(e)
 
         # Combine: spec-specific first, then general (sorted by relevance)
         entities = sorted(spec_entities, key=lambda e: e.relevance_score, reverse=True)
@@ -300,6 +402,7 @@ class MemoryStore:
         """Convenience method to add a memory entry."""
         entity_id = f"{entity_type}:{abs(hash(name + description)) % 100000}"
 
+        now = datetime.now()
         context = {}
         if spec_id:
             context["spec_id"] = spec_id
@@ -310,32 +413,30 @@ class MemoryStore:
             name=name[:50],
             description=description,
             context=context,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             relevance_score=relevance,
         )
-        self.add_entity(entity)
+        self._put_entity(entity, now)
+        self._append_journal([entity])
         return entity
 
     def cleanup_old_entities(self, days: int = 90) -> int:
         """Remove entities older than specified days."""
-        from datetime import timedelta
-
         cutoff = datetime.now() - timedelta(days=days)
-        before_count = len(self.entities)
+        stale_ids = [eid for eid, entity in self.entities.items() if entity.updated_at < cutoff]
+        if not stale_ids:
+            return 0
 
-        self.entities = {
-            eid: entity for eid, entity in self.entities.items() if entity.updated_at >= cutoff
-        }
+        for eid in stale_ids:
+            del self.entities[eid]
 
         self._save()
-        return before_count - len(self.entities)
+        return len(stale_ids)
 
     def get_stats(self) -> dict[str, Any]:
         """Get memory store statistics."""
-        by_type: dict[str, int] = {}
-        for entity in self.entities.values():
-            by_type[entity.type] = by_type.get(entity.type, 0) + 1
+        by_type = dict(Counter(entity.type for entity in self.entities.values()))
 
         return {
             "total_entities": len(self.entities),
@@ -3,6 +3,7 @@
 import json
 import logging
 import os
+import re
 import subprocess
 import time
 from dataclasses import dataclass
@@ -66,6 +67,12 @@ AGENT_ALLOWED_TOOLS = {
     AgentType.QA: "Task,Read,Bash,Grep,Glob",
 }
 
+# Lines of stage output that report an issue (indicator may appear anywhere in the line)
+ISSUE_LINE_PATTERN = re.compile(
+    r"^.*(?:ERROR|FAIL|FAILED|BLOCKED|ISSUE|BUG|PROBLEM):.*$", re.IGNORECASE | re.MULTILINE
+)
+MAX_EXTRACTED_ISSUES = 10
+
 
 class ExecutionPipeline:
     """Orchestrates the execution pipeline for tasks using Claude Code headless mode."""
@@ -542,13 +549,11 @@ Output one of:
     def _extract_issues(self, output: str) -> list[str]:
         """Extract issues from stage output."""
         issues = []
-        for line in output.split("\n"):
-            line_upper = line.upper()
-            if any(indicator in line_upper for indicator in [
-                "ERROR:", "FAIL:", "FAILED:", "BLOCKED:", "ISSUE:", "BUG:", "PROBLEM:"
-            ]):
-                issues.append(line.strip())
-        return issues[:10]  # Limit to 10 issues
+        for match in ISSUE_LINE_PATTERN.finditer(output):
+            issues.append(match.group().strip())
+            if len(issues) == MAX_EXTRACTED_ISSUES:
+                break
+        return issues
 
     def _get_stage_status(self, agent_type: AgentType) -> TaskStatus:
         """Get task status for a given agent type."""
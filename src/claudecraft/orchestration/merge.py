@@ -3,13 +3,19 @@
 import json
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from git import Repo
 
 
 class MergeStrategy:
-    """Base class for merge strategies."""
+    """Base class for merge strategies.
+
+    Strategies receive the repository and branches on every merge() call and
+    never mutate their own attributes, so one instance can serve any number of
+    orchestrators.
+    """
 
     def merge(self, repo: Repo, source_branch: str, target_branch: str) -> tuple[bool, str]:
         """
@@ -512,6 +518,18 @@ OUTPUT the merged file content below (no markdown code blocks, no explanations):
             return None, f"Failed to run Claude: {e}"
 
 
+@lru_cache(maxsize=16)
+def _build_strategies(
+    claude_path: str, timeout: int
+) -> tuple[tuple[str, MergeStrategy], ...]:
+    """Build the ordered strategy tiers, shared by orchestrators with the same settings."""
+    return (
+        ("Auto-merge", GitAutoMerge()),
+        ("AI conflict resolution", ConflictOnlyAIMerge(claude_path, timeout)),
+        ("AI file regeneration", FullFileAIMerge(claude_path, timeout)),
+    )
+
+
 class MergeOrchestrator:
     """Orchestrates merge operations with 3-tier strategy."""
 
@@ -526,11 +544,7 @@ class MergeOrchestrator:
         self.repo = Repo(repo_path)
         self.claude_path = claude_path
         self.timeout = timeout
-        self.strategies = [
-            ("Auto-merge", GitAutoMerge()),
-            ("AI conflict resolution", ConflictOnlyAIMerge(claude_path, timeout)),
-            ("AI file regeneration", FullFileAIMerge(claude_path, timeout)),
-        ]
+        self.strategies = _build_strategies(claude_path, timeout)
 
     def merge_task(self, task_id: str, target_branch: str = "main") -> tuple[bool, str]:
         """
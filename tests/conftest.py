@@ -1,14 +1,54 @@
 """Pytest fixtures for ClaudeCraft tests."""
 
+import shutil
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
 from claudecraft.core.config import Config
-from claudecraft.core.database import Database
+from claudecraft.core.database import Database, Spec, SpecStatus, Task, TaskStatus
 from claudecraft.core.project import Project
 
+# Fixed timestamp for records built by the factory fixtures
+FIXED_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+# Production connection pragmas, captured before fast_sqlite replaces them
+DEFAULT_CONNECTION_PRAGMAS = Database.connection_pragmas
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_sqlite():
+    """Skip fsync and on-disk journals for every database opened by the tests.
+
+    Applied at class level so connections opened by CLI commands (which reload
+    the project from disk) get the same settings as fixture-created ones.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            Database,
+            "connection_pragmas",
+            ("synchronous = OFF", "journal_mode = MEMORY", "temp_store = MEMORY"),
+        )
+        yield
+
+
+@pytest.fixture
+def default_sqlite(monkeypatch):
+    """Open databases with the production connection pragmas instead of fast_sqlite's."""
+    monkeypatch.setattr(Database, "connection_pragmas", DEFAULT_CONNECTION_PRAGMAS)
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_encoder(request, monkeypatch):
+    """Run a test once with the standard library encoder and once with orjson."""
+    if request.param == "json":
+        monkeypatch.setattr("claudecraft.jsonio.orjson", None)
+    else:
+        monkeypatch.setattr("claudecraft.jsonio.orjson", pytest.importorskip("orjson"))
+    return request.param
+
 
 @pytest.fixture
 def temp_dir():
@@ -17,20 +57,91 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def temp_db(temp_dir):
-    """Create a temporary database for tests."""
-    db_path = temp_dir / "test.db"
-    db = Database(db_path)
+@pytest.fixture(scope="session")
+def session_db():
+    """Create one in-memory database with the schema applied for the whole session.
+
+    Under pytest-xdist each worker runs its own session and so gets its own
+    database; tests using it need no xdist grouping to stay isolated.
+    """
+    db = Database(":memory:")
     db.init_schema()
     yield db
     db.close()
 
 
+@pytest.fixture(scope="session")
+def schema_template():
+    """Create an empty in-memory database with the schema applied, kept for copying."""
+    db = Database(":memory:")
+    db.init_schema()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def apply_schema(schema_template):
+    """Return a function that gives a fresh database the migrated schema.
+
+    SQLite's online backup copies the template's pages in one step, which is
+    cheaper than replaying the schema and every migration per database.
+    """
+
+    def apply(db: Database) -> None:
+        schema_template.conn.backup(db.conn)
+
+    return apply
+
+
+@pytest.fixture(scope="session")
+def schema_tables(session_db):
+    """Names of the tables in a freshly migrated database."""
+    cursor = session_db.conn.cursor()
+    cursor.row_factory = None  # plain tuples; no sqlite3.Row needed for one column
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    return frozenset(name for (name,) in cursor.fetchall())
+
+
 @pytest.fixture
-def temp_project(temp_dir):
-    """Create a temporary project for tests."""
-    project = Project.init(temp_dir)
+def temp_db(session_db):
+    """Yield the session database with each test's writes rolled back afterwards.
+
+    The test runs inside a savepoint, so Database.transaction() nests in it
+    instead of committing and the schema is only created once per session.
+    """
+    conn = session_db.conn
+    conn.execute("SAVEPOINT temp_db")
+    yield session_db
+    conn.execute("ROLLBACK TO temp_db")
+    conn.execute("RELEASE temp_db")
+
+
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory):
+    """Initialize a project once per session for temp_project to copy."""
+    root = tmp_path_factory.mktemp("project-template")
+    Project.init(root).close()
+    return root
+
+
+@pytest.fixture(scope="session")
+def copy_project(project_template):
+    """Return a function that loads a fresh copy of the template project.
+
+    The caller owns the returned project and closes it.
+    """
+
+    def copy(root: Path) -> Project:
+        shutil.copytree(project_template, root, dirs_exist_ok=True)
+        return Project.load(root / ".claudecraft" / "config.yaml")
+
+    return copy
+
+
+@pytest.fixture
+def temp_project(copy_project, temp_dir):
+    """Create a temporary project from a copy of the initialized template."""
+    project = copy_project(temp_dir)
     yield project
     project.close()
 
@@ -41,3 +152,49 @@ def temp_config(temp_dir):
     config_path = temp_dir / ".claudecraft" / "config.yaml"
     config_path.parent.mkdir(parents=True, exist_ok=True)
     return Config.create_default(config_path, "test-project")
+
+
+@pytest.fixture
+def make_spec():
+    """Return a factory that builds a Spec from defaults plus keyword overrides."""
+
+    def _make_spec(**overrides):
+        fields = {
+            "id": "spec-001",
+            "title": "Test Spec",
+            "status": SpecStatus.DRAFT,
+            "source_type": None,
+            "created_at": FIXED_TIME,
+            "updated_at": FIXED_TIME,
+            "metadata": {},
+        }
+        fields.update(overrides)
+        return Spec(**fields)
+
+    return _make_spec
+
+
+@pytest.fixture
+def make_task():
+    """Return a factory that builds a Task from defaults plus keyword overrides."""
+
+    def _make_task(**overrides):
+        fields = {
+            "id": "task-001",
+            "spec_id": "spec-001",
+            "title": "Test Task",
+            "description": "",
+            "status": TaskStatus.TODO,
+            "priority": 0,
+            "dependencies": [],
+            "assignee": None,
+            "worktree": None,
+            "iteration": 0,
+            "created_at": FIXED_TIME,
+            "updated_at": FIXED_TIME,
+            "metadata": {},
+        }
+        fields.update(overrides)
+        return Task(**fields)
+
+    return _make_task
@@ -42,6 +42,9 @@ from claudecraft.cli import (
     cmd_ralph_status,
     cmd_ralph_cancel,
     _build_completion_spec,
+    _cancel_ralph_loop,
+    _dumps,
+    _find_ralph_loops,
     _parse_completion_spec_from_dict,
     _validate_completion_criteria,
 )
@@ -68,9 +71,37 @@ def cli_project(temp_dir, monkeypatch):
     project.close()
 
 
+def parse_output(capsys):
+    """Parse the JSON a command printed to stdout."""
+    return json.loads(capsys.readouterr().out)
+
+
+def assert_json_success(output, **expected):
+    """Assert a JSON payload reports success and has the expected values."""
+    assert output["success"] is True
+    for key, value in expected.items():
+        assert output[key] == value
+
+
+def assert_json_error(output, match):
+    """Assert a JSON payload reports failure with an error containing match."""
+    assert output["success"] is False
+    assert match in output["error"]
+
+
 @pytest.fixture
-def cli_project_with_data(cli_project):
-    """Create a project with sample specs and tasks."""
+def run_main(capsys):
+    """Run main() with the given arguments and return (exit code, parsed JSON output)."""
+
+    def _run(args):
+        result = main(args)
+        return result, parse_output(capsys)
+
+    return _run
+
+
+def _seed_project(project):
+    """Create sample specs and tasks in a project."""
     # Create specs
     spec1 = Spec(
         id="test-spec-1",
@@ -90,8 +121,8 @@ def cli_project_with_data(cli_project):
         updated_at=datetime.now(),
         metadata={},
     )
-    cli_project.db.create_spec(spec1)
-    cli_project.db.create_spec(spec2)
+    project.db.create_spec(spec1)
+    project.db.create_spec(spec2)
 
     # Create tasks
     task1 = Task(
@@ -124,12 +155,58 @@ def cli_project_with_data(cli_project):
         updated_at=datetime.now(),
         metadata={},
     )
-    cli_project.db.create_task(task1)
-    cli_project.db.create_task(task2)
+    project.db.create_task(task1)
+    project.db.create_task(task2)
+
+
+def _seed_ralph_loop(db, task_id, agent_type, status="running", max_iterations=10):
+    """Insert a Ralph loop directly in its final state.
+
+    Tests that only need a loop to exist in a given state use this instead of
+    registering it and then walking it through complete_ralph_loop().
+    """
+    now = datetime.now().isoformat()
+    with db.transaction() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO active_ralph_loops
+                (task_id, agent_type, max_iterations, started_at, updated_at, status)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (task_id, agent_type, max_iterations, now, now, status),
+        )
+
 
+@pytest.fixture
+def cli_project_with_data(cli_project):
+    """Create a project with sample specs and tasks."""
+    _seed_project(cli_project)
     return cli_project
 
 
+@pytest.fixture(scope="module")
+def shared_project(tmp_path_factory):
+    """Create one seeded project shared by every test in the module."""
+    project = Project.init(tmp_path_factory.mktemp("shared_project"))
+    _seed_project(project)
+    yield project
+    project.close()
+
+
+@pytest.fixture
+def shared_project_with_data(shared_project):
+    """Yield the shared project with each test's writes rolled back afterwards.
+
+    Only suitable for tests that use ``project.db`` directly: CLI commands open
+    their own connection and cannot see the uncommitted savepoint.
+    """
+    conn = shared_project.db.conn
+    conn.execute("SAVEPOINT test")
+    yield shared_project
+    conn.execute("ROLLBACK TO test")
+    conn.execute("RELEASE test")
+
+
 class TestCmdInit:
     """Tests for init command."""
 
@@ -884,27 +961,39 @@ class TestMain:
             result = main()
         assert result == 0
 
+    def test_main_tui_path_defaults_to_current_directory(self, temp_dir, monkeypatch):
+        """Test that the cached parser resolves --path against the cwd at call time."""
+        tui_paths = []
+        with patch("claudecraft.cli.cmd_tui", side_effect=lambda p: tui_paths.append(p) or 0):
+            for name in ("first", "second"):
+                (temp_dir / name).mkdir()
+                monkeypatch.chdir(temp_dir / name)
+                with patch("sys.argv", ["claudecraft", "tui"]):
+                    assert main() == 0
+
+        assert tui_paths == [temp_dir / "first", temp_dir / "second"]
+
 
 class TestErrorHandling:
     """Tests for error handling in CLI commands."""
 
-    def test_commands_outside_project(self, temp_dir, monkeypatch):
+    def test_commands_outside_project(self, temp_dir, monkeypatch, subtests):
         """Test that commands fail gracefully outside a project."""
         monkeypatch.chdir(temp_dir)
 
         commands_to_test = [
-            lambda: cmd_status(json_output=False),
-            lambda: cmd_list_specs(json_output=False),
-            lambda: cmd_list_tasks(json_output=False),
-            lambda: cmd_list_agents(json_output=False),
-            lambda: cmd_memory_stats(json_output=False),
-            lambda: cmd_sync_status(json_output=False),
-            lambda: cmd_worktree_list(json_output=False),
+            ("status", lambda: cmd_status(json_output=False)),
+            ("list-specs", lambda: cmd_list_specs(json_output=False)),
+            ("list-tasks", lambda: cmd_list_tasks(json_output=False)),
+            ("list-agents", lambda: cmd_list_agents(json_output=False)),
+            ("memory-stats", lambda: cmd_memory_stats(json_output=False)),
+            ("sync-status", lambda: cmd_sync_status(json_output=False)),
+            ("worktree-list", lambda: cmd_worktree_list(json_output=False)),
         ]
 
-        for cmd in commands_to_test:
-            result = cmd()
-            assert result == 1, f"Command {cmd} should return 1 outside project"
+        for name, cmd in commands_to_test:
+            with subtests.test(msg=name):
+                assert cmd() == 1, f"{name} should return 1 outside project"
 
     def test_json_error_output(self, temp_dir, monkeypatch):
         """Test that errors are properly formatted as JSON."""
@@ -919,6 +1008,42 @@ class TestErrorHandling:
         assert "error" in output
 
 
+class TestDumps:
+    """Tests for the _dumps JSON output helper."""
+
+    def test_output_is_identical_across_encoders(self, json_encoder):
+        """Test that orjson and the standard library emit the same ASCII-only text."""
+        data = {"success": True, "title": "Café → 🚀", "tasks": [{"id": "T-1"}], "empty": []}
+        assert _dumps(data) == json.dumps(data, indent=2)
+        assert _dumps(data) == (
+            "{\n"
+            '  "success": true,\n'
+            '  "title": "Caf\\u00e9 \\u2192 \\ud83d\\ude80",\n'
+            '  "tasks": [\n'
+            "    {\n"
+            '      "id": "T-1"\n'
+            "    }\n"
+            "  ],\n"
+            '  "empty": []\n'
+            "}"
+        )
+
+    def test_datetime_rejected_by_both_encoders(self, json_encoder):
+        """Test that a datetime fails the same way whichever encoder is used."""
+        with pytest.raises(TypeError):
+            _dumps({"at": datetime(2026, 1, 1)})
+
+    def test_output_is_standard_json(self):
+        """Test that output parses with the standard library json module."""
+        data = {"success": True, "count": 2, "title": "Café", "tasks": [{"id": "T-1"}]}
+        assert json.loads(_dumps(data)) == data
+
+    def test_enum_keys(self):
+        """Test that str-enum dictionary keys serialize as their values."""
+        output = json.loads(_dumps({TaskStatus.TODO: 1}))
+        assert output == {"todo": 1}
+
+
 class TestBuildCompletionSpec:
     """Tests for _build_completion_spec helper function."""
 
@@ -1125,6 +1250,55 @@ reviewer:
         assert result.tester.promise == "TESTS_PASS"
         assert result.tester.verification_config.get("command") == "npm test"
 
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b'{"outcome": "Done", "acceptance_criteria": ["Criterion 1"]}',
+            b"{outcome: Done, acceptance_criteria: [Criterion 1]}",
+            b"outcome: Done\nacceptance_criteria:\n  - Criterion 1\n",
+        ],
+        ids=["json", "yaml-flow", "yaml-block"],
+    )
+    def test_loads_from_bytes(self, content):
+        """Test loading completion spec from already-read JSON or YAML content."""
+        result = _build_completion_spec(
+            outcome=None,
+            acceptance_criteria=None,
+            completion_file=content,
+        )
+
+        assert result is not None
+        assert result.outcome == "Done"
+        assert result.acceptance_criteria == ["Criterion 1"]
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {
+                "outcome": "Task done via CLI",
+                "acceptance_criteria": ["Criterion 1", "Criterion 2"],
+                "coder_promise": "CLI_CODE_DONE",
+                "coder_verification": "external",
+                "coder_command": "make test",
+            },
+            {"tester_command": "pytest tests/", "tester_verification": "external"},
+            {"outcome": "Docs complete", "coder_promise": "DOCS_WRITTEN"},
+            {
+                "acceptance_criteria": ["Code is clean"],
+                "reviewer_promise": "REVIEW_OK",
+                "qa_verification": "multi_stage",
+            },
+        ],
+        ids=["coder", "tester", "followup", "reviewer-qa"],
+    )
+    def test_build_completion_spec_roundtrip(self, options):
+        """Test that CLI-built specs survive serialization to the file format."""
+        args = {"outcome": None, "acceptance_criteria": None, "completion_file": None}
+        spec = _build_completion_spec(**{**args, **options}, task_title="Roundtrip Task")
+
+        assert spec is not None
+        assert _parse_completion_spec_from_dict(spec.to_dict()) == spec
+
 
 class TestParseCompletionSpecFromDict:
     """Tests for _parse_completion_spec_from_dict helper function."""
@@ -1503,6 +1677,8 @@ class TestMainWithCompletionOptions:
             "--coder-promise", "CLI_CODE_DONE",
             "--coder-verification", "external",
             "--coder-command", "make test",
+            "--tester-command", "pytest tests/",
+            "--tester-verification", "external",
         ]):
             result = main()
 
@@ -1514,20 +1690,6 @@ class TestMainWithCompletionOptions:
         assert task.completion_spec.outcome == "Task done via CLI"
         assert len(task.completion_spec.acceptance_criteria) == 2
         assert task.completion_spec.coder.promise == "CLI_CODE_DONE"
-
-    def test_main_task_create_with_tester_command(self, cli_project_with_data):
-        """Test main with tester command option."""
-        with patch("sys.argv", [
-            "claudecraft", "task-create", "TASK-TESTER", "test-spec-1", "Tester task",
-            "--tester-command", "pytest tests/",
-            "--tester-verification", "external",
-        ]):
-            result = main()
-
-        assert result == 0
-
-        task = cli_project_with_data.db.get_task("TASK-TESTER")
-        assert task.completion_spec is not None
         assert task.completion_spec.tester is not None
         assert task.completion_spec.tester.verification_config.get("command") == "pytest tests/"
 
@@ -1552,24 +1714,20 @@ class TestRalphStatusCommand:
 
     def test_ralph_status_empty(self, cli_project):
         """Test ralph-status when no loops exist."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            result = cmd_ralph_status(json_output=False)
+        result = cmd_ralph_status(json_output=False)
 
         assert result == 0
         # Just verify it doesn't crash
 
-    def test_ralph_status_json_empty(self, cli_project):
+    def test_ralph_status_json_empty(self, cli_project, capsys):
         """Test ralph-status JSON when no loops exist."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            result = cmd_ralph_status(json_output=True)
-            output = json.loads(mock_stdout.getvalue())
+        result = cmd_ralph_status(json_output=True)
+        output = parse_output(capsys)
 
         assert result == 0
-        assert output["success"] is True
-        assert output["count"] == 0
-        assert output["loops"] == []
+        assert_json_success(output, count=0, loops=[])
 
-    def test_ralph_status_with_loop(self, cli_project_with_data):
+    def test_ralph_status_with_loop(self, cli_project_with_data, capsys):
         """Test ralph-status with an active loop."""
         # Register a Ralph loop
         cli_project_with_data.db.register_ralph_loop(
@@ -1578,13 +1736,11 @@ class TestRalphStatusCommand:
             max_iterations=10,
         )
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            result = cmd_ralph_status(json_output=True)
-            output = json.loads(mock_stdout.getvalue())
+        result = cmd_ralph_status(json_output=True)
+        output = parse_output(capsys)
 
         assert result == 0
-        assert output["success"] is True
-        assert output["count"] == 1
+        assert_json_success(output, count=1)
         assert len(output["loops"]) == 1
         assert output["loops"][0]["task_id"] == "TASK-001"
         assert output["loops"][0]["agent_type"] == "coder"
@@ -1596,57 +1752,54 @@ class TestRalphStatusCommand:
         cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
         cli_project_with_data.db.register_ralph_loop("TASK-002", "reviewer", 5)
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            result = cmd_ralph_status(task_id="TASK-001", json_output=True)
-            output = json.loads(mock_stdout.getvalue())
+        loops = _find_ralph_loops(cli_project_with_data, task_id="TASK-001")
 
-        assert result == 0
-        assert output["count"] == 1
-        assert output["loops"][0]["task_id"] == "TASK-001"
+        assert [loop.task_id for loop in loops] == ["TASK-001"]
 
     def test_ralph_status_filter_by_status(self, cli_project_with_data):
         """Test ralph-status filtered by status."""
-        # Register and complete a loop
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.complete_ralph_loop("TASK-001", "coder", success=True)
+        _seed_ralph_loop(cli_project_with_data.db, "TASK-001", "coder", status="completed")
+        _seed_ralph_loop(cli_project_with_data.db, "TASK-002", "reviewer", max_iterations=5)
 
-        # Register a running loop
-        cli_project_with_data.db.register_ralph_loop("TASK-002", "reviewer", 5)
+        loops = _find_ralph_loops(cli_project_with_data, status="running")
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            result = cmd_ralph_status(status="running", json_output=True)
-            output = json.loads(mock_stdout.getvalue())
+        assert [loop.task_id for loop in loops] == ["TASK-002"]
 
-        assert result == 0
-        assert output["count"] == 1
-        assert output["loops"][0]["task_id"] == "TASK-002"
+    def test_ralph_status_filter_by_task_and_status(self, cli_project_with_data):
+        """Test the status filter applies to the task's latest loop only."""
+        db = cli_project_with_data.db
+        _seed_ralph_loop(db, "TASK-001", "coder")
+        _seed_ralph_loop(db, "TASK-001", "reviewer", status="completed", max_iterations=5)
+        _seed_ralph_loop(db, "TASK-002", "coder", max_iterations=5)
+
+        completed = _find_ralph_loops(cli_project_with_data, task_id="TASK-001", status="completed")
+        running = _find_ralph_loops(cli_project_with_data, task_id="TASK-001", status="running")
 
+        assert [(loop.task_id, loop.agent_type) for loop in completed] == [
+            ("TASK-001", "reviewer")
+        ]
+        assert running == []
 
 class TestRalphCancelCommand:
     """Tests for ralph-cancel CLI command."""
 
-    def test_ralph_cancel_nonexistent(self, cli_project):
+    def test_ralph_cancel_nonexistent(self, cli_project, capsys):
         """Test cancelling a non-existent loop."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            result = cmd_ralph_cancel(task_id="NONEXISTENT", json_output=True)
-            output = json.loads(mock_stdout.getvalue())
+        result = cmd_ralph_cancel(task_id="NONEXISTENT", json_output=True)
+        output = parse_output(capsys)
 
         assert result == 1
-        assert output["success"] is False
-        assert "No Ralph loop found" in output["error"]
+        assert_json_error(output, "No Ralph loop found")
 
     def test_ralph_cancel_success(self, cli_project_with_data):
         """Test successfully cancelling a loop."""
         # Register a loop
         cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            result = cmd_ralph_cancel(task_id="TASK-001", json_output=True)
-            output = json.loads(mock_stdout.getvalue())
+        result, output = _cancel_ralph_loop(cli_project_with_data, "TASK-001")
 
         assert result == 0
-        assert output["success"] is True
-        assert output["task_id"] == "TASK-001"
+        assert_json_success(output, task_id="TASK-001")
 
         # Verify loop is cancelled
         loop = cli_project_with_data.db.get_ralph_loop("TASK-001", "coder")
@@ -1655,17 +1808,14 @@ class TestRalphCancelCommand:
     def test_ralph_cancel_specific_agent(self, cli_project_with_data):
         """Test cancelling a specific agent's loop."""
         # Register loops for multiple agents
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "reviewer", 5)
+        cli_project_with_data.db.register_ralph_loops_bulk(
+            [("TASK-001", "coder", 10), ("TASK-001", "reviewer", 5)]
+        )
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            result = cmd_ralph_cancel(
-                task_id="TASK-001", agent_type="coder", json_output=True
-            )
-            output = json.loads(mock_stdout.getvalue())
+        result, output = _cancel_ralph_loop(cli_project_with_data, "TASK-001", "coder")
 
         assert result == 0
-        assert output["success"] is True
+        assert_json_success(output)
 
         # Verify only coder loop is cancelled
         coder_loop = cli_project_with_data.db.get_ralph_loop("TASK-001", "coder")
@@ -1675,28 +1825,23 @@ class TestRalphCancelCommand:
 
     def test_ralph_cancel_already_completed(self, cli_project_with_data):
         """Test cancelling an already completed loop."""
-        # Register and complete a loop
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.complete_ralph_loop("TASK-001", "coder", success=True)
+        _seed_ralph_loop(cli_project_with_data.db, "TASK-001", "coder", status="completed")
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            result = cmd_ralph_cancel(task_id="TASK-001", json_output=True)
-            output = json.loads(mock_stdout.getvalue())
+        result, output = _cancel_ralph_loop(cli_project_with_data, "TASK-001")
 
         assert result == 1
-        assert output["success"] is False
-        assert "not running" in output["error"]
+        assert_json_error(output, "not running")
 
 
 class TestRalphDatabaseOperations:
     """Tests for Ralph loop database operations."""
 
-    def test_register_ralph_loop(self, cli_project_with_data):
+    def test_register_ralph_loop(self, shared_project_with_data):
         """Test registering a new Ralph loop."""
-        loop_id = cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
+        loop_id = shared_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
         assert loop_id > 0
 
-        loop = cli_project_with_data.db.get_ralph_loop("TASK-001", "coder")
+        loop = shared_project_with_data.db.get_ralph_loop("TASK-001", "coder")
         assert loop is not None
         assert loop.task_id == "TASK-001"
         assert loop.agent_type == "coder"
@@ -1704,18 +1849,18 @@ class TestRalphDatabaseOperations:
         assert loop.max_iterations == 10
         assert loop.status == "running"
 
-    def test_update_ralph_loop_iteration(self, cli_project_with_data):
+    def test_update_ralph_loop_iteration(self, shared_project_with_data):
         """Test updating loop iteration."""
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.update_ralph_loop("TASK-001", "coder", iteration=5)
+        shared_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
+        shared_project_with_data.db.update_ralph_loop("TASK-001", "coder", iteration=5)
 
-        loop = cli_project_with_data.db.get_ralph_loop("TASK-001", "coder")
+        loop = shared_project_with_data.db.get_ralph_loop("TASK-001", "coder")
         assert loop.iteration == 5
 
-    def test_update_ralph_loop_verification_result(self, cli_project_with_data):
+    def test_update_ralph_loop_verification_result(self, shared_project_with_data):
         """Test adding verification result to loop."""
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.update_ralph_loop(
+        shared_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
+        shared_project_with_data.db.update_ralph_loop(
             "TASK-001",
             "coder",
             iteration=1,
@@ -1727,88 +1872,85 @@ class TestRalphDatabaseOperations:
             },
         )
 
-        loop = cli_project_with_data.db.get_ralph_loop("TASK-001", "coder")
+        loop = shared_project_with_data.db.get_ralph_loop("TASK-001", "coder")
         assert len(loop.verification_results) == 1
         assert loop.verification_results[0]["verified"] is False
 
-    def test_list_ralph_loops(self, cli_project_with_data):
+    def test_list_ralph_loops(self, shared_project_with_data):
         """Test listing all Ralph loops."""
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.register_ralph_loop("TASK-002", "reviewer", 5)
+        registered = shared_project_with_data.db.register_ralph_loops_bulk(
+            [("TASK-001", "coder", 10), ("TASK-002", "reviewer", 5)]
+        )
+        assert registered == 2
 
-        loops = cli_project_with_data.db.list_ralph_loops()
+        loops = shared_project_with_data.db.list_ralph_loops()
         assert len(loops) == 2
+        assert {loop.max_iterations for loop in loops} == {10, 5}
 
-    def test_list_ralph_loops_by_status(self, cli_project_with_data):
+    def test_list_ralph_loops_by_status(self, shared_project_with_data):
         """Test listing loops filtered by status."""
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.register_ralph_loop("TASK-002", "reviewer", 5)
-        cli_project_with_data.db.complete_ralph_loop("TASK-001", "coder", success=True)
+        db = shared_project_with_data.db
+        _seed_ralph_loop(db, "TASK-001", "coder", status="completed")
+        _seed_ralph_loop(db, "TASK-002", "reviewer", max_iterations=5)
 
-        running = cli_project_with_data.db.list_ralph_loops(status="running")
-        completed = cli_project_with_data.db.list_ralph_loops(status="completed")
+        running = shared_project_with_data.db.list_ralph_loops(status="running")
+        completed = shared_project_with_data.db.list_ralph_loops(status="completed")
 
         assert len(running) == 1
         assert running[0].task_id == "TASK-002"
         assert len(completed) == 1
         assert completed[0].task_id == "TASK-001"
 
-    def test_cancel_ralph_loop(self, cli_project_with_data):
+    def test_cancel_ralph_loop(self, shared_project_with_data):
         """Test cancelling a loop."""
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cancelled = cli_project_with_data.db.cancel_ralph_loop("TASK-001", "coder")
+        shared_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
+        cancelled = shared_project_with_data.db.cancel_ralph_loop("TASK-001", "coder")
 
         assert cancelled is True
-        loop = cli_project_with_data.db.get_ralph_loop("TASK-001", "coder")
+        loop = shared_project_with_data.db.get_ralph_loop("TASK-001", "coder")
         assert loop.status == "cancelled"
 
-    def test_complete_ralph_loop_success(self, cli_project_with_data):
+    def test_complete_ralph_loop_success(self, shared_project_with_data):
         """Test completing a loop successfully."""
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.complete_ralph_loop("TASK-001", "coder", success=True)
+        shared_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
+        shared_project_with_data.db.complete_ralph_loop("TASK-001", "coder", success=True)
 
-        loop = cli_project_with_data.db.get_ralph_loop("TASK-001", "coder")
+        loop = shared_project_with_data.db.get_ralph_loop("TASK-001", "coder")
         assert loop.status == "completed"
 
-    def test_complete_ralph_loop_failure(self, cli_project_with_data):
+    def test_complete_ralph_loop_failure(self, shared_project_with_data):
         """Test completing a loop with failure."""
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.complete_ralph_loop("TASK-001", "coder", success=False)
+        shared_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
+        shared_project_with_data.db.complete_ralph_loop("TASK-001", "coder", success=False)
 
-        loop = cli_project_with_data.db.get_ralph_loop("TASK-001", "coder")
+        loop = shared_project_with_data.db.get_ralph_loop("TASK-001", "coder")
         assert loop.status == "failed"
 
-    def test_ralph_loop_progress_percent(self, cli_project_with_data):
+    def test_ralph_loop_progress_percent(self, shared_project_with_data):
         """Test progress percent calculation."""
-        cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
-        cli_project_with_data.db.update_ralph_loop("TASK-001", "coder", iteration=5)
+        shared_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
+        shared_project_with_data.db.update_ralph_loop("TASK-001", "coder", iteration=5)
 
-        loop = cli_project_with_data.db.get_ralph_loop("TASK-001", "coder")
+        loop = shared_project_with_data.db.get_ralph_loop("TASK-001", "coder")
         assert loop.progress_percent == 50.0
 
 
 class TestMainWithRalphCommands:
     """Tests for main entry point with Ralph commands."""
 
-    def test_main_ralph_status(self, cli_project):
+    def test_main_ralph_status(self, cli_project, run_main):
         """Test main with ralph-status command."""
-        with patch("sys.argv", ["claudecraft", "ralph-status", "--json"]):
-            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                result = main()
-                output = json.loads(mock_stdout.getvalue())
+        result, output = run_main(["ralph-status", "--json"])
 
         assert result == 0
-        assert output["success"] is True
+        assert_json_success(output)
 
-    def test_main_ralph_cancel(self, cli_project_with_data):
+    def test_main_ralph_cancel(self, cli_project_with_data, run_main):
         """Test main with ralph-cancel command."""
         # Register a loop first
         cli_project_with_data.db.register_ralph_loop("TASK-001", "coder", 10)
 
-        with patch("sys.argv", ["claudecraft", "ralph-cancel", "TASK-001", "--json"]):
-            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                result = main()
-                output = json.loads(mock_stdout.getvalue())
+        result, output = run_main(["ralph-cancel", "TASK-001", "--json"])
 
         assert result == 0
-        assert output["success"] is True
+        assert_json_success(output)
@@ -1,6 +1,6 @@
 """Tests for database management."""
 
-from datetime import datetime
+import sqlite3
 
 import pytest
 
@@ -20,16 +20,12 @@ from claudecraft.core.database import (
 class TestSpec:
     """Tests for Spec dataclass."""
 
-    def test_to_dict(self):
+    def test_to_dict(self, make_spec):
         """Test converting spec to dictionary."""
-        now = datetime.now()
-        spec = Spec(
+        spec = make_spec(
             id="test-spec",
             title="Test Specification",
-            status=SpecStatus.DRAFT,
             source_type="brd",
-            created_at=now,
-            updated_at=now,
             metadata={"key": "value"},
         )
 
@@ -40,46 +36,32 @@ class TestSpec:
         assert d["source_type"] == "brd"
         assert d["metadata"] == {"key": "value"}
 
-    def test_from_dict(self):
-        """Test creating spec from dictionary."""
-        now = datetime.now()
-        d = {
-            "id": "test-spec",
-            "title": "Test Specification",
-            "status": "approved",
-            "source_type": "prd",
-            "created_at": now.isoformat(),
-            "updated_at": now.isoformat(),
-            "metadata": {"priority": "high"},
-        }
-
-        spec = Spec.from_dict(d)
-        assert spec.id == "test-spec"
-        assert spec.status == SpecStatus.APPROVED
-        assert spec.source_type == "prd"
-        assert spec.metadata["priority"] == "high"
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"status": SpecStatus.APPROVED, "source_type": "prd"},
+            {"id": "test-spec", "metadata": {"priority": "high"}},
+        ],
+    )
+    def test_round_trip(self, make_spec, overrides):
+        """Test that from_dict restores a spec serialized with to_dict."""
+        spec = make_spec(**overrides)
+        assert Spec.from_dict(spec.to_dict()) == spec
 
 
 class TestTask:
     """Tests for Task dataclass."""
 
-    def test_to_dict(self):
+    def test_to_dict(self, make_task):
         """Test converting task to dictionary."""
-        now = datetime.now()
-        task = Task(
-            id="task-001",
-            spec_id="spec-001",
+        task = make_task(
             title="Implement feature",
             description="Implementation details",
-            status=TaskStatus.TODO,
             priority=10,
             dependencies=["task-000"],
             assignee="coder",
             worktree="feature-branch",
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
         )
 
         d = task.to_dict()
@@ -88,60 +70,86 @@ class TestTask:
         assert d["dependencies"] == ["task-000"]
         assert d["status"] == "todo"
 
-    def test_from_dict(self):
-        """Test creating task from dictionary."""
-        now = datetime.now()
-        d = {
-            "id": "task-001",
-            "spec_id": "spec-001",
-            "title": "Test task",
-            "description": "",
-            "status": "implementing",
-            "priority": 5,
-            "dependencies": ["task-000"],
-            "assignee": "reviewer",
-            "worktree": None,
-            "iteration": 2,
-            "created_at": now.isoformat(),
-            "updated_at": now.isoformat(),
-            "metadata": {},
-        }
-
-        task = Task.from_dict(d)
-        assert task.id == "task-001"
-        assert task.status == TaskStatus.IMPLEMENTING
-        assert task.iteration == 2
-        assert task.dependencies == ["task-000"]
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {
+                "status": TaskStatus.IMPLEMENTING,
+                "priority": 5,
+                "dependencies": ["task-000"],
+                "assignee": "reviewer",
+                "iteration": 2,
+            },
+            {"worktree": "feature-branch", "metadata": {"retries": 1}},
+            {
+                "completion_spec": TaskCompletionSpec(
+                    outcome="Complete",
+                    acceptance_criteria=["Req 1"],
+                    tester=CompletionCriteria(
+                        promise="TESTS_PASS",
+                        description="Tests pass",
+                        verification_method=VerificationMethod.EXTERNAL,
+                        verification_config={"command": "pytest"},
+                    ),
+                ),
+            },
+        ],
+    )
+    def test_round_trip(self, make_task, overrides):
+        """Test that from_dict restores a task serialized with to_dict."""
+        task = make_task(**overrides)
+        assert Task.from_dict(task.to_dict()) == task
 
 
 class TestDatabase:
     """Tests for Database class."""
 
-    def test_init_schema(self, temp_db):
+    def test_init_schema(self, schema_tables):
         """Test database schema initialization."""
-        # Schema should be initialized by fixture
-        cursor = temp_db.conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        )
-        tables = {row["name"] for row in cursor.fetchall()}
+        assert {"specs", "tasks", "execution_logs", "schema_version"} <= schema_tables
+
+    def test_connection_pragmas(self, temp_dir):
+        """Test that configured pragmas are applied to new connections."""
+        db = Database(temp_dir / "pragmas.db")
+        try:
+            assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+            assert db.conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        finally:
+            db.close()
+
+    def test_default_pragmas_use_wal(self, temp_dir, default_sqlite):
+        """Test that file databases default to WAL with synchronous=NORMAL."""
+        db = Database(temp_dir / "wal.db")
+        try:
+            db.init_schema()
+            assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        finally:
+            db.close()
+
+    def test_shared_memory_uri(self):
+        """Test that connections to a shared in-memory URI see the same data."""
+        uri = "file:test_shared_memory_uri?mode=memory&cache=shared"
+        first = Database(uri)
+        second = Database(uri)
+        try:
+            first.init_schema()
+            first.conn.execute(
+                "INSERT INTO specs (id, title, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                ("spec-001", "Shared", "2024-01-01T00:00:00", "2024-01-01T00:00:00"),
+            )
+            first.conn.commit()
 
-        assert "specs" in tables
-        assert "tasks" in tables
-        assert "execution_logs" in tables
-        assert "schema_version" in tables
+            assert second.get_spec("spec-001").title == "Shared"
+        finally:
+            first.close()
+            second.close()
 
-    def test_create_and_get_spec(self, temp_db):
+    def test_create_and_get_spec(self, temp_db, make_spec):
         """Test creating and retrieving a spec."""
-        now = datetime.now()
-        spec = Spec(
-            id="spec-001",
-            title="Test Spec",
-            status=SpecStatus.DRAFT,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        spec = make_spec()
 
         temp_db.create_spec(spec)
         retrieved = temp_db.get_spec("spec-001")
@@ -151,18 +159,9 @@ class TestDatabase:
         assert retrieved.title == "Test Spec"
         assert retrieved.status == SpecStatus.DRAFT
 
-    def test_update_spec(self, temp_db):
+    def test_update_spec(self, temp_db, make_spec):
         """Test updating a spec."""
-        now = datetime.now()
-        spec = Spec(
-            id="spec-001",
-            title="Original Title",
-            status=SpecStatus.DRAFT,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        spec = make_spec(title="Original Title")
 
         temp_db.create_spec(spec)
 
@@ -175,20 +174,18 @@ class TestDatabase:
         assert retrieved.title == "Updated Title"
         assert retrieved.status == SpecStatus.APPROVED
 
-    def test_list_specs(self, temp_db):
+    def test_list_specs(self, temp_db, make_spec):
         """Test listing specs."""
-        now = datetime.now()
-        for i in range(3):
-            spec = Spec(
-                id=f"spec-{i:03d}",
-                title=f"Spec {i}",
-                status=SpecStatus.DRAFT if i < 2 else SpecStatus.APPROVED,
-                source_type=None,
-                created_at=now,
-                updated_at=now,
-                metadata={},
-            )
-            temp_db.create_spec(spec)
+        temp_db.create_specs_bulk(
+            [
+                make_spec(
+                    id=f"spec-{i:03d}",
+                    title=f"Spec {i}",
+                    status=SpecStatus.DRAFT if i < 2 else SpecStatus.APPROVED,
+                )
+                for i in range(3)
+            ]
+        )
 
         all_specs = temp_db.list_specs()
         assert len(all_specs) == 3
@@ -199,18 +196,28 @@ class TestDatabase:
         approved_specs = temp_db.list_specs(status=SpecStatus.APPROVED)
         assert len(approved_specs) == 1
 
-    def test_delete_spec(self, temp_db):
-        """Test deleting a spec."""
-        now = datetime.now()
-        spec = Spec(
-            id="spec-001",
-            title="To Delete",
-            status=SpecStatus.DRAFT,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
+    def test_count_specs_and_tasks(self, temp_db, make_spec, make_task):
+        """Test counting specs and tasks without loading them."""
+        temp_db.create_specs_bulk(
+            [make_spec(id="spec-001"), make_spec(id="spec-002", status=SpecStatus.APPROVED)]
         )
+        temp_db.create_tasks_bulk(
+            [
+                make_task(id="task-001"),
+                make_task(id="task-002", status=TaskStatus.DONE),
+                make_task(id="task-003", spec_id="spec-002"),
+            ]
+        )
+
+        assert temp_db.count_specs() == 2
+        assert temp_db.count_specs(status=SpecStatus.APPROVED) == 1
+        assert temp_db.count_tasks() == 3
+        assert temp_db.count_tasks(spec_id="spec-001") == 2
+        assert temp_db.count_tasks(spec_id="spec-001", status=TaskStatus.TODO) == 1
+
+    def test_delete_spec(self, temp_db, make_spec):
+        """Test deleting a spec."""
+        spec = make_spec(title="To Delete")
 
         temp_db.create_spec(spec)
         assert temp_db.get_spec("spec-001") is not None
@@ -218,37 +225,76 @@ class TestDatabase:
         temp_db.delete_spec("spec-001")
         assert temp_db.get_spec("spec-001") is None
 
-    def test_create_and_get_task(self, temp_db):
-        """Test creating and retrieving a task."""
-        now = datetime.now()
+    def test_transaction_nested_in_savepoint(self, temp_db, make_spec):
+        """Test that writes inside an open savepoint can be rolled back."""
+        spec = make_spec(title="Rolled Back")
 
-        # Create parent spec first
-        spec = Spec(
-            id="spec-001",
-            title="Parent Spec",
-            status=SpecStatus.DRAFT,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        temp_db.conn.execute("SAVEPOINT outer_test")
         temp_db.create_spec(spec)
+        assert temp_db.conn.in_transaction
+        assert temp_db.get_spec("spec-001") is not None
+
+        temp_db.conn.execute("ROLLBACK TO outer_test")
+        temp_db.conn.execute("RELEASE outer_test")
+        assert temp_db.get_spec("spec-001") is None
+
+    def test_immediate_transaction_takes_write_lock(self, temp_dir):
+        """Test that an immediate transaction holds the write lock before writing."""
+        path = temp_dir / "locks.db"
+        db = Database(path)
+        other = sqlite3.connect(path, timeout=0)
+        try:
+            db.init_schema()
+            with db.transaction(immediate=True):
+                with pytest.raises(sqlite3.OperationalError, match="locked"):
+                    other.execute("BEGIN IMMEDIATE")
+        finally:
+            other.close()
+            db.close()
+
+    def test_ralph_loop_queries_use_indexes(self, temp_db):
+        """Test that Ralph loop lookups and status listings avoid scans and sorts."""
+        lookup_plan = " ".join(
+            row["detail"]
+            for row in temp_db.conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM active_ralph_loops "
+                "WHERE task_id = ? AND agent_type = ?",
+                ("TASK-001", "coder"),
+            )
+        )
+        assert "USING INDEX" in lookup_plan
 
-        task = Task(
-            id="task-001",
-            spec_id="spec-001",
-            title="Test Task",
-            description="Description",
-            status=TaskStatus.TODO,
-            priority=5,
-            dependencies=[],
-            assignee=None,
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
+        listing_plan = " ".join(
+            row["detail"]
+            for row in temp_db.conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM active_ralph_loops "
+                "WHERE status = ? ORDER BY updated_at DESC",
+                ("running",),
+            )
         )
+        assert "idx_active_ralph_loops_status_updated" in listing_plan
+        assert "TEMP B-TREE" not in listing_plan
+
+    def test_ready_task_query_uses_composite_index(self, temp_db):
+        """Test that ready-task lookups for a spec are served by one index without a sort."""
+        plan = " ".join(
+            row["detail"]
+            for row in temp_db.conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE status = ? AND spec_id = ? "
+                "ORDER BY priority DESC, created_at ASC",
+                ("todo", "spec-001"),
+            )
+        )
+        assert "idx_tasks_spec_status_priority" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_create_and_get_task(self, temp_db, make_spec, make_task):
+        """Test creating and retrieving a task."""
+        # Create parent spec first
+        spec = make_spec(title="Parent Spec")
+        temp_db.create_spec(spec)
+
+        task = make_task(description="Description", priority=5)
 
         temp_db.create_task(task)
         retrieved = temp_db.get_task("task-001")
@@ -258,57 +304,18 @@ class TestDatabase:
         assert retrieved.spec_id == "spec-001"
         assert retrieved.title == "Test Task"
 
-    def test_get_ready_tasks(self, temp_db):
+    def test_get_ready_tasks(self, temp_db, make_spec, make_task):
         """Test getting ready tasks with dependency resolution."""
-        now = datetime.now()
-
-        spec = Spec(
-            id="spec-001",
-            title="Spec",
-            status=SpecStatus.PLANNED,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        spec = make_spec(title="Spec", status=SpecStatus.PLANNED)
         temp_db.create_spec(spec)
 
         # Task with no dependencies (should be ready)
-        task1 = Task(
-            id="task-001",
-            spec_id="spec-001",
-            title="First Task",
-            description="",
-            status=TaskStatus.TODO,
-            priority=10,
-            dependencies=[],
-            assignee=None,
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        task1 = make_task(title="First Task", priority=10)
 
         # Task with dependency on task-001 (not ready yet)
-        task2 = Task(
-            id="task-002",
-            spec_id="spec-001",
-            title="Second Task",
-            description="",
-            status=TaskStatus.TODO,
-            priority=5,
-            dependencies=["task-001"],
-            assignee=None,
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        task2 = make_task(id="task-002", title="Second Task", priority=5, dependencies=["task-001"])
 
-        temp_db.create_task(task1)
-        temp_db.create_task(task2)
+        temp_db.create_tasks_bulk([task1, task2])
 
         # Only task1 should be ready
         ready = temp_db.get_ready_tasks("spec-001")
@@ -324,36 +331,26 @@ class TestDatabase:
         assert len(ready) == 1
         assert ready[0].id == "task-002"
 
-    def test_log_execution(self, temp_db):
-        """Test logging execution."""
-        now = datetime.now()
-
-        spec = Spec(
-            id="spec-001",
-            title="Spec",
-            status=SpecStatus.IMPLEMENTING,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
+    def test_get_ready_tasks_dependency_scope(self, temp_db, make_spec, make_task):
+        """Test that dependencies resolve within the requested spec only."""
+        temp_db.create_specs_bulk([make_spec(id="spec-001"), make_spec(id="spec-002")])
+        temp_db.create_tasks_bulk(
+            [
+                make_task(id="task-001", spec_id="spec-001", status=TaskStatus.DONE),
+                make_task(id="task-002", spec_id="spec-002", dependencies=["task-001"]),
+                make_task(id="task-003", spec_id="spec-002", dependencies=["missing"]),
+            ]
         )
+
+        assert [t.id for t in temp_db.get_ready_tasks()] == ["task-002"]
+        assert temp_db.get_ready_tasks("spec-002") == []
+
+    def test_log_execution(self, temp_db, make_spec, make_task):
+        """Test logging execution."""
+        spec = make_spec(title="Spec", status=SpecStatus.IMPLEMENTING)
         temp_db.create_spec(spec)
 
-        task = Task(
-            id="task-001",
-            spec_id="spec-001",
-            title="Task",
-            description="",
-            status=TaskStatus.IMPLEMENTING,
-            priority=0,
-            dependencies=[],
-            assignee="coder",
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        task = make_task(title="Task", status=TaskStatus.IMPLEMENTING, assignee="coder")
         temp_db.create_task(task)
 
         log_id = temp_db.log_execution(
@@ -374,6 +371,25 @@ class TestDatabase:
         assert logs[0].success is True
         assert logs[0].duration_ms == 1500
 
+    def test_log_executions_bulk(self, temp_db, make_spec, make_task):
+        """Test logging several executions at once."""
+        temp_db.create_spec(make_spec())
+        temp_db.create_task(make_task())
+
+        written = temp_db.log_executions_bulk(
+            [
+                ("task-001", "coder", "write_code", "Created foo()", True, 1500),
+                ("task-001", "reviewer", "review", "Needs changes", False, 800),
+            ]
+        )
+
+        assert written == 2
+        logs = temp_db.get_execution_logs("task-001")
+        assert [(log.agent_type, log.success) for log in logs] == [
+            ("coder", True),
+            ("reviewer", False),
+        ]
+
 
 class TestCompletionCriteria:
     """Tests for CompletionCriteria dataclass."""
@@ -410,6 +426,27 @@ class TestCompletionCriteria:
         assert criteria.verification_method == VerificationMethod.STRING_MATCH
         assert criteria.max_iterations is None
 
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            CompletionCriteria(
+                promise="DONE",
+                description="Done",
+                verification_method=VerificationMethod.STRING_MATCH,
+            ),
+            CompletionCriteria(
+                promise="AUTH_IMPLEMENTED",
+                description="Authentication code complete",
+                verification_method=VerificationMethod.EXTERNAL,
+                verification_config={"command": "pytest tests/", "success_exit_code": 0},
+                max_iterations=15,
+            ),
+        ],
+    )
+    def test_round_trip(self, criteria):
+        """Test that from_dict restores criteria serialized with to_dict."""
+        assert CompletionCriteria.from_dict(criteria.to_dict()) == criteria
+
 
 class TestTaskCompletionSpec:
     """Tests for TaskCompletionSpec dataclass."""
@@ -514,51 +551,46 @@ class TestTaskCompletionSpec:
         assert spec.get_criteria_for_agent("reviewer") is None
         assert spec.get_criteria_for_agent("tester") is None
 
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            TaskCompletionSpec(outcome="Feature works", acceptance_criteria=["Requirement 1"]),
+            TaskCompletionSpec(
+                outcome="Full implementation",
+                acceptance_criteria=["Works"],
+                coder=CompletionCriteria(
+                    promise="CODE_DONE",
+                    description="Code complete",
+                    verification_method=VerificationMethod.STRING_MATCH,
+                ),
+                qa=CompletionCriteria(
+                    promise="QA_PASSED",
+                    description="QA validation passed",
+                    verification_method=VerificationMethod.MULTI_STAGE,
+                    verification_config={"require_all": True},
+                ),
+            ),
+        ],
+    )
+    def test_round_trip(self, spec):
+        """Test that from_dict restores a completion spec serialized with to_dict."""
+        assert TaskCompletionSpec.from_dict(spec.to_dict()) == spec
+
 
 class TestDatabaseCompletionSpec:
     """Tests for completion spec database operations."""
 
-    def test_migration_v4_creates_tables(self, temp_db):
+    def test_migration_v4_creates_tables(self, schema_tables):
         """Test that migration v4 creates completion spec tables."""
-        cursor = temp_db.conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        )
-        tables = {row["name"] for row in cursor.fetchall()}
-
-        assert "task_completion_specs" in tables
-        assert "task_agent_criteria" in tables
+        assert {"task_completion_specs", "task_agent_criteria"} <= schema_tables
 
-    def test_save_and_get_completion_spec(self, temp_db):
+    def test_save_and_get_completion_spec(self, temp_db, make_spec, make_task):
         """Test saving and retrieving a completion spec."""
-        now = datetime.now()
-
         # Create parent spec and task first
-        spec = Spec(
-            id="spec-001",
-            title="Test Spec",
-            status=SpecStatus.DRAFT,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        spec = make_spec()
         temp_db.create_spec(spec)
 
-        task = Task(
-            id="task-001",
-            spec_id="spec-001",
-            title="Test Task",
-            description="Description",
-            status=TaskStatus.TODO,
-            priority=5,
-            dependencies=[],
-            assignee=None,
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        task = make_task(description="Description", priority=5)
         temp_db.create_task(task)
 
         # Create and save completion spec
@@ -600,36 +632,12 @@ class TestDatabaseCompletionSpec:
         result = temp_db.get_completion_spec("nonexistent-task")
         assert result is None
 
-    def test_delete_completion_spec(self, temp_db):
+    def test_delete_completion_spec(self, temp_db, make_spec, make_task):
         """Test deleting a completion spec."""
-        now = datetime.now()
-
-        spec = Spec(
-            id="spec-001",
-            title="Test Spec",
-            status=SpecStatus.DRAFT,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        spec = make_spec()
         temp_db.create_spec(spec)
 
-        task = Task(
-            id="task-001",
-            spec_id="spec-001",
-            title="Test Task",
-            description="",
-            status=TaskStatus.TODO,
-            priority=0,
-            dependencies=[],
-            assignee=None,
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        task = make_task()
         temp_db.create_task(task)
 
         completion_spec = TaskCompletionSpec(
@@ -646,19 +654,9 @@ class TestDatabaseCompletionSpec:
         assert result is True
         assert temp_db.get_completion_spec("task-001") is None
 
-    def test_create_task_with_completion_spec(self, temp_db):
+    def test_create_task_with_completion_spec(self, temp_db, make_spec, make_task):
         """Test creating a task with completion spec attached."""
-        now = datetime.now()
-
-        spec = Spec(
-            id="spec-001",
-            title="Test Spec",
-            status=SpecStatus.DRAFT,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        spec = make_spec()
         temp_db.create_spec(spec)
 
         completion_spec = TaskCompletionSpec(
@@ -671,22 +669,7 @@ class TestDatabaseCompletionSpec:
             ),
         )
 
-        task = Task(
-            id="task-001",
-            spec_id="spec-001",
-            title="Test Task",
-            description="",
-            status=TaskStatus.TODO,
-            priority=0,
-            dependencies=[],
-            assignee=None,
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-            completion_spec=completion_spec,
-        )
+        task = make_task(completion_spec=completion_spec)
 
         temp_db.create_task(task)
 
@@ -698,36 +681,12 @@ class TestDatabaseCompletionSpec:
         assert retrieved.completion_spec.coder is not None
         assert retrieved.completion_spec.coder.promise == "DONE"
 
-    def test_update_task_with_completion_spec(self, temp_db):
+    def test_update_task_with_completion_spec(self, temp_db, make_spec, make_task):
         """Test updating a task's completion spec."""
-        now = datetime.now()
-
-        spec = Spec(
-            id="spec-001",
-            title="Test Spec",
-            status=SpecStatus.DRAFT,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        spec = make_spec()
         temp_db.create_spec(spec)
 
-        task = Task(
-            id="task-001",
-            spec_id="spec-001",
-            title="Test Task",
-            description="",
-            status=TaskStatus.TODO,
-            priority=0,
-            dependencies=[],
-            assignee=None,
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        task = make_task()
         temp_db.create_task(task)
 
         # Initially no completion spec
@@ -746,22 +705,13 @@ class TestDatabaseCompletionSpec:
         assert retrieved.completion_spec is not None
         assert retrieved.completion_spec.outcome == "Updated outcome"
 
-    def test_list_tasks_with_completion_specs(self, temp_db):
+    def test_list_tasks_with_completion_specs(self, temp_db, make_spec, make_task):
         """Test batch loading tasks with completion specs."""
-        now = datetime.now()
-
-        spec = Spec(
-            id="spec-001",
-            title="Test Spec",
-            status=SpecStatus.DRAFT,
-            source_type=None,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        spec = make_spec()
         temp_db.create_spec(spec)
 
         # Create 3 tasks, 2 with completion specs
+        tasks = []
         for i in range(3):
             completion = None
             if i < 2:
@@ -775,23 +725,15 @@ class TestDatabaseCompletionSpec:
                     ),
                 )
 
-            task = Task(
-                id=f"task-{i:03d}",
-                spec_id="spec-001",
-                title=f"Task {i}",
-                description="",
-                status=TaskStatus.TODO,
-                priority=i,
-                dependencies=[],
-                assignee=None,
-                worktree=None,
-                iteration=0,
-                created_at=now,
-                updated_at=now,
-                metadata={},
-                completion_spec=completion,
+            tasks.append(
+                make_task(
+                    id=f"task-{i:03d}",
+                    title=f"Task {i}",
+                    priority=i,
+                    completion_spec=completion,
+                )
             )
-            temp_db.create_task(task)
+        temp_db.create_tasks_bulk(tasks)
 
         # Use batch load method
         tasks = temp_db.list_tasks_with_completion_specs(spec_id="spec-001")
@@ -815,9 +757,8 @@ class TestDatabaseCompletionSpec:
 class TestTaskWithCompletionSpec:
     """Tests for Task dataclass with completion_spec field."""
 
-    def test_task_to_dict_with_completion_spec(self):
+    def test_task_to_dict_with_completion_spec(self, make_task):
         """Test converting task with completion spec to dictionary."""
-        now = datetime.now()
         completion = TaskCompletionSpec(
             outcome="Done",
             acceptance_criteria=["Works"],
@@ -829,82 +770,16 @@ class TestTaskWithCompletionSpec:
             ),
         )
 
-        task = Task(
-            id="task-001",
-            spec_id="spec-001",
-            title="Test Task",
-            description="Desc",
-            status=TaskStatus.TODO,
-            priority=5,
-            dependencies=[],
-            assignee=None,
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-            completion_spec=completion,
-        )
+        task = make_task(description="Desc", priority=5, completion_spec=completion)
 
         d = task.to_dict()
         assert "completion_spec" in d
         assert d["completion_spec"]["outcome"] == "Done"
         assert d["completion_spec"]["coder"]["promise"] == "IMPLEMENTED"
 
-    def test_task_from_dict_with_completion_spec(self):
-        """Test creating task from dict with completion spec."""
-        now = datetime.now()
-        d = {
-            "id": "task-001",
-            "spec_id": "spec-001",
-            "title": "Test",
-            "description": "",
-            "status": "todo",
-            "priority": 0,
-            "dependencies": [],
-            "assignee": None,
-            "worktree": None,
-            "iteration": 0,
-            "created_at": now.isoformat(),
-            "updated_at": now.isoformat(),
-            "metadata": {},
-            "completion_spec": {
-                "outcome": "Complete",
-                "acceptance_criteria": ["Req 1"],
-                "tester": {
-                    "promise": "TESTS_PASS",
-                    "description": "Tests pass",
-                    "verification_method": "external",
-                    "verification_config": {"command": "pytest"},
-                },
-            },
-        }
-
-        task = Task.from_dict(d)
-        assert task.completion_spec is not None
-        assert task.completion_spec.outcome == "Complete"
-        assert task.completion_spec.tester is not None
-        assert task.completion_spec.tester.promise == "TESTS_PASS"
-        assert task.completion_spec.coder is None
-
-    def test_task_to_dict_without_completion_spec(self):
+    def test_task_to_dict_without_completion_spec(self, make_task):
         """Test that task without completion spec doesn't include it in dict."""
-        now = datetime.now()
-        task = Task(
-            id="task-001",
-            spec_id="spec-001",
-            title="Test Task",
-            description="",
-            status=TaskStatus.TODO,
-            priority=0,
-            dependencies=[],
-            assignee=None,
-            worktree=None,
-            iteration=0,
-            created_at=now,
-            updated_at=now,
-            metadata={},
-        )
+        task = make_task()
 
         d = task.to_dict()
         assert "completion_spec" not in d
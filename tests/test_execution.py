@@ -1,13 +1,13 @@
 """Tests for execution pipeline."""
 
 import json
+import subprocess
 import pytest
 from pathlib import Path
 from datetime import datetime
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock, patch
 
 from claudecraft.core.database import Task, TaskStatus, Spec, SpecStatus
-from claudecraft.core.project import Project
 from claudecraft.orchestration.agent_pool import AgentPool, AgentType
 from claudecraft.orchestration.execution import (
     ExecutionPipeline,
@@ -17,11 +17,32 @@ from claudecraft.orchestration.execution import (
     AGENT_ALLOWED_TOOLS,
 )
 
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 
 @pytest.fixture
-def project(tmp_path):
+def project(temp_project):
     """Create a test project."""
-    return Project.init(tmp_path)
+    return temp_project
+
+
+@pytest.fixture
+def claude_run(monkeypatch):
+    """Replace subprocess.run; tests set return_value or side_effect as needed."""
+    mock_run = MagicMock()
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    return mock_run
+
+
+def completed(stdout, returncode=0, stderr=""):
+    """Build the result of a Claude CLI invocation."""
+    return subprocess.CompletedProcess(["claude"], returncode, stdout=stdout, stderr=stderr)
+
+
+@pytest.fixture(scope="module")
+def worktree_path(tmp_path_factory):
+    """Provide a worktree directory; the pipeline only runs commands in it."""
+    return tmp_path_factory.mktemp("worktree")
 
 
 @pytest.fixture
@@ -39,20 +60,15 @@ def pipeline(project, agent_pool):
 @pytest.fixture
 def sample_task(project):
     """Create a sample task."""
-    # Create spec first (required for foreign key)
-    from claudecraft.core.database import Spec, SpecStatus
-
     spec = Spec(
         id="spec-1",
         title="Test Spec",
         status=SpecStatus.APPROVED,
         source_type=None,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=NOW,
+        updated_at=NOW,
         metadata={},
     )
-    project.db.create_spec(spec)
-
     task = Task(
         id="task-1",
         spec_id="spec-1",
@@ -65,10 +81,14 @@ def sample_task(project):
         worktree=None,
         metadata={},
         iteration=0,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=NOW,
+        updated_at=NOW,
     )
-    project.db.create_task(task)
+
+    # Insert the spec first (required for foreign key), committing both together
+    with project.db.transaction():
+        project.db.create_spec(spec)
+        project.db.create_task(task)
     return task
 
 
@@ -138,6 +158,15 @@ def test_extract_issues(pipeline):
     assert any("Issue:" in issue for issue in issues)
 
 
+def test_extract_issues_case_insensitive_and_capped(pipeline):
+    """Test indicators match in any case and at most 10 issues are returned."""
+    output = "\n".join(f"step {i}: tests failed: case {i}" for i in range(12))
+
+    issues = pipeline._extract_issues(output)
+    assert len(issues) == 10
+    assert issues[0] == "step 0: tests failed: case 0"
+
+
 def test_extract_issues_none(pipeline):
     """Test extracting issues from clean output."""
     output = "Everything is fine\nNo problems here"
@@ -276,51 +305,38 @@ class TestReadFile:
 class TestBuildAgentPrompt:
     """Tests for _build_agent_prompt method."""
 
-    def test_build_coder_prompt(self, pipeline, sample_task):
-        """Test building prompt for coder agent."""
-        stage = PipelineStage("Implementation", AgentType.CODER, max_iterations=3)
+    @pytest.mark.parametrize(
+        "stage,expected",
+        [
+            (
+                PipelineStage("Implementation", AgentType.CODER, max_iterations=3),
+                ["claudecraft-coder", "IMPLEMENTATION COMPLETE", "BLOCKED:"],
+            ),
+            (
+                PipelineStage("Code Review", AgentType.REVIEWER, max_iterations=2),
+                ["claudecraft-reviewer", "REVIEW PASSED", "REVIEW FAILED"],
+            ),
+            (
+                PipelineStage("Testing", AgentType.TESTER, max_iterations=2),
+                ["claudecraft-tester", "TESTS PASSED", "TESTS FAILED"],
+            ),
+            (
+                PipelineStage("QA Validation", AgentType.QA, max_iterations=10),
+                ["claudecraft-qa", "QA PASSED", "QA FAILED"],
+            ),
+        ],
+        ids=["coder", "reviewer", "tester", "qa"],
+    )
+    def test_build_prompt(self, pipeline, sample_task, stage, expected):
+        """Test building the prompt for each agent type."""
         worktree_path = Path("/tmp/test-worktree")
 
         prompt = pipeline._build_agent_prompt(sample_task, stage, worktree_path, 1)
 
-        assert "claudecraft-coder" in prompt
         assert sample_task.id in prompt
         assert sample_task.title in prompt
-        assert "IMPLEMENTATION COMPLETE" in prompt
-        assert "BLOCKED:" in prompt
-
-    def test_build_reviewer_prompt(self, pipeline, sample_task):
-        """Test building prompt for reviewer agent."""
-        stage = PipelineStage("Code Review", AgentType.REVIEWER, max_iterations=2)
-        worktree_path = Path("/tmp/test-worktree")
-
-        prompt = pipeline._build_agent_prompt(sample_task, stage, worktree_path, 1)
-
-        assert "claudecraft-reviewer" in prompt
-        assert "REVIEW PASSED" in prompt
-        assert "REVIEW FAILED" in prompt
-
-    def test_build_tester_prompt(self, pipeline, sample_task):
-        """Test building prompt for tester agent."""
-        stage = PipelineStage("Testing", AgentType.TESTER, max_iterations=2)
-        worktree_path = Path("/tmp/test-worktree")
-
-        prompt = pipeline._build_agent_prompt(sample_task, stage, worktree_path, 1)
-
-        assert "claudecraft-tester" in prompt
-        assert "TESTS PASSED" in prompt
-        assert "TESTS FAILED" in prompt
-
-    def test_build_qa_prompt(self, pipeline, sample_task):
-        """Test building prompt for QA agent."""
-        stage = PipelineStage("QA Validation", AgentType.QA, max_iterations=10)
-        worktree_path = Path("/tmp/test-worktree")
-
-        prompt = pipeline._build_agent_prompt(sample_task, stage, worktree_path, 1)
-
-        assert "claudecraft-qa" in prompt
-        assert "QA PASSED" in prompt
-        assert "QA FAILED" in prompt
+        for marker in expected:
+            assert marker in prompt
 
     def test_prompt_includes_followup_instructions(self, pipeline, sample_task):
         """Test that prompt includes follow-up task instructions."""
@@ -338,112 +354,100 @@ class TestBuildAgentPrompt:
 class TestRunClaudeHeadless:
     """Tests for _run_claude_headless method."""
 
-    def test_run_success(self, pipeline):
+    def test_run_success(self, pipeline, claude_run):
         """Test successful Claude execution."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": "IMPLEMENTATION COMPLETE", "session_id": "sess-123"})
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            output, session_id, success = pipeline._run_claude_headless(
-                prompt="Test prompt",
-                working_dir=Path("/tmp"),
-                allowed_tools="Read,Write",
-                agent_type=AgentType.CODER,
-            )
-
-            assert success is True
-            assert "IMPLEMENTATION COMPLETE" in output
-            assert session_id == "sess-123"
-            mock_run.assert_called_once()
-
-    def test_run_with_model(self, pipeline):
+        claude_run.return_value = completed(
+            json.dumps({"result": "IMPLEMENTATION COMPLETE", "session_id": "sess-123"})
+        )
+
+        output, session_id, success = pipeline._run_claude_headless(
+            prompt="Test prompt",
+            working_dir=Path("/tmp"),
+            allowed_tools="Read,Write",
+            agent_type=AgentType.CODER,
+        )
+
+        assert success is True
+        assert "IMPLEMENTATION COMPLETE" in output
+        assert session_id == "sess-123"
+        claude_run.assert_called_once()
+
+    def test_run_with_model(self, pipeline, claude_run):
         """Test Claude execution with model parameter."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            pipeline._run_claude_headless(
-                prompt="Test",
-                working_dir=Path("/tmp"),
-                allowed_tools="Read",
-                agent_type=AgentType.CODER,
-                model="opus",
-            )
-
-            call_args = mock_run.call_args[0][0]
-            assert "--model" in call_args
-            assert "opus" in call_args
-
-    def test_run_failure(self, pipeline):
+        claude_run.return_value = completed("Done")
+
+        pipeline._run_claude_headless(
+            prompt="Test",
+            working_dir=Path("/tmp"),
+            allowed_tools="Read",
+            agent_type=AgentType.CODER,
+            model="opus",
+        )
+
+        call_args = claude_run.call_args[0][0]
+        assert "--model" in call_args
+        assert "opus" in call_args
+
+    def test_run_failure(self, pipeline, claude_run):
         """Test failed Claude execution."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = "Error occurred"
-        mock_result.stderr = "Something went wrong"
-
-        with patch("subprocess.run", return_value=mock_result):
-            output, session_id, success = pipeline._run_claude_headless(
-                prompt="Test",
-                working_dir=Path("/tmp"),
-                allowed_tools="Read",
-                agent_type=AgentType.CODER,
-            )
-
-            assert success is False
-            assert "Something went wrong" in output
-
-    def test_run_timeout(self, pipeline):
+        claude_run.return_value = completed(
+            "Error occurred", returncode=1, stderr="Something went wrong"
+        )
+
+        output, session_id, success = pipeline._run_claude_headless(
+            prompt="Test",
+            working_dir=Path("/tmp"),
+            allowed_tools="Read",
+            agent_type=AgentType.CODER,
+        )
+
+        assert success is False
+        assert "Something went wrong" in output
+
+    def test_run_timeout(self, pipeline, claude_run):
         """Test Claude execution timeout."""
-        import subprocess
+        claude_run.side_effect = subprocess.TimeoutExpired("claude", 600)
 
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("claude", 600)):
-            output, session_id, success = pipeline._run_claude_headless(
-                prompt="Test",
-                working_dir=Path("/tmp"),
-                allowed_tools="Read",
-                agent_type=AgentType.CODER,
-            )
+        output, session_id, success = pipeline._run_claude_headless(
+            prompt="Test",
+            working_dir=Path("/tmp"),
+            allowed_tools="Read",
+            agent_type=AgentType.CODER,
+        )
 
-            assert success is False
-            assert "TIMEOUT" in output
-            assert session_id is None
+        assert success is False
+        assert "TIMEOUT" in output
+        assert session_id is None
 
-    def test_run_claude_not_found(self, pipeline):
+    def test_run_claude_not_found(self, pipeline, claude_run):
         """Test Claude CLI not found."""
-        with patch("subprocess.run", side_effect=FileNotFoundError()):
-            output, session_id, success = pipeline._run_claude_headless(
-                prompt="Test",
-                working_dir=Path("/tmp"),
-                allowed_tools="Read",
-                agent_type=AgentType.CODER,
-            )
-
-            assert success is False
-            assert "not found" in output
-            assert session_id is None
-
-    def test_run_non_json_output(self, pipeline):
+        claude_run.side_effect = FileNotFoundError()
+
+        output, session_id, success = pipeline._run_claude_headless(
+            prompt="Test",
+            working_dir=Path("/tmp"),
+            allowed_tools="Read",
+            agent_type=AgentType.CODER,
+        )
+
+        assert success is False
+        assert "not found" in output
+        assert session_id is None
+
+    def test_run_non_json_output(self, pipeline, claude_run):
         """Test handling of non-JSON output from Claude."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Plain text output without JSON"
-        mock_result.stderr = ""
+        claude_run.return_value = completed("Plain text output without JSON")
 
-        with patch("subprocess.run", return_value=mock_result):
-            output, session_id, success = pipeline._run_claude_headless(
-                prompt="Test",
-                working_dir=Path("/tmp"),
-                allowed_tools="Read",
-                agent_type=AgentType.CODER,
-            )
+        output, session_id, success = pipeline._run_claude_headless(
+            prompt="Test",
+            working_dir=Path("/tmp"),
+            allowed_tools="Read",
+            agent_type=AgentType.CODER,
+        )
 
-            assert success is True
-            assert output == "Plain text output without JSON"
-            assert session_id is None
+        assert success is True
+        assert output == "Plain text output without JSON"
+        assert session_id is None
 
 
 class TestExtractMemories:
@@ -468,91 +472,42 @@ class TestExtractMemories:
 class TestExecuteStage:
     """Tests for _execute_stage method."""
 
-    def test_execute_stage_success(self, pipeline, sample_task):
+    def test_execute_stage_success(self, pipeline, sample_task, claude_run):
         """Test successful stage execution."""
         stage = PipelineStage("Implementation", AgentType.CODER, max_iterations=3)
         worktree_path = Path("/tmp/test-worktree")
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": "IMPLEMENTATION COMPLETE"})
-        mock_result.stderr = ""
+        claude_run.return_value = completed(json.dumps({"result": "IMPLEMENTATION COMPLETE"}))
 
-        with patch("subprocess.run", return_value=mock_result):
-            result = pipeline._execute_stage(sample_task, stage, worktree_path, 1)
+        result = pipeline._execute_stage(sample_task, stage, worktree_path, 1)
 
-            assert result.success is True
-            assert result.iteration == 1
-            assert len(result.issues) == 0
+        assert result.success is True
+        assert result.iteration == 1
+        assert len(result.issues) == 0
 
-    def test_execute_stage_failure(self, pipeline, sample_task):
+    def test_execute_stage_failure(self, pipeline, sample_task, claude_run):
         """Test failed stage execution."""
         stage = PipelineStage("Code Review", AgentType.REVIEWER, max_iterations=2)
         worktree_path = Path("/tmp/test-worktree")
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = "REVIEW FAILED: Code quality issues"
-        mock_result.stderr = ""
+        claude_run.return_value = completed("REVIEW FAILED: Code quality issues", returncode=1)
 
-        with patch("subprocess.run", return_value=mock_result):
-            result = pipeline._execute_stage(sample_task, stage, worktree_path, 1)
+        result = pipeline._execute_stage(sample_task, stage, worktree_path, 1)
 
-            assert result.success is False
-            assert len(result.issues) > 0
+        assert result.success is False
+        assert len(result.issues) > 0
 
 
 class TestExecuteTask:
     """Tests for execute_task method."""
 
-    def test_execute_task_all_stages_pass(self, pipeline, sample_task, tmp_path):
-        """Test executing a task where all stages pass."""
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-
-        # Create a mock that returns success for all stages
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = json.dumps({"result": "PASS"})
-            result.stderr = ""
-            return result
-
-        with patch("subprocess.run", side_effect=mock_run):
-            success = pipeline.execute_task(sample_task, worktree_path)
-
-        assert success is True
-        # Verify task was updated to DONE
-        task = pipeline.project.db.get_task(sample_task.id)
-        assert task.status == TaskStatus.DONE
-
-    def test_execute_task_stage_fails(self, pipeline, sample_task, tmp_path):
-        """Test executing a task where a stage fails."""
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-
-        # Create a mock that always fails
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.returncode = 1
-            result.stdout = "BLOCKED: Cannot proceed"
-            result.stderr = ""
-            return result
-
-        with patch("subprocess.run", side_effect=mock_run):
-            success = pipeline.execute_task(sample_task, worktree_path)
-
-        assert success is False
-        # Verify task was reset to TODO
-        task = pipeline.project.db.get_task(sample_task.id)
-        assert task.status == TaskStatus.TODO
-        assert "failure_stage" in task.metadata
-
-    def test_execute_task_registers_agent(self, pipeline, sample_task, tmp_path):
-        """Test that agents are registered during execution."""
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
+    def test_execute_task_all_stages_pass(
+        self, pipeline, sample_task, worktree_path, claude_run, monkeypatch
+    ):
+        """Test executing a task where all stages pass.
 
+        One run checks the task outcome, agent registration and execution logs.
+        """
         # Track register/deregister calls
         register_calls = []
         deregister_calls = []
@@ -568,73 +523,72 @@ class TestExecuteTask:
             deregister_calls.append(kwargs)
             return original_deregister(*args, **kwargs)
 
-        pipeline.project.db.register_agent = mock_register
-        pipeline.project.db.deregister_agent = mock_deregister
+        monkeypatch.setattr(pipeline.project.db, "register_agent", mock_register)
+        monkeypatch.setattr(pipeline.project.db, "deregister_agent", mock_deregister)
 
-        # Make all stages pass quickly
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = "PASS"
-            result.stderr = ""
-            return result
+        # Create a mock that returns success for all stages
+        claude_run.return_value = completed(json.dumps({"result": "PASS"}))
 
-        with patch("subprocess.run", side_effect=mock_run):
-            pipeline.execute_task(sample_task, worktree_path)
+        success = pipeline.execute_task(sample_task, worktree_path)
+
+        assert success is True
+        # Verify task was updated to DONE
+        task = pipeline.project.db.get_task(sample_task.id)
+        assert task.status == TaskStatus.DONE
 
         # Each stage should register and deregister
         assert len(register_calls) == 4  # 4 stages
         assert len(deregister_calls) == 4
 
-    def test_execute_task_logs_execution(self, pipeline, sample_task, tmp_path):
-        """Test that execution is logged."""
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = "PASS"
-            result.stderr = ""
-            return result
-
-        with patch("subprocess.run", side_effect=mock_run):
-            pipeline.execute_task(sample_task, worktree_path)
-
         # Check execution logs were created
         logs = pipeline.project.db.get_execution_logs(sample_task.id)
         assert len(logs) == 4  # One for each stage
 
+    def test_execute_task_stage_fails(self, pipeline, sample_task, worktree_path, claude_run):
+        """Test executing a task where a stage fails."""
+        # Create a mock that always fails
+        claude_run.return_value = completed("BLOCKED: Cannot proceed", returncode=1)
+
+        success = pipeline.execute_task(sample_task, worktree_path)
+
+        assert success is False
+        # Verify task was reset to TODO
+        task = pipeline.project.db.get_task(sample_task.id)
+        assert task.status == TaskStatus.TODO
+        assert "failure_stage" in task.metadata
+
 
 class TestCheckStageSuccess:
     """Additional tests for _check_stage_success."""
 
-    def test_success_indicators(self, pipeline):
-        """Test all success indicators."""
-        success_outputs = [
+    @pytest.mark.parametrize(
+        "output",
+        [
             "IMPLEMENTATION COMPLETE",
             "REVIEW PASSED",
             "TESTS PASSED",
             "QA PASSED",
             "Status: Success",
-        ]
-
-        for output in success_outputs:
-            assert pipeline._check_stage_success(None, output) is True, f"Failed for: {output}"
+        ],
+    )
+    def test_success_indicators(self, pipeline, output):
+        """Test each success indicator."""
+        assert pipeline._check_stage_success(None, output) is True
 
-    def test_failure_indicators(self, pipeline):
-        """Test all failure indicators."""
-        failure_outputs = [
+    @pytest.mark.parametrize(
+        "output",
+        [
             "BLOCKED: Something",
             "REVIEW FAILED: Issues",
             "TESTS FAILED",
             "QA FAILED",
             "ERROR: Something",
             "TIMEOUT: Exceeded",
-        ]
-
-        for output in failure_outputs:
-            assert pipeline._check_stage_success(None, output) is False, f"Failed for: {output}"
+        ],
+    )
+    def test_failure_indicators(self, pipeline, output):
+        """Test each failure indicator."""
+        assert pipeline._check_stage_success(None, output) is False
 
     def test_ambiguous_output_substantial(self, pipeline):
         """Test that substantial output without errors is considered success."""
@@ -667,18 +621,15 @@ from claudecraft.orchestration.ralph import RalphLoop, RalphLoopConfig
 @pytest.fixture
 def sample_task_with_spec(project):
     """Create a sample task with completion spec."""
-    from claudecraft.core.database import Spec, SpecStatus
-
     spec = Spec(
         id="spec-ralph",
         title="Ralph Test Spec",
         status=SpecStatus.APPROVED,
         source_type=None,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=NOW,
+        updated_at=NOW,
         metadata={},
     )
-    project.db.create_spec(spec)
 
     # Create completion spec with all agent types using STRING_MATCH
     # so tests can verify easily
@@ -719,11 +670,13 @@ def sample_task_with_spec(project):
         worktree=None,
         metadata={},
         iteration=0,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=NOW,
+        updated_at=NOW,
         completion_spec=completion_spec,
     )
-    project.db.create_task(task)
+    with project.db.transaction():
+        project.db.create_spec(spec)
+        project.db.create_task(task)
     return task
 
 
@@ -888,75 +841,57 @@ class TestBuildRalphPrompt:
 class TestExecuteStageWithRalph:
     """Tests for execute_stage_with_ralph method."""
 
-    def test_execute_with_ralph_success(self, pipeline, sample_task_with_spec, tmp_path):
+    def test_execute_with_ralph_success(
+        self, pipeline, sample_task_with_spec, worktree_path, claude_run
+    ):
         """Test successful execution with Ralph verification."""
         stage = PipelineStage("Implementation", AgentType.CODER)
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
 
         # Mock Claude to return successful output with promise
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = json.dumps({
-                "result": "Done! <promise>CODER_COMPLETE</promise>"
-            })
-            result.stderr = ""
-            return result
-
-        with patch("subprocess.run", side_effect=mock_run):
-            result = pipeline.execute_stage_with_ralph(
-                sample_task_with_spec, stage, worktree_path
-            )
+        claude_run.return_value = completed(json.dumps({
+            "result": "Done! <promise>CODER_COMPLETE</promise>"
+        }))
+
+        result = pipeline.execute_stage_with_ralph(
+            sample_task_with_spec, stage, worktree_path
+        )
 
         assert result.success is True
         assert result.ralph_verified is True
         assert result.ralph_iterations >= 1
 
-    def test_execute_with_ralph_max_iterations(self, pipeline, sample_task_with_spec, tmp_path):
+    def test_execute_with_ralph_max_iterations(
+        self, pipeline, sample_task_with_spec, worktree_path, claude_run
+    ):
         """Test Ralph execution reaching max iterations."""
         stage = PipelineStage("Implementation", AgentType.CODER)
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
 
         # Use a small max iteration for testing
         pipeline.ralph_config = RalphLoopConfig(enabled=True, max_iterations=2)
 
         # Mock Claude to return output without promise
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = "Still working on it..."
-            result.stderr = ""
-            return result
+        claude_run.return_value = completed("Still working on it...")
 
-        with patch("subprocess.run", side_effect=mock_run):
-            result = pipeline.execute_stage_with_ralph(
-                sample_task_with_spec, stage, worktree_path
-            )
+        result = pipeline.execute_stage_with_ralph(
+            sample_task_with_spec, stage, worktree_path
+        )
 
         assert result.success is False
         assert result.ralph_iterations == 2
 
-    def test_execute_fallback_when_ralph_disabled(self, pipeline, sample_task_with_spec, tmp_path):
+    def test_execute_fallback_when_ralph_disabled(
+        self, pipeline, sample_task_with_spec, worktree_path, claude_run
+    ):
         """Test fallback to regular execution when Ralph disabled."""
         stage = PipelineStage("Implementation", AgentType.CODER)
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
 
         pipeline.ralph_config = RalphLoopConfig(enabled=False)
 
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = "IMPLEMENTATION COMPLETE"
-            result.stderr = ""
-            return result
+        claude_run.return_value = completed("IMPLEMENTATION COMPLETE")
 
-        with patch("subprocess.run", side_effect=mock_run):
-            result = pipeline.execute_stage_with_ralph(
-                sample_task_with_spec, stage, worktree_path
-            )
+        result = pipeline.execute_stage_with_ralph(
+            sample_task_with_spec, stage, worktree_path
+        )
 
         # Should succeed via regular execution
         assert result.success is True
@@ -967,19 +902,10 @@ class TestExecuteTaskWithRalph:
     """Tests for execute_task with Ralph integration."""
 
     def test_execute_task_uses_ralph_when_enabled(
-        self, pipeline, sample_task_with_spec, tmp_path
+        self, pipeline, sample_task_with_spec, worktree_path, claude_run
     ):
         """Test that execute_task uses Ralph for tasks with completion specs."""
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-
-        # Mock to return success with promise
-        call_count = [0]
-
         def mock_run(*args, **kwargs):
-            call_count[0] += 1
-            result = MagicMock()
-            result.returncode = 0
             # Find the prompt in args (it's passed via -p flag)
             cmd = args[0]
             prompt = ""
@@ -990,63 +916,44 @@ class TestExecuteTaskWithRalph:
 
             # Return appropriate promise for each stage
             if "coder" in prompt.lower():
-                result.stdout = "Done! <promise>CODER_COMPLETE</promise>"
+                return completed("Done! <promise>CODER_COMPLETE</promise>")
             elif "reviewer" in prompt.lower():
-                result.stdout = "Done! <promise>REVIEW_OK</promise>"
+                return completed("Done! <promise>REVIEW_OK</promise>")
             elif "tester" in prompt.lower():
-                result.stdout = "Done! <promise>TESTS_OK</promise>"
+                return completed("Done! <promise>TESTS_OK</promise>")
             elif "qa" in prompt.lower():
-                result.stdout = "Done! <promise>QA_OK</promise>"
-            else:
-                result.stdout = "PASS"
-            result.stderr = ""
-            return result
+                return completed("Done! <promise>QA_OK</promise>")
+            return completed("PASS")
 
-        with patch("subprocess.run", side_effect=mock_run):
-            success = pipeline.execute_task(sample_task_with_spec, worktree_path)
+        claude_run.side_effect = mock_run
+        success = pipeline.execute_task(sample_task_with_spec, worktree_path)
 
         assert success is True
         task = pipeline.project.db.get_task(sample_task_with_spec.id)
         assert task.status == TaskStatus.DONE
 
-    def test_execute_task_override_ralph(self, pipeline, sample_task_with_spec, tmp_path):
+    def test_execute_task_override_ralph(
+        self, pipeline, sample_task_with_spec, worktree_path, claude_run
+    ):
         """Test overriding Ralph usage in execute_task."""
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
+        claude_run.return_value = completed("PASS")
 
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = "PASS"
-            result.stderr = ""
-            return result
-
-        with patch("subprocess.run", side_effect=mock_run):
-            # Disable Ralph via parameter
-            success = pipeline.execute_task(
-                sample_task_with_spec, worktree_path, use_ralph=False
-            )
+        # Disable Ralph via parameter
+        success = pipeline.execute_task(
+            sample_task_with_spec, worktree_path, use_ralph=False
+        )
 
         assert success is True
 
     def test_execute_task_records_ralph_failure(
-        self, pipeline, sample_task_with_spec, tmp_path
+        self, pipeline, sample_task_with_spec, worktree_path, claude_run
     ):
         """Test that Ralph failure is recorded in task metadata."""
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-
         pipeline.ralph_config = RalphLoopConfig(enabled=True, max_iterations=1)
 
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = "No promise here"
-            result.stderr = ""
-            return result
-
-        with patch("subprocess.run", side_effect=mock_run):
-            success = pipeline.execute_task(sample_task_with_spec, worktree_path)
+        claude_run.return_value = completed("No promise here")
+
+        success = pipeline.execute_task(sample_task_with_spec, worktree_path)
 
         assert success is False
         task = pipeline.project.db.get_task(sample_task_with_spec.id)
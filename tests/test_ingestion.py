@@ -9,6 +9,45 @@ from claudecraft.core.database import SpecStatus
 from claudecraft.ingestion.ingest import Ingestor
 
 
+REQUIREMENTS_DOC = """# Test
+
+## Requirements
+
+- User can do action A
+- User can do action B
+- System must support feature C
+"""
+
+STORIES_DOC = """# User Stories
+
+As a user, I want to login so that I can access my account.
+
+As an admin, I want to manage users so that I can control access.
+
+As a developer, I want API docs so that I can integrate easily.
+"""
+
+
+@pytest.fixture(scope="module")
+def ingested(copy_project, tmp_path_factory):
+    """Ingest the sample documents once for the read-only extraction tests.
+
+    Returns the ingestor and a mapping of document name to spec id.
+    """
+    root = tmp_path_factory.mktemp("ingested")
+    project = copy_project(root)
+    ingestor = Ingestor(project)
+
+    spec_ids = {}
+    for name, content in (("requirements", REQUIREMENTS_DOC), ("stories", STORIES_DOC)):
+        doc_path = root / f"{name}.md"
+        doc_path.write_text(content)
+        spec_ids[name] = ingestor.ingest(doc_path)
+
+    yield ingestor, spec_ids
+    project.close()
+
+
 class TestIngestor:
     """Tests for Ingestor class."""
 
@@ -137,46 +176,22 @@ Date: 2024-01-15
         assert metadata["requirement_count"] == 3
         assert metadata["section_count"] >= 2
 
-    def test_extract_requirements(self, temp_project, temp_dir):
+    def test_extract_requirements(self, ingested):
         """Test requirement extraction."""
-        brd_path = temp_dir / "test.md"
-        brd_content = """# Test
-
-## Requirements
-
-- User can do action A
-- User can do action B
-- System must support feature C
-"""
-        brd_path.write_text(brd_content)
-
-        ingestor = Ingestor(temp_project)
-        spec_id = ingestor.ingest(brd_path)
+        ingestor, spec_ids = ingested
 
-        requirements = ingestor.extract_requirements(spec_id)
+        requirements = ingestor.extract_requirements(spec_ids["requirements"])
 
         assert len(requirements) == 3
         assert "User can do action A" in requirements
         assert "User can do action B" in requirements
         assert "System must support feature C" in requirements
 
-    def test_extract_user_stories(self, temp_project, temp_dir):
+    def test_extract_user_stories(self, ingested):
         """Test user story extraction."""
-        brd_path = temp_dir / "stories.md"
-        brd_content = """# User Stories
-
-As a user, I want to login so that I can access my account.
-
-As an admin, I want to manage users so that I can control access.
-
-As a developer, I want API docs so that I can integrate easily.
-"""
-        brd_path.write_text(brd_content)
-
-        ingestor = Ingestor(temp_project)
-        spec_id = ingestor.ingest(brd_path)
+        ingestor, spec_ids = ingested
 
-        stories = ingestor.extract_user_stories(spec_id)
+        stories = ingestor.extract_user_stories(spec_ids["stories"])
 
         assert len(stories) == 3
         assert stories[0]["role"] == "user"
@@ -1,5 +1,6 @@
 """Tests for memory store."""
 
+import json
 import pytest
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -170,6 +171,42 @@ def test_search_entities_by_type(store):
     assert decisions[0].type == "decision"
 
 
+def test_search_entities_by_type_after_type_change(store):
+    """Test type search and stats follow an entity whose type changes."""
+    entity = Entity(
+        id="1",
+        type="note",
+        name="Cache results",
+        description="Note",
+        context={},
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    store.add_entity(entity)
+    assert len(store.search_entities(entity_type="note")) == 1
+
+    entity.type = "decision"
+    store.add_entity(entity)
+
+    assert store.search_entities(entity_type="note") == []
+    assert [e.id for e in store.search_entities(entity_type="decision")] == ["1"]
+    assert store.get_stats()["by_type"] == {"decision": 1}
+
+    store.entities["1"] = Entity(
+        id="1",
+        type="pattern",
+        name="Cache results",
+        description="Replaced directly",
+        context={},
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+    assert store.search_entities(entity_type="decision") == []
+    assert [e.id for e in store.search_entities(entity_type="pattern")] == ["1"]
+    assert store.get_stats()["by_type"] == {"pattern": 1}
+
+
 def test_search_entities_by_keyword(store):
     """Test searching entities by keyword."""
     store.add_entity(
@@ -201,6 +238,83 @@ def test_search_entities_by_keyword(store):
     assert "python" in results[0].name.lower()
 
 
+def test_search_entities_keyword_substring(store):
+    """Test keyword search matches substrings across word boundaries."""
+    for entity_id, name in [("1", "python_module.py"), ("2", "pythonic.md"), ("3", "notes.txt")]:
+        store.add_entity(
+            Entity(
+                id=entity_id,
+                type="file",
+                name=name,
+                description="Tracked file",
+                context={},
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+            )
+        )
+
+    assert [e.id for e in store.search_entities(keyword="THON")] == ["1", "2"]
+    assert [e.id for e in store.search_entities(keyword="module.py")] == ["1"]
+    assert [e.id for e in store.search_entities(keyword=".")] == ["1", "2", "3"]
+    assert store.search_entities(keyword="missing") == []
+
+
+def test_search_entities_keyword_after_update(store):
+    """Test keyword search reflects updated and removed entities."""
+    entity = Entity(
+        id="1",
+        type="decision",
+        name="Use SQLite",
+        description="Embedded database",
+        context={},
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    store.add_entity(entity)
+    assert len(store.search_entities(keyword="embedded")) == 1
+
+    entity.description = "Hosted database"
+    store.add_entity(entity)
+    assert store.search_entities(keyword="embedded") == []
+    assert len(store.search_entities(keyword="hosted")) == 1
+
+    entity.updated_at = datetime.now() - timedelta(days=100)
+    store.cleanup_old_entities(days=90)
+    assert store.search_entities(keyword="hosted") == []
+
+
+def test_search_entities_keyword_checks_live_text(store):
+    """Test keyword search checks entities replaced or edited outside add_entity."""
+    store.add_entity(
+        Entity(
+            id="1",
+            type="decision",
+            name="Use SQLite",
+            description="Embedded database",
+            context={},
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+    assert len(store.search_entities(keyword="sqlite")) == 1
+
+    store.entities["1"] = Entity(
+        id="1",
+        type="decision",
+        name="Use Postgres",
+        description="Hosted database",
+        context={},
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    assert store.search_entities(keyword="sqlite") == []
+    assert [e.name for e in store.search_entities(keyword="postgres")] == ["Use Postgres"]
+
+    store.entities["1"].description = "Managed database"
+    assert store.search_entities(keyword="hosted") == []
+    assert [e.id for e in store.search_entities(keyword="managed")] == ["1"]
+
+
 def test_search_entities_limit(store):
     """Test search result limit."""
     # Add many entities
@@ -293,6 +407,20 @@ def test_extract_multiple_patterns(store):
     assert "file" in types or "decision" in types
 
 
+def test_extract_journals_once(store, memory_dir):
+    """Test extraction appends its entities to the journal in one write."""
+    text = "Decision: Use PostgreSQL for database.\nUpdate config.yaml and main.py accordingly."
+
+    entities = store.extract_from_text(text, source="notes")
+
+    assert len(entities) >= 3
+    lines = store.journal_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [e.id for e in entities]
+    assert not store.entities_file.exists()
+    reloaded = MemoryStore(memory_dir)
+    assert {e.id for e in entities} <= set(reloaded.entities)
+
+
 def test_get_context_for_spec(store):
     """Test getting context for a spec."""
     # Add some entities
@@ -359,6 +487,25 @@ def test_cleanup_old_entities(store):
     assert "old" not in store.entities
 
 
+def test_cleanup_nothing_stale_leaves_files(store):
+    """Test cleanup without stale entities does not rewrite the store."""
+    store.add_entity(
+        Entity(
+            id="new",
+            type="file",
+            name="new.py",
+            description="New",
+            context={},
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+
+    assert store.cleanup_old_entities(days=90) == 0
+    assert store.journal_file.exists()
+    assert not store.entities_file.exists()
+
+
 def test_get_stats(store):
     """Test getting memory store statistics."""
     # Add entities
@@ -426,6 +573,215 @@ def test_persistence(memory_dir):
     assert store2.entities["persistent"].name == "test.py"
 
 
+def test_saved_files_are_standard_json(store, memory_dir):
+    """Test the journal and snapshot parse with the json module and round-trip."""
+    store.add_entity(
+        Entity(
+            id="note-1",
+            type="note",
+            name="Café menu",
+            description="Non-ASCII text survives a save",
+            context={"source": "test"},
+            created_at=datetime(2024, 1, 1, 12, 0, 0),
+            updated_at=datetime(2024, 1, 1, 12, 0, 0),
+            relevance_score=0.7,
+        )
+    )
+
+    line = store.journal_file.read_text(encoding="utf-8").splitlines()[0]
+    assert json.loads(line)["name"] == "Café menu"
+
+    store._save()
+
+    data = json.loads(store.entities_file.read_text(encoding="utf-8"))
+    assert data[0]["name"] == "Café menu"
+    assert not store.journal_file.exists()
+    assert MemoryStore(memory_dir).entities["note-1"].name == "Café menu"
+
+
+def test_saved_bytes_identical_across_encoders(store, json_encoder):
+    """Test orjson and the standard library write the same journal and snapshot bytes."""
+    entity = Entity(
+        id="note-1",
+        type="note",
+        name="Café",
+        description="",
+        context={"tags": []},
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
+        relevance_score=0.5,
+    )
+    store.entities[entity.id] = entity
+
+    store._append_journal([entity])
+    assert store.journal_file.read_bytes() == (
+        '{"id":"note-1","type":"note","name":"Café","description":"",'
+        '"context":{"tags":[]},"created_at":"2024-01-01T12:00:00",'
+        '"updated_at":"2024-01-01T12:00:00","relevance_score":0.5}\n'
+    ).encode()
+
+    store._save()
+    assert store.entities_file.read_bytes() == json.dumps(
+        [entity.to_dict()], indent=2, ensure_ascii=False
+    ).encode()
+
+
+def test_journal_replay_and_compaction(store, memory_dir):
+    """Test journaled updates win over the snapshot and a removing cleanup compacts."""
+    entity = Entity(
+        id="decision-1",
+        type="decision",
+        name="Use SQLite",
+        description="Original",
+        context={},
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    store.add_entity(entity)
+    store._save()
+
+    entity.description = "Updated"
+    store.add_entity(entity)
+    # A crash mid-append leaves a partial line, which replay skips
+    with open(store.journal_file, "a", encoding="utf-8") as f:
+        f.write('{"id": "partial"')
+
+    reloaded = MemoryStore(memory_dir)
+    assert reloaded.entities["decision-1"].description == "Updated"
+    assert "partial" not in reloaded.entities
+
+    # The next append must not land on the torn line
+    reloaded.add_entity(
+        Entity(
+            id="after-crash",
+            type="note",
+            name="Appended after the torn line",
+            description="",
+            context={},
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+    reloaded = MemoryStore(memory_dir)
+    assert set(reloaded.entities) == {"decision-1", "after-crash"}
+
+    old_date = datetime.now() - timedelta(days=100)
+    reloaded.entities["old"] = Entity(
+        id="old",
+        type="file",
+        name="old.py",
+        description="Old",
+        context={},
+        created_at=old_date,
+        updated_at=old_date,
+    )
+    assert reloaded.cleanup_old_entities(days=90) == 1
+    assert not reloaded.journal_file.exists()
+    assert MemoryStore(memory_dir).entities["decision-1"].description == "Updated"
+
+
+def test_load_leaves_torn_journal_untouched(store, memory_dir):
+    """Test loading only reads the journal; the torn tail is cut on the next append."""
+    store.add_entity(
+        Entity(
+            id="a",
+            type="note",
+            name="First",
+            description="",
+            context={},
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+    with open(store.journal_file, "ab") as f:
+        f.write(b'{"id": "par')
+    torn = store.journal_file.read_bytes()
+
+    reloaded = MemoryStore(memory_dir)
+    assert list(reloaded.entities) == ["a"]
+    assert store.journal_file.read_bytes() == torn
+
+    reloaded.add_entity(
+        Entity(
+            id="b",
+            type="note",
+            name="Second",
+            description="",
+            context={},
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+    assert b"par" not in store.journal_file.read_bytes()
+    assert list(MemoryStore(memory_dir).entities) == ["a", "b"]
+
+
+def test_crash_before_snapshot_swap_keeps_removals(store, memory_dir, monkeypatch):
+    """Test a crash just before the snapshot swap neither loses nor revives entities."""
+    now = datetime.now()
+    old = now - timedelta(days=100)
+    for entity_id, updated in (("keep", now), ("stale", old)):
+        store.add_entity(
+            Entity(
+                id=entity_id,
+                type="note",
+                name=entity_id,
+                description="",
+                context={},
+                created_at=updated,
+                updated_at=updated,
+            )
+        )
+    store.entities["stale"].updated_at = old
+
+    def crash(src, dst):
+        raise OSError("crashed before the swap")
+
+    with monkeypatch.context() as m:
+        m.setattr("claudecraft.memory.store.os.replace", crash)
+        with pytest.raises(OSError):
+            store.cleanup_old_entities(days=90)
+
+    recovered = MemoryStore(memory_dir)
+    assert list(recovered.entities) == ["keep"]
+
+    recovered.add_entity(
+        Entity(
+            id="new",
+            type="note",
+            name="new",
+            description="",
+            context={},
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    assert list(MemoryStore(memory_dir).entities) == ["keep", "new"]
+    assert not (memory_dir / "entities.json.tmp").exists()
+
+
+def test_journal_compacts_when_outgrowing_store(store, monkeypatch):
+    """Test the journal is folded into the snapshot once it outgrows the store."""
+    monkeypatch.setattr("claudecraft.memory.store.JOURNAL_COMPACT_MIN", 3)
+    entity = Entity(
+        id="note-1",
+        type="note",
+        name="Repeated",
+        description="Re-added note",
+        context={},
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+    for _ in range(3):
+        store.add_entity(entity)
+    assert len(store.journal_file.read_text(encoding="utf-8").splitlines()) == 3
+
+    store.add_entity(entity)
+    assert not store.journal_file.exists()
+    assert store.entities_file.exists()
+
+
 def test_entity_update(store):
     """Test updating existing entity."""
     entity = Entity(
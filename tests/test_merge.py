@@ -1,9 +1,10 @@
 """Tests for merge orchestration."""
 
 import json
+import shutil
+import subprocess
 import pytest
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from pathlib import Path, PurePosixPath
 from git import Repo
 
 from claudecraft.orchestration.merge import (
@@ -14,12 +15,59 @@ from claudecraft.orchestration.merge import (
     FullFileAIMerge,
 )
 
+CONFLICTED_CONTENT = """<<<<<<< HEAD
+def old_function():
+    pass
+=======
+def new_function():
+    pass
+>>>>>>> source"""
 
-@pytest.fixture
-def git_repo(tmp_path):
-    """Create a test git repository with main branch."""
-    repo_path = tmp_path / "test_repo"
-    repo_path.mkdir()
+RESOLVED_CONTENT = """def merged_function():
+    # Combined functionality
+    pass"""
+
+# Canned Claude JSON responses, encoded once for every test that returns them
+RESOLVED_JSON = json.dumps({"result": RESOLVED_CONTENT})
+MARKERS_JSON = json.dumps({"result": "<<<<<<< still has markers"})
+
+# Ways a Claude run can fail: an exception from subprocess.run, or None for a
+# non-zero exit, paired with the text expected in the returned error
+CLAUDE_FAILURES = [
+    pytest.param(subprocess.TimeoutExpired("claude", 10), "timed out", id="timeout"),
+    pytest.param(FileNotFoundError(), "not found", id="not-found"),
+    pytest.param(None, "Error from Claude", id="error-exit"),
+]
+
+
+class InMemoryPath(PurePosixPath):
+    """Path whose text lives in memory, for code that only reads and rewrites a file."""
+
+    def __init__(self, *segments, content: str = ""):
+        super().__init__(*segments)
+        self.content = content
+
+    def read_text(self) -> str:
+        return self.content
+
+    def write_text(self, data: str) -> int:
+        self.content = data
+        return len(data)
+
+
+def _commit_files(repo, files: dict[str, str], message: str):
+    """Write files relative to the work tree and commit them with a single index add."""
+    root = Path(repo.working_tree_dir)
+    for name, content in files.items():
+        (root / name).write_text(content)
+    repo.index.add(list(files))
+    return repo.index.commit(message)
+
+
+@pytest.fixture(scope="module")
+def git_repo_template(tmp_path_factory):
+    """Create a git repository with a main branch once for git_repo to copy."""
+    repo_path = tmp_path_factory.mktemp("git-repo-template")
 
     # Initialize git repo
     repo = Repo.init(repo_path)
@@ -28,22 +76,28 @@ def git_repo(tmp_path):
     with repo.config_writer() as config:
         config.set_value("user", "name", "Test User")
         config.set_value("user", "email", "test@example.com")
+        # Keep background maintenance out of short-lived test repositories
+        config.set_value("gc", "auto", "0")
+        config.set_value("gc", "autoDetach", "false")
+        config.set_value("core", "fsmonitor", "false")
+        config.set_value("core", "preloadIndex", "false")
 
     # Create initial commit on main
-    test_file = repo_path / "README.md"
-    test_file.write_text("# Test Repository")
-    repo.index.add([str(test_file)])
-    repo.index.commit("Initial commit")
-
-    # Ensure we're on main
-    if not repo.heads:
-        repo.git.checkout("-b", "main")
-    elif "main" not in [h.name for h in repo.heads]:
-        repo.git.branch("main")
-        repo.git.checkout("main")
-    else:
-        repo.git.checkout("main")
+    _commit_files(repo, {"README.md": "# Test Repository"}, "Initial commit")
+
+    # Ensure the branch is called main whatever init.defaultBranch says
+    if repo.active_branch.name != "main":
+        repo.git.branch("-M", "main")
+
+    repo.close()
+    return repo_path
 
+
+@pytest.fixture
+def git_repo(git_repo_template, tmp_path):
+    """Create a test git repository with main branch from a copy of the template."""
+    repo_path = tmp_path / "test_repo"
+    shutil.copytree(git_repo_template, repo_path)
     return repo_path
 
 
@@ -53,36 +107,54 @@ def orchestrator(git_repo):
     return MergeOrchestrator(git_repo)
 
 
-def test_merge_orchestrator_creation(orchestrator):
-    """Test merge orchestrator initialization."""
-    assert orchestrator.repo is not None
-    assert len(orchestrator.strategies) == 3
+@pytest.fixture
+def repo(orchestrator):
+    """Share the orchestrator's repository handle instead of opening another."""
+    return orchestrator.repo
 
 
-def test_merge_strategies(orchestrator):
-    """Test merge strategy configuration."""
-    strategies = orchestrator.strategies
+@pytest.fixture(scope="module")
+def readonly_orchestrator(git_repo_template, tmp_path_factory):
+    """Create a merge orchestrator shared by tests that never change the repository."""
+    repo_path = tmp_path_factory.mktemp("readonly-repo") / "test_repo"
+    shutil.copytree(git_repo_template, repo_path)
+    return MergeOrchestrator(repo_path)
 
-    assert strategies[0][0] == "Auto-merge"
-    assert isinstance(strategies[0][1], GitAutoMerge)
 
-    assert strategies[1][0] == "AI conflict resolution"
-    assert isinstance(strategies[1][1], ConflictOnlyAIMerge)
+class ClaudeStub:
+    """Plain stand-in for subprocess.run that returns or raises a preset outcome."""
 
-    assert strategies[2][0] == "AI file regeneration"
-    assert isinstance(strategies[2][1], FullFileAIMerge)
+    def __init__(self):
+        self.result = None
+        self.error = None
 
+    def set(self, stdout: str, returncode: int = 0, stderr: str = "") -> None:
+        """Make Claude calls return the given output."""
+        self.result = subprocess.CompletedProcess(["claude"], returncode, stdout, stderr)
 
-def test_git_auto_merge_success(git_repo):
-    """Test successful automatic merge."""
-    repo = Repo(git_repo)
+    def fail(self, error: Exception) -> None:
+        """Make Claude calls raise error."""
+        self.error = error
+
+    def run(self, *args, **kwargs) -> subprocess.CompletedProcess:
+        if self.error is not None:
+            raise self.error
+        return self.result
 
+
+@pytest.fixture
+def claude_stub(monkeypatch):
+    """Replace subprocess.run with a ClaudeStub for the duration of a test."""
+    stub = ClaudeStub()
+    monkeypatch.setattr(subprocess, "run", stub.run)
+    return stub
+
+
+def test_git_auto_merge_success(repo):
+    """Test successful automatic merge."""
     # Create task branch with non-conflicting changes
     repo.git.checkout("-b", "task/test-1")
-    test_file = git_repo / "feature.txt"
-    test_file.write_text("New feature")
-    repo.index.add([str(test_file)])
-    repo.index.commit("Add feature")
+    _commit_files(repo, {"feature.txt": "New feature"}, "Add feature")
 
     # Switch back to main
     repo.git.checkout("main")
@@ -95,23 +167,16 @@ def test_git_auto_merge_success(git_repo):
     assert "Successfully merged" in message
 
 
-def test_git_auto_merge_conflict(git_repo):
+def test_git_auto_merge_conflict(repo):
     """Test automatic merge with conflicts."""
-    repo = Repo(git_repo)
-
     # Create conflicting changes
     # On main, modify README
-    readme = git_repo / "README.md"
-    readme.write_text("# Main Branch Version")
-    repo.index.add([str(readme)])
-    repo.index.commit("Update README on main")
+    _commit_files(repo, {"README.md": "# Main Branch Version"}, "Update README on main")
 
     # Create task branch from earlier commit
     repo.git.checkout("HEAD~1")
     repo.git.checkout("-b", "task/test-2")
-    readme.write_text("# Task Branch Version")
-    repo.index.add([str(readme)])
-    repo.index.commit("Update README on task")
+    _commit_files(repo, {"README.md": "# Task Branch Version"}, "Update README on task")
 
     # Switch to main and try to merge
     repo.git.checkout("main")
@@ -123,16 +188,11 @@ def test_git_auto_merge_conflict(git_repo):
     assert "conflict" in message.lower()
 
 
-def test_merge_task_success(git_repo, orchestrator):
+def test_merge_task_success(repo, orchestrator):
     """Test merging a task branch."""
-    repo = Repo(git_repo)
-
     # Create task branch
     repo.git.checkout("-b", "task/test-task-1")
-    test_file = git_repo / "task-file.txt"
-    test_file.write_text("Task content")
-    repo.index.add([str(test_file)])
-    repo.index.commit("Add task file")
+    _commit_files(repo, {"task-file.txt": "Task content"}, "Add task file")
     repo.git.checkout("main")
 
     # Merge task
@@ -142,24 +202,11 @@ def test_merge_task_success(git_repo, orchestrator):
     assert "Merged using Auto-merge" in message
 
 
-def test_merge_task_nonexistent_branch(orchestrator):
-    """Test merging nonexistent task branch."""
-    success, message = orchestrator.merge_task("nonexistent-task", "main")
-
-    assert success is False
-    assert "not found" in message.lower()
-
-
-def test_cleanup_branch(git_repo, orchestrator):
+def test_cleanup_branch(repo, orchestrator):
     """Test cleaning up merged branch."""
-    repo = Repo(git_repo)
-
     # Create task branch
     repo.git.checkout("-b", "task/cleanup-test")
-    test_file = git_repo / "temp.txt"
-    test_file.write_text("Temp")
-    repo.index.add([str(test_file)])
-    repo.index.commit("Temp commit")
+    _commit_files(repo, {"temp.txt": "Temp"}, "Temp commit")
     repo.git.checkout("main")
 
     # Merge
@@ -174,31 +221,11 @@ def test_cleanup_branch(git_repo, orchestrator):
     assert "task/cleanup-test" not in branch_names
 
 
-def test_cleanup_nonexistent_branch(orchestrator):
-    """Test cleaning up nonexistent branch."""
-    result = orchestrator.cleanup_branch("nonexistent")
-    assert result is False
-
-
-def test_get_merge_status(orchestrator):
-    """Test getting merge status."""
-    status = orchestrator.get_merge_status()
-
-    assert "current_branch" in status
-    assert "strategies_available" in status
-    assert len(status["strategies_available"]) == 3
-
-
-def test_conflict_only_merge_no_conflicts(git_repo):
+def test_conflict_only_merge_no_conflicts(repo):
     """Test AI conflict merge with no conflicts."""
-    repo = Repo(git_repo)
-
     # Create non-conflicting branch
     repo.git.checkout("-b", "task/no-conflict")
-    test_file = git_repo / "new-file.txt"
-    test_file.write_text("New content")
-    repo.index.add([str(test_file)])
-    repo.index.commit("Add new file")
+    _commit_files(repo, {"new-file.txt": "New content"}, "Add new file")
     repo.git.checkout("main")
 
     strategy = ConflictOnlyAIMerge()
@@ -208,15 +235,11 @@ def test_conflict_only_merge_no_conflicts(git_repo):
     assert success is True or "no conflicts" in message.lower()
 
 
-def test_full_file_merge_no_conflicts(git_repo):
+def test_full_file_merge_no_conflicts(repo):
     """Test full file AI merge with no conflicts."""
-    repo = Repo(git_repo)
-
     # Create a non-conflicting branch
     repo.git.checkout("-b", "task/fullfile-clean")
-    (git_repo / "newfile.txt").write_text("new content")
-    repo.index.add(["newfile.txt"])
-    repo.index.commit("Add new file")
+    _commit_files(repo, {"newfile.txt": "new content"}, "Add new file")
     repo.git.checkout("main")
 
     strategy = FullFileAIMerge()
@@ -226,17 +249,13 @@ def test_full_file_merge_no_conflicts(git_repo):
     assert success is True or "no conflicts" in message.lower()
 
 
-def test_merge_task_branch_format(orchestrator):
+def test_merge_task_branch_format(repo, orchestrator):
     """Test that merge_task uses correct branch format."""
     # The method should look for task/{task_id}
-    repo = orchestrator.repo
 
     # Create properly formatted branch
     repo.git.checkout("-b", "task/formatted-task")
-    test_file = Path(repo.working_dir) / "test.txt"
-    test_file.write_text("Test")
-    repo.index.add([str(test_file)])
-    repo.index.commit("Test commit")
+    _commit_files(repo, {"test.txt": "Test"}, "Test commit")
     repo.git.checkout("main")
 
     # This should find task/formatted-task
@@ -244,27 +263,56 @@ def test_merge_task_branch_format(orchestrator):
     assert success is True
 
 
-def test_multiple_strategy_fallback(git_repo, orchestrator):
-    """Test that orchestrator tries multiple strategies."""
-    # The orchestrator should have 3 strategies configured
-    assert len(orchestrator.strategies) == 3
+class TestReadOnlyOrchestrator:
+    """Tests that only read the orchestrator or exercise error paths that leave the repo as is."""
+
+    def test_merge_strategies(self, readonly_orchestrator):
+        """Test merge strategy configuration."""
+        strategies = readonly_orchestrator.strategies
+        assert len(strategies) == 3
+
+        assert strategies[0][0] == "Auto-merge"
+        assert isinstance(strategies[0][1], GitAutoMerge)
+
+        assert strategies[1][0] == "AI conflict resolution"
+        assert isinstance(strategies[1][1], ConflictOnlyAIMerge)
+
+        assert strategies[2][0] == "AI file regeneration"
+        assert isinstance(strategies[2][1], FullFileAIMerge)
+
+    @pytest.mark.parametrize(
+        "key, expected",
+        [
+            ("in_progress", False),
+            ("current_branch", "main"),
+            (
+                "strategies_available",
+                ["Auto-merge", "AI conflict resolution", "AI file regeneration"],
+            ),
+        ],
+    )
+    def test_merge_status(self, readonly_orchestrator, key, expected):
+        """Test each field of the merge status when no merge is in progress."""
+        assert readonly_orchestrator.get_merge_status()[key] == expected
 
-    # Each strategy should be tried in order until success
-    # (This is tested implicitly through merge_task tests)
-    strategies_list = orchestrator.get_merge_status()["strategies_available"]
-    assert len(strategies_list) == 3
+    def test_merge_task_nonexistent_branch(self, readonly_orchestrator):
+        """Test merging nonexistent task branch."""
+        success, message = readonly_orchestrator.merge_task("nonexistent-task", "main")
 
+        assert success is False
+        assert "not found" in message.lower()
 
-class TestMergeStrategyBase:
-    """Tests for MergeStrategy base class."""
+    def test_cleanup_nonexistent_branch(self, readonly_orchestrator):
+        """Test cleaning up nonexistent branch."""
+        result = readonly_orchestrator.cleanup_branch("nonexistent")
+        assert result is False
 
-    def test_merge_not_implemented(self, git_repo):
+    def test_merge_not_implemented(self, readonly_orchestrator):
         """Test that base class raises NotImplementedError."""
         strategy = MergeStrategy()
-        repo = Repo(git_repo)
 
         with pytest.raises(NotImplementedError):
-            strategy.merge(repo, "source", "target")
+            strategy.merge(readonly_orchestrator.repo, "source", "target")
 
 
 class TestConflictOnlyAIMerge:
@@ -276,127 +324,71 @@ class TestConflictOnlyAIMerge:
         assert strategy.claude_path == "/custom/path"
         assert strategy.timeout == 600
 
-    def test_resolve_file_no_conflict_markers(self, tmp_path):
+    def test_resolve_file_no_conflict_markers(self):
         """Test resolving a file without conflict markers."""
         strategy = ConflictOnlyAIMerge()
-        test_file = tmp_path / "test.py"
-        test_file.write_text("# Clean file without conflicts")
+        test_file = InMemoryPath("test.py", content="# Clean file without conflicts")
 
         success, error = strategy._resolve_file_conflicts(test_file, "source", "target")
         assert success is True
         assert "No conflict markers" in error
 
-    def test_resolve_file_with_conflicts_success(self, tmp_path):
+    def test_resolve_file_with_conflicts_success(self, claude_stub):
         """Test resolving a file with conflicts using mocked Claude."""
         strategy = ConflictOnlyAIMerge()
-        test_file = tmp_path / "test.py"
-        conflicted_content = """<<<<<<< HEAD
-def old_function():
-    pass
-=======
-def new_function():
-    pass
->>>>>>> source"""
-        test_file.write_text(conflicted_content)
+        test_file = InMemoryPath("test.py", content=CONFLICTED_CONTENT)
 
         # Mock Claude to return resolved content
-        resolved_content = """def merged_function():
-    # Combined functionality
-    pass"""
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": resolved_content})
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            success, error = strategy._resolve_file_conflicts(test_file, "source", "target")
+        claude_stub.set(RESOLVED_JSON)
+        success, error = strategy._resolve_file_conflicts(test_file, "source", "target")
 
         assert success is True
         assert error == ""
         # Verify file was updated
         assert "def merged_function" in test_file.read_text()
 
-    def test_resolve_file_claude_returns_markers(self, tmp_path):
+    def test_resolve_file_claude_returns_markers(self, claude_stub):
         """Test that resolution fails if Claude output still has markers."""
         strategy = ConflictOnlyAIMerge()
-        test_file = tmp_path / "test.py"
-        test_file.write_text("<<<<<<< HEAD\nold\n=======\nnew\n>>>>>>> source")
+        test_file = InMemoryPath("test.py", content=CONFLICTED_CONTENT)
 
         # Mock Claude to return content with conflict markers
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": "<<<<<<< still has markers"})
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            success, error = strategy._resolve_file_conflicts(test_file, "source", "target")
+        claude_stub.set(MARKERS_JSON)
+        success, error = strategy._resolve_file_conflicts(test_file, "source", "target")
 
         assert success is False
         assert "conflict markers" in error
 
-    def test_run_claude_resolution_success(self, tmp_path):
+    def test_run_claude_resolution_success(self, tmp_path, claude_stub):
         """Test successful Claude resolution."""
         strategy = ConflictOnlyAIMerge()
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": "resolved content"})
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            content, error = strategy._run_claude_resolution("prompt", tmp_path)
+        claude_stub.set(json.dumps({"result": "resolved content"}))
+        content, error = strategy._run_claude_resolution("prompt", tmp_path)
 
         assert content == "resolved content"
         assert error is None
 
-    def test_run_claude_resolution_timeout(self, tmp_path):
-        """Test Claude resolution timeout."""
-        import subprocess
+    @pytest.mark.parametrize("failure, expected", CLAUDE_FAILURES)
+    def test_run_claude_resolution_failure(self, tmp_path, claude_stub, failure, expected):
+        """Test Claude resolution timeout, missing CLI and error exit."""
         strategy = ConflictOnlyAIMerge(timeout=10)
 
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("claude", 10)):
-            content, error = strategy._run_claude_resolution("prompt", tmp_path)
+        if failure is None:
+            claude_stub.set("", returncode=1, stderr="Error from Claude")
+        else:
+            claude_stub.fail(failure)
+        content, error = strategy._run_claude_resolution("prompt", tmp_path)
 
         assert content is None
-        assert "timed out" in error
-
-    def test_run_claude_resolution_not_found(self, tmp_path):
-        """Test Claude CLI not found."""
-        strategy = ConflictOnlyAIMerge()
-
-        with patch("subprocess.run", side_effect=FileNotFoundError()):
-            content, error = strategy._run_claude_resolution("prompt", tmp_path)
+        assert expected in error
 
-        assert content is None
-        assert "not found" in error
-
-    def test_run_claude_resolution_error(self, tmp_path):
-        """Test Claude returns error."""
-        strategy = ConflictOnlyAIMerge()
-
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Error from Claude"
-
-        with patch("subprocess.run", return_value=mock_result):
-            content, error = strategy._run_claude_resolution("prompt", tmp_path)
-
-        assert content is None
-        assert "Error from Claude" in error
-
-    def test_run_claude_resolution_strips_code_blocks(self, tmp_path):
+    def test_run_claude_resolution_strips_code_blocks(self, tmp_path, claude_stub):
         """Test that code blocks are stripped from output."""
         strategy = ConflictOnlyAIMerge()
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "```python\ndef foo():\n    pass\n```"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            content, error = strategy._run_claude_resolution("prompt", tmp_path)
+        claude_stub.set("```python\ndef foo():\n    pass\n```")
+        content, error = strategy._run_claude_resolution("prompt", tmp_path)
 
         assert content == "def foo():\n    pass"
         assert error is None
@@ -411,9 +403,8 @@ class TestFullFileAIMerge:
         assert strategy.claude_path == "/custom"
         assert strategy.timeout == 900
 
-    def test_get_file_from_branch(self, git_repo):
+    def test_get_file_from_branch(self, repo):
         """Test getting file content from branch."""
-        repo = Repo(git_repo)
         strategy = FullFileAIMerge()
 
         # Get README.md from main
@@ -421,9 +412,8 @@ class TestFullFileAIMerge:
         assert content is not None
         assert "Test Repository" in content
 
-    def test_get_file_from_branch_nonexistent(self, git_repo):
+    def test_get_file_from_branch_nonexistent(self, repo):
         """Test getting nonexistent file."""
-        repo = Repo(git_repo)
         strategy = FullFileAIMerge()
 
         content = strategy._get_file_from_branch(repo, "main", "nonexistent.txt")
@@ -461,64 +451,48 @@ class TestFullFileAIMerge:
         assert success is True
         assert test_file.read_text() == "# Target content"
 
-    def test_regenerate_file_both_versions(self, tmp_path):
+    def test_regenerate_file_both_versions(self, tmp_path, claude_stub):
         """Test regenerating file with both versions using mocked Claude."""
         strategy = FullFileAIMerge()
         test_file = tmp_path / "merged.py"
 
         merged_content = "# Merged content from both branches"
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": merged_content})
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            success, error = strategy._regenerate_file(
-                test_file, "merged.py",
-                source_content="# Source",
-                target_content="# Target",
-                source_branch="source",
-                target_branch="target"
-            )
+        claude_stub.set(json.dumps({"result": merged_content}))
+        success, error = strategy._regenerate_file(
+            test_file, "merged.py",
+            source_content="# Source",
+            target_content="# Target",
+            source_branch="source",
+            target_branch="target"
+        )
 
         assert success is True
         assert test_file.read_text() == merged_content
 
-    def test_run_claude_regeneration_timeout(self, tmp_path):
-        """Test Claude regeneration timeout."""
-        import subprocess
+    @pytest.mark.parametrize("failure, expected", CLAUDE_FAILURES)
+    def test_run_claude_regeneration_failure(self, tmp_path, claude_stub, failure, expected):
+        """Test Claude regeneration timeout, missing CLI and error exit."""
         strategy = FullFileAIMerge(timeout=10)
 
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("claude", 10)):
-            content, error = strategy._run_claude_regeneration("prompt", tmp_path)
+        if failure is None:
+            claude_stub.set("", returncode=1, stderr="Error from Claude")
+        else:
+            claude_stub.fail(failure)
+        content, error = strategy._run_claude_regeneration("prompt", tmp_path)
 
         assert content is None
-        assert "timed out" in error
-
-    def test_run_claude_regeneration_not_found(self, tmp_path):
-        """Test Claude CLI not found for regeneration."""
-        strategy = FullFileAIMerge()
-
-        with patch("subprocess.run", side_effect=FileNotFoundError()):
-            content, error = strategy._run_claude_regeneration("prompt", tmp_path)
-
-        assert content is None
-        assert "not found" in error
+        assert expected in error
 
 
 class TestGitAutoMerge:
     """Additional tests for GitAutoMerge strategy."""
 
-    def test_merge_invalid_target_branch(self, git_repo):
+    def test_merge_invalid_target_branch(self, repo):
         """Test merge with invalid target branch."""
-        repo = Repo(git_repo)
-
         # Create a source branch
         repo.git.checkout("-b", "task/source")
-        (git_repo / "source.txt").write_text("source")
-        repo.index.add(["source.txt"])
-        repo.index.commit("Source commit")
+        _commit_files(repo, {"source.txt": "source"}, "Source commit")
 
         strategy = GitAutoMerge()
         success, message = strategy.merge(repo, "task/source", "nonexistent-target")
@@ -540,13 +514,14 @@ class TestMergeOrchestrator:
 
         assert orchestrator.claude_path == "/custom/claude"
         assert orchestrator.timeout == 600
-
-    def test_merge_status_with_no_merge_in_progress(self, orchestrator):
-        """Test merge status when no merge is in progress."""
-        status = orchestrator.get_merge_status()
-
-        assert status["in_progress"] is False
-        assert "current_branch" in status
+        assert orchestrator.strategies[1][1].claude_path == "/custom/claude"
+        assert orchestrator.strategies[2][1].timeout == 600
+
+    def test_strategies_shared_between_orchestrators(self, git_repo, readonly_orchestrator):
+        """Test orchestrators with the same settings reuse one set of strategies."""
+        shared = readonly_orchestrator.strategies
+        assert MergeOrchestrator(git_repo).strategies is shared
+        assert MergeOrchestrator(git_repo, timeout=10).strategies is not shared
 
     def test_get_merge_status_error_handling(self, tmp_path):
         """Test merge status error handling with invalid repo."""
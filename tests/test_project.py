@@ -67,10 +67,10 @@ class TestProject:
 
         project.close()
 
-    def test_load_project(self, temp_project):
+    def test_load_project(self, temp_dir):
         """Test loading an existing project."""
-        root = temp_project.root
-        temp_project.close()
+        root = temp_dir
+        Project.init(root).close()
 
         loaded = Project.load(root / ".claudecraft" / "config.yaml")
         assert loaded.root == root
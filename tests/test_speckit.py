@@ -7,18 +7,22 @@ import pytest
 from claudecraft.speckit.wrapper import SpecKitWrapper
 
 
+@pytest.fixture(scope="module")
+def wrapper():
+    """Share one wrapper, which looks up the specify CLI on PATH only once."""
+    return SpecKitWrapper()
+
+
 class TestSpecKitWrapper:
     """Tests for SpecKitWrapper class."""
 
-    def test_is_available(self):
+    def test_is_available(self, wrapper):
         """Test checking if SpecKit is available."""
-        wrapper = SpecKitWrapper()
         # Should return boolean regardless of actual availability
         assert isinstance(wrapper.is_available(), bool)
 
-    def test_clarify_fallback(self):
+    def test_clarify_fallback(self, wrapper):
         """Test clarify with fallback implementation."""
-        wrapper = SpecKitWrapper()
         context = "Build a user authentication system with JWT tokens"
 
         result = wrapper.clarify(context)
@@ -27,9 +31,8 @@ class TestSpecKitWrapper:
         assert len(result) > 0
         assert "Clarifying Questions" in result
 
-    def test_clarify_with_output_path(self, temp_dir):
+    def test_clarify_with_output_path(self, wrapper, temp_dir):
         """Test clarify saves to output path."""
-        wrapper = SpecKitWrapper()
         context = "Build a user authentication system"
         output_path = temp_dir / "questions.md"
 
@@ -38,9 +41,8 @@ class TestSpecKitWrapper:
         assert output_path.exists()
         assert output_path.read_text() == result
 
-    def test_specify_fallback(self):
+    def test_specify_fallback(self, wrapper):
         """Test specify with fallback implementation."""
-        wrapper = SpecKitWrapper()
         requirements = "As a user, I want to login with email and password"
 
         result = wrapper.specify(requirements)
@@ -49,9 +51,8 @@ class TestSpecKitWrapper:
         assert len(result) > 0
         assert "Functional Specification" in result
 
-    def test_specify_with_clarifications(self):
+    def test_specify_with_clarifications(self, wrapper):
         """Test specify with clarifications."""
-        wrapper = SpecKitWrapper()
         requirements = "Build an API"
         clarifications = "1. REST API\n2. JSON format\n3. OAuth authentication"
 
@@ -60,9 +61,8 @@ class TestSpecKitWrapper:
         assert isinstance(result, str)
         assert "clarifications" in result.lower()
 
-    def test_specify_with_output_path(self, temp_dir):
+    def test_specify_with_output_path(self, wrapper, temp_dir):
         """Test specify saves to output path."""
-        wrapper = SpecKitWrapper()
         requirements = "Build an API"
         output_path = temp_dir / "spec.md"
 
@@ -71,9 +71,8 @@ class TestSpecKitWrapper:
         assert output_path.exists()
         assert output_path.read_text() == result
 
-    def test_plan_fallback(self):
+    def test_plan_fallback(self, wrapper):
         """Test plan with fallback implementation."""
-        wrapper = SpecKitWrapper()
         specification = "Build a REST API with user authentication"
 
         result = wrapper.plan(specification)
@@ -82,9 +81,8 @@ class TestSpecKitWrapper:
         assert len(result) > 0
         assert "Technical Implementation Plan" in result
 
-    def test_tasks_fallback(self):
+    def test_tasks_fallback(self, wrapper):
         """Test tasks with fallback implementation."""
-        wrapper = SpecKitWrapper()
         plan = "Use Python with FastAPI framework. Implement JWT authentication."
 
         result = wrapper.tasks(plan)
@@ -94,9 +92,8 @@ class TestSpecKitWrapper:
         assert "Task Breakdown" in result
         assert "task-001" in result
 
-    def test_extract_overview(self):
+    def test_extract_overview(self, wrapper):
         """Test overview extraction."""
-        wrapper = SpecKitWrapper()
         requirements = """
 # User Authentication System
 
@@ -111,9 +108,8 @@ Features:
         overview = wrapper._extract_overview(requirements)
         assert "User Authentication System" in overview
 
-    def test_extract_requirements(self):
+    def test_extract_requirements(self, wrapper):
         """Test requirements extraction."""
-        wrapper = SpecKitWrapper()
         requirements = """
 # Requirements
 
@@ -126,9 +122,8 @@ Features:
         assert "User can login" in reqs
         assert "User can reset" in reqs
 
-    def test_generate_acceptance_criteria(self):
+    def test_generate_acceptance_criteria(self, wrapper):
         """Test acceptance criteria generation."""
-        wrapper = SpecKitWrapper()
         requirements = "Some requirements"
 
         criteria = wrapper._generate_acceptance_criteria(requirements)
@@ -1,5 +1,8 @@
 """Tests for JSONL synchronization."""
 
+import os
+import subprocess
+import sys
 from datetime import datetime
 
 import pytest
@@ -7,31 +10,68 @@ import pytest
 from claudecraft.core.database import Database, Spec, SpecStatus, Task, TaskStatus
 from claudecraft.core.sync import ChangeRecord, ChangeType, JsonlSync, SyncedDatabase
 
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Records, re-imports and re-exports a non-ASCII spec title in a fresh interpreter
+NON_ASCII_ROUNDTRIP = """
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from claudecraft.core.database import Database, Spec, SpecStatus
+from claudecraft.core.sync import JsonlSync, SyncedDatabase
+
+jsonl_path = Path(sys.argv[1])
+now = datetime(2024, 1, 1, 12, 0, 0)
+title = "Caf\\u00e9 \\u2192 r\\u00e9sum\\u00e9"
+
+db = SyncedDatabase(":memory:", jsonl_path)
+db.init_schema()
+db.create_spec(
+    Spec(
+        id="spec-001",
+        title=title,
+        status=SpecStatus.DRAFT,
+        source_type=None,
+        created_at=now,
+        updated_at=now,
+        metadata={},
+    )
+)
+
+fresh = Database(":memory:")
+fresh.init_schema()
+sync = JsonlSync(fresh, jsonl_path)
+sync.import_changes()
+sync.export_all()
+assert fresh.get_spec("spec-001").title == title
+assert sync.get_changes_since(now)[0].data["title"] == title
+"""
+
 
 class TestChangeRecord:
     """Tests for ChangeRecord class."""
 
-    def test_to_jsonl(self):
-        """Test converting to JSONL."""
-        now = datetime.now()
+    def test_to_jsonl(self, json_encoder):
+        """Test converting to JSONL gives the same line with either encoder."""
         record = ChangeRecord(
-            timestamp=now,
+            timestamp=NOW,
             entity_type="spec",
             entity_id="spec-001",
             change_type=ChangeType.CREATE,
-            data={"title": "Test"},
+            data={"title": "Café", "tags": []},
         )
 
-        line = record.to_jsonl()
-        assert "spec-001" in line
-        assert '"change_type": "create"' in line
-        assert '"entity_type": "spec"' in line
+        assert record.to_jsonl() == (
+            '{"timestamp":"2024-01-01T12:00:00","entity_type":"spec",'
+            '"entity_id":"spec-001","change_type":"create",'
+            '"data":{"title":"Café","tags":[]}}'
+        )
 
     def test_from_jsonl(self):
         """Test parsing from JSONL."""
-        now = datetime.now()
         line = (
-            '{"timestamp": "' + now.isoformat() + '", '
+            '{"timestamp": "' + NOW.isoformat() + '", '
             '"entity_type": "task", "entity_id": "task-001", '
             '"change_type": "update", "data": {"status": "completed"}}'
         )
@@ -44,9 +84,8 @@ class TestChangeRecord:
 
     def test_roundtrip(self):
         """Test roundtrip serialization."""
-        now = datetime.now()
         original = ChangeRecord(
-            timestamp=now,
+            timestamp=NOW,
             entity_type="spec",
             entity_id="spec-001",
             change_type=ChangeType.DELETE,
@@ -75,18 +114,33 @@ class TestJsonlSync:
         assert "spec-001" in content
         assert "create" in content
 
+    def test_record_changes(self, temp_dir, temp_db):
+        """Test recording several changes with one append."""
+        jsonl_path = temp_dir / "changes.jsonl"
+        sync = JsonlSync(temp_db, jsonl_path)
+
+        sync.record_changes("task", ChangeType.CREATE, [])
+        assert jsonl_path.read_text() == ""
+
+        sync.record_changes(
+            "task", ChangeType.CREATE, [("task-001", {"title": "A"}), ("task-002", None)]
+        )
+
+        records = [ChangeRecord.from_jsonl(line) for line in jsonl_path.read_text().splitlines()]
+        assert [r.entity_id for r in records] == ["task-001", "task-002"]
+        assert all(r.change_type == ChangeType.CREATE for r in records)
+        assert records[1].data is None
+
     def test_export_all(self, temp_dir, temp_db):
         """Test exporting all data."""
-        now = datetime.now()
-
         # Create some data
         spec = Spec(
             id="spec-001",
             title="Test Spec",
             status=SpecStatus.DRAFT,
             source_type=None,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={},
         )
         temp_db.create_spec(spec)
@@ -102,8 +156,8 @@ class TestJsonlSync:
             assignee=None,
             worktree=None,
             iteration=0,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={},
         )
         temp_db.create_task(task)
@@ -116,15 +170,13 @@ class TestJsonlSync:
         assert "spec-001" in content
         assert "task-001" in content
 
-    def test_import_changes(self, temp_dir):
+    def test_import_changes(self, temp_dir, apply_schema):
         """Test importing changes."""
-        now = datetime.now()
-
         # Create JSONL with changes
         jsonl_path = temp_dir / "import.jsonl"
         records = [
             ChangeRecord(
-                timestamp=now,
+                timestamp=NOW,
                 entity_type="spec",
                 entity_id="spec-001",
                 change_type=ChangeType.CREATE,
@@ -133,8 +185,8 @@ class TestJsonlSync:
                     "title": "Imported Spec",
                     "status": "draft",
                     "source_type": None,
-                    "created_at": now.isoformat(),
-                    "updated_at": now.isoformat(),
+                    "created_at": NOW.isoformat(),
+                    "updated_at": NOW.isoformat(),
                     "metadata": {},
                 },
             ),
@@ -147,7 +199,7 @@ class TestJsonlSync:
         # Create fresh database and import
         db_path = temp_dir / "import.db"
         db = Database(db_path)
-        db.init_schema()
+        apply_schema(db)
 
         sync = JsonlSync(db, jsonl_path)
         sync.import_changes()
@@ -159,18 +211,60 @@ class TestJsonlSync:
 
         db.close()
 
+    def test_import_changes_updates_existing_and_creates_new(self, temp_dir, temp_db):
+        """Test one import both updates existing specs and creates missing ones."""
+        existing = Spec(
+            id="spec-001",
+            title="Old title",
+            status=SpecStatus.DRAFT,
+            source_type=None,
+            created_at=NOW,
+            updated_at=NOW,
+            metadata={},
+        )
+        temp_db.create_spec(existing)
+        updated = existing.to_dict() | {"title": "New title"}
+        created = existing.to_dict() | {"id": "spec-002", "title": "Second"}
+
+        sync = JsonlSync(temp_db, temp_dir / "import.jsonl")
+        sync.record_changes("spec", ChangeType.UPDATE, [("spec-001", updated)])
+        sync.record_changes("spec", ChangeType.CREATE, [("spec-002", created)])
+        sync.import_changes()
+
+        assert temp_db.get_spec("spec-001").title == "New title"
+        assert temp_db.get_spec("spec-002").title == "Second"
+
+    def test_non_ascii_log_under_ascii_locale(self, temp_dir):
+        """Test the UTF-8 log round-trips when the locale's default encoding is ASCII."""
+        env = {
+            **os.environ,
+            "LC_ALL": "C",
+            "LANG": "C",
+            "PYTHONUTF8": "0",
+            "PYTHONCOERCECLOCALE": "0",
+        }
+        jsonl_path = temp_dir / "specs.jsonl"
+
+        result = subprocess.run(
+            [sys.executable, "-c", NON_ASCII_ROUNDTRIP, str(jsonl_path)],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "Café → résumé".encode() in jsonl_path.read_bytes()
+
     def test_compact(self, temp_dir, temp_db):
         """Test compaction removes superseded changes."""
-        now = datetime.now()
-
         # Create spec
         spec = Spec(
             id="spec-001",
             title="Original",
             status=SpecStatus.DRAFT,
             source_type=None,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={},
         )
         temp_db.create_spec(spec)
@@ -199,27 +293,28 @@ class TestJsonlSync:
         # Should have 1 line after compaction
         lines_after = len(jsonl_path.read_text().strip().split("\n"))
         assert lines_after == 1
+        assert "Final" in jsonl_path.read_text()
+        assert not jsonl_path.with_name("compact.jsonl.tmp").exists()
 
 
 class TestSyncedDatabase:
     """Tests for SyncedDatabase class."""
 
-    def test_auto_sync_on_create(self, temp_dir):
+    def test_auto_sync_on_create(self, temp_dir, apply_schema):
         """Test automatic sync on spec creation."""
         db_path = temp_dir / "synced.db"
         jsonl_path = temp_dir / "synced.jsonl"
 
         db = SyncedDatabase(db_path, jsonl_path)
-        db.init_schema()
+        apply_schema(db)
 
-        now = datetime.now()
         spec = Spec(
             id="spec-001",
             title="Auto Synced",
             status=SpecStatus.DRAFT,
             source_type=None,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={},
         )
 
@@ -231,22 +326,40 @@ class TestSyncedDatabase:
 
         db.close()
 
-    def test_auto_sync_on_update(self, temp_dir):
+    def test_auto_sync_on_create_bulk(self, temp_dir, make_spec, make_task, apply_schema):
+        """Test that bulk spec and task creation records a change per record."""
+        jsonl_path = temp_dir / "synced.jsonl"
+        db = SyncedDatabase(temp_dir / "synced.db", jsonl_path)
+        apply_schema(db)
+        db.create_specs_bulk([make_spec(id="spec-001"), make_spec(id="spec-002")])
+        db.create_tasks_bulk([make_task(id="task-001"), make_task(id="task-002")])
+
+        changes = [ChangeRecord.from_jsonl(line) for line in jsonl_path.read_text().splitlines()]
+        assert [(c.entity_type, c.entity_id) for c in changes] == [
+            ("spec", "spec-001"),
+            ("spec", "spec-002"),
+            ("task", "task-001"),
+            ("task", "task-002"),
+        ]
+        assert all(c.change_type == ChangeType.CREATE for c in changes)
+
+        db.close()
+
+    def test_auto_sync_on_update(self, temp_dir, apply_schema):
         """Test automatic sync on spec update."""
         db_path = temp_dir / "synced.db"
         jsonl_path = temp_dir / "synced.jsonl"
 
         db = SyncedDatabase(db_path, jsonl_path)
-        db.init_schema()
+        apply_schema(db)
 
-        now = datetime.now()
         spec = Spec(
             id="spec-001",
             title="Original",
             status=SpecStatus.DRAFT,
             source_type=None,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={},
         )
 
@@ -261,22 +374,21 @@ class TestSyncedDatabase:
 
         db.close()
 
-    def test_auto_sync_on_delete(self, temp_dir):
+    def test_auto_sync_on_delete(self, temp_dir, apply_schema):
         """Test automatic sync on spec deletion."""
         db_path = temp_dir / "synced.db"
         jsonl_path = temp_dir / "synced.jsonl"
 
         db = SyncedDatabase(db_path, jsonl_path)
-        db.init_schema()
+        apply_schema(db)
 
-        now = datetime.now()
         spec = Spec(
             id="spec-001",
             title="To Delete",
             status=SpecStatus.DRAFT,
             source_type=None,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={},
         )
 
@@ -288,15 +400,13 @@ class TestSyncedDatabase:
 
         db.close()
 
-    def test_auto_sync_on_update_task_status(self, temp_dir):
+    def test_auto_sync_on_update_task_status(self, temp_dir, apply_schema):
         """Test automatic sync on task status update."""
         db_path = temp_dir / "synced.db"
         jsonl_path = temp_dir / "synced.jsonl"
 
         db = SyncedDatabase(db_path, jsonl_path)
-        db.init_schema()
-
-        now = datetime.now()
+        apply_schema(db)
 
         # Create spec first
         spec = Spec(
@@ -304,8 +414,8 @@ class TestSyncedDatabase:
             title="Test Spec",
             status=SpecStatus.DRAFT,
             source_type=None,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={},
         )
         db.create_spec(spec)
@@ -322,8 +432,8 @@ class TestSyncedDatabase:
             assignee=None,
             worktree=None,
             iteration=0,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={},
         )
         db.create_task(task)
@@ -343,15 +453,13 @@ class TestSyncedDatabase:
 
         db.close()
 
-    def test_task_sync_roundtrip(self, temp_dir):
+    def test_task_sync_roundtrip(self, temp_dir, apply_schema):
         """Test task creation, update, and import roundtrip."""
         db_path = temp_dir / "synced.db"
         jsonl_path = temp_dir / "synced.jsonl"
 
         db = SyncedDatabase(db_path, jsonl_path)
-        db.init_schema()
-
-        now = datetime.now()
+        apply_schema(db)
 
         # Create spec and task
         spec = Spec(
@@ -359,8 +467,8 @@ class TestSyncedDatabase:
             title="Test Spec",
             status=SpecStatus.DRAFT,
             source_type=None,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={},
         )
         db.create_spec(spec)
@@ -376,8 +484,8 @@ class TestSyncedDatabase:
             assignee=None,
             worktree=None,
             iteration=0,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
             metadata={"key": "value"},
         )
         db.create_task(task)
@@ -392,7 +500,7 @@ class TestSyncedDatabase:
         # Create new database and import
         db_path2 = temp_dir / "synced2.db"
         db2 = Database(db_path2)
-        db2.init_schema()
+        apply_schema(db2)
 
         sync = JsonlSync(db2, jsonl_path)
         sync.import_changes()
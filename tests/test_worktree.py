@@ -1,5 +1,6 @@
 """Tests for worktree management."""
 
+import shutil
 import pytest
 from pathlib import Path
 from git import Repo
@@ -7,21 +8,36 @@ from git import Repo
 from claudecraft.orchestration.worktree import WorktreeManager
 
 
-@pytest.fixture
-def git_repo(tmp_path):
-    """Create a test git repository."""
-    repo_path = tmp_path / "test_repo"
-    repo_path.mkdir()
+@pytest.fixture(scope="module")
+def git_repo_template(tmp_path_factory):
+    """Create a git repository with an initial commit once for git_repo to copy."""
+    repo_path = tmp_path_factory.mktemp("git-repo-template")
 
     # Initialize git repo
     repo = Repo.init(repo_path)
 
+    # Keep background maintenance out of short-lived test repositories
+    with repo.config_writer() as config:
+        config.set_value("gc", "auto", "0")
+        config.set_value("gc", "autoDetach", "false")
+        config.set_value("core", "fsmonitor", "false")
+        config.set_value("core", "preloadIndex", "false")
+
     # Create initial commit
     test_file = repo_path / "README.md"
     test_file.write_text("# Test Repository")
     repo.index.add([str(test_file)])
     repo.index.commit("Initial commit")
 
+    repo.close()
+    return repo_path
+
+
+@pytest.fixture
+def git_repo(git_repo_template, tmp_path):
+    """Create a test git repository from a copy of the template."""
+    repo_path = tmp_path / "test_repo"
+    shutil.copytree(git_repo_template, repo_path)
     return repo_path
 
 